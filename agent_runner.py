@@ -43,6 +43,7 @@ import json
 import logging
 import os
 import sys
+import threading
 import time
 
 # Add project root to path so bot package is importable
@@ -61,6 +62,7 @@ logging.basicConfig(
 logger = logging.getLogger('clawquake.runner')
 
 RELOAD_CHECK_SECONDS = 5  # Check strategy file for changes every N seconds
+ACTION_POLL_TIMEOUT = 5  # Seconds each external-action long-poll waits server-side
 
 
 class TelemetryStreamer:
@@ -186,6 +188,69 @@ def _format_external_action(act_name: str, params: dict | None) -> str | None:
     return lower
 
 
+def _run_in_daemon_thread(fn):
+    """Run blocking fn on a daemon thread and return a future for its result.
+
+    Unlike run_in_executor, asyncio.run() does not join the thread at
+    shutdown, so cancelling the awaiting task lets the runner exit while
+    an HTTP call is still in flight.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def deliver(setter, value):
+        def _set():
+            if not future.done():
+                setter(value)
+        try:
+            loop.call_soon_threadsafe(_set)
+        except RuntimeError:
+            pass  # loop already closed; nobody is waiting
+
+    def target():
+        try:
+            result = fn()
+        except Exception as e:
+            deliver(future.set_exception, e)
+        else:
+            deliver(future.set_result, result)
+
+    threading.Thread(target=target, name="action-poll", daemon=True).start()
+    return future
+
+
+async def _poll_external_actions(args, agent):
+    """Long-poll the orchestrator for queued external AI actions and apply them."""
+    import urllib.request
+
+    url = f"{args.orchestrator_url}/api/agent/internal/actions/{args.bot_id}?timeout={ACTION_POLL_TIMEOUT}"
+
+    def do_poll():
+        req = urllib.request.Request(url, headers={'X-Internal-Secret': args.internal_secret})
+        with urllib.request.urlopen(req, timeout=ACTION_POLL_TIMEOUT + 2) as f:
+            return json.loads(f.read().decode('utf-8'))
+
+    while True:
+        try:
+            resp = await _run_in_daemon_thread(do_poll)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug("Action poll error: %s", e)
+            await asyncio.sleep(1)
+            continue
+
+        # Apply incoming macro actions from external AI using the
+        # same action parser as strategy actions.
+        for act_def in resp.get("actions", []):
+            formatted = _format_external_action(
+                act_def.get("action"),
+                act_def.get("params", {}),
+            )
+            if formatted:
+                agent.send_actions([formatted])
+
+
 class MatchTracker:
     """Tracks kills, deaths, and match events during a session."""
 
@@ -383,6 +448,12 @@ async def run(args):
     await agent.connect()
     task = await agent.run_background()
 
+    # Long-poll the orchestrator for external AI actions on the I/O side so
+    # the game tick never waits on an HTTP round-trip.
+    action_poll_task = None
+    if args.orchestrator_url and args.bot_id and args.internal_secret:
+        action_poll_task = asyncio.create_task(_poll_external_actions(args, agent))
+
     try:
         end_time = time.time() + args.duration if args.duration > 0 else float('inf')
         while time.time() < end_time:
@@ -392,7 +463,7 @@ async def run(args):
             if args.orchestrator_url and args.bot_id and args.internal_secret:
                 try:
                     s = agent.bot.game.to_dict()
-                    # Reformat to match ai_agent_interface AgentState schema
+                    # Reformat to the runner state shape ai_agent_interface stores
                     state_payload = {
                         "tick": tracker.ticks,
                         "position": s.get("my_position"),
@@ -405,28 +476,18 @@ async def run(args):
                     
                     payload = {"bot_id": args.bot_id, "state": state_payload}
                     
-                    def do_sync():
+                    def do_push():
                         import urllib.request
                         req = urllib.request.Request(
-                            f"{args.orchestrator_url}/api/agent/internal/sync",
+                            f"{args.orchestrator_url}/api/agent/internal/state",
                             data=json.dumps(payload).encode('utf-8'),
                             headers={'Content-Type': 'application/json', 'X-Internal-Secret': args.internal_secret},
                             method='POST'
                         )
                         with urllib.request.urlopen(req, timeout=1.0) as f:
-                            return json.loads(f.read().decode('utf-8'))
+                            f.read()
 
-                    resp = await asyncio.get_running_loop().run_in_executor(None, do_sync)
-                    
-                    # Apply incoming macro actions from external AI using the
-                    # same action parser as strategy actions.
-                    for act_def in resp.get("actions", []):
-                        formatted = _format_external_action(
-                            act_def.get("action"),
-                            act_def.get("params", {}),
-                        )
-                        if formatted:
-                            agent.send_actions([formatted])
+                    await asyncio.get_running_loop().run_in_executor(None, do_push)
                 except Exception as e:
                     logger.debug(f"Telemetry sync loop error: {e}")
 
@@ -447,6 +508,8 @@ async def run(args):
         except Exception:
             pass
         task.cancel()
+        if action_poll_task:
+            action_poll_task.cancel()
 
         if telemetry:
             await telemetry.close()
@@ -11,7 +11,6 @@ Designed to be controlled by an OpenClaw AI agent plugin.
 """
 
 import asyncio
-import math
 import logging
 import random
 import re
@@ -21,6 +20,7 @@ from .client import Q3Client
 from .defs import weapon_t
 from .kill_tracker import KillTracker
 from .game_intelligence import SpatialAwareness, ItemClassifier, CombatAnalyzer
+from .strategy_math import aim_angles, distance, nearest_index, origin_columns
 
 logger = logging.getLogger('clawquake.bot')
 
@@ -137,11 +137,7 @@ class GameView:
 
     def distance_to(self, target_pos):
         """Calculate distance from me to a target position."""
-        my = self.my_position
-        dx = target_pos[0] - my[0]
-        dy = target_pos[1] - my[1]
-        dz = target_pos[2] - my[2]
-        return math.sqrt(dx*dx + dy*dy + dz*dz)
+        return distance(self.my_position, target_pos)
 
     def suggest_weapon(self, target_dist):
         """Recommend best weapon for a given distance."""
@@ -170,32 +166,28 @@ class GameView:
 
     def angle_to(self, target_pos):
         """Calculate yaw angle from me to a target position."""
-        my = self.my_position
-        dx = target_pos[0] - my[0]
-        dy = target_pos[1] - my[1]
-        return math.degrees(math.atan2(dy, dx))
+        return aim_angles(self.my_position, target_pos)[1]
 
     def nearest_player(self):
         """Find the nearest visible player. Returns player dict or None."""
         players = self.players
         if not players:
             return None
-        return min(players, key=lambda p: self.distance_to(p['position']))
+        idx = nearest_index(origin_columns([p['position'] for p in players]), self.my_position)
+        return players[idx]
 
     def to_dict(self):
         """Export game state as a JSON-serializable dict for AI consumption."""
         players = self.players
+        my_pos = self.my_position
         nearest = None
         nearest_dist = float('inf')
         if players:
-            for p in players:
-                d = self.distance_to(p['position'])
-                if d < nearest_dist:
-                    nearest_dist = d
-                    nearest = p
+            nearest = players[nearest_index(origin_columns([p['position'] for p in players]), my_pos)]
+            nearest_dist = distance(my_pos, nearest['position'])
 
         state = {
-            'my_position': list(self.my_position),
+            'my_position': list(my_pos),
             'my_velocity': list(self.my_velocity),
             'my_viewangles': list(self.my_viewangles),
             'my_weapon': self.my_weapon_name,
@@ -325,15 +317,7 @@ class ClawBot:
 
     def aim_at(self, target_pos):
         """Aim view at a world-space target position (x, y, z)."""
-        my = self.game.my_position
-        dx = target_pos[0] - my[0]
-        dy = target_pos[1] - my[1]
-        dz = target_pos[2] - my[2]
-
-        yaw = math.degrees(math.atan2(dy, dx))
-        dist_xy = math.sqrt(dx * dx + dy * dy)
-        pitch = -math.degrees(math.atan2(dz, max(dist_xy, 1e-6)))
-
+        pitch, yaw = aim_angles(self.game.my_position, target_pos)
         self.look(pitch=pitch, yaw=yaw)
 
     def use_weapon(self, weapon_num):
@@ -20,18 +20,29 @@ Each agent gets a strategy file (e.g. strategies/samclaw.py) that defines:
             actions.append("attack")
         return actions
 
-The StrategyLoader uses exec() to load strategy files into a fresh namespace,
-enabling hot-reload without stale module cache issues.
+The StrategyLoader exec()s strategy files into a private module (never
+sys.modules), enabling hot-reload without stale module cache issues. When a
+reload leaves the file's import statements unchanged, only the rest of the
+body is re-executed so heavy imports (numpy, torch, ...) are not re-run.
 """
 
+import ast
+import heapq
+import itertools
 import os
 import time
+import types
 import logging
-import traceback
 import asyncio
+from collections import deque
 
 logger = logging.getLogger('clawquake.strategy')
 
+TICK_DEADLINE = 0.045  # seconds; stays under the 50ms (20Hz) tick budget
+TICK_STATS_WINDOW = 200  # recent tick durations kept for the p99 estimate
+DEAD_TICK_INTERVAL = 5  # frames between ticks while the bot is dead (4Hz at 20Hz)
+ERROR_LOG_INTERVAL = 5.0  # seconds between log lines for the same repeated tick error
+
 
 class StrategyContext:
     """Mutable bag of state that persists across ticks within a match.
@@ -46,7 +57,7 @@ class StrategyContext:
 
     _RESERVED = frozenset({
         'load_time', 'tick_count', 'strategy_name', 'strategy_version',
-        '_data', '_RESERVED',
+        'tick_p99_ms', 'tick_timeouts', '_data', '_RESERVED',
     })
 
     def __init__(self):
@@ -55,6 +66,9 @@ class StrategyContext:
         self.tick_count = 0
         self.strategy_name = "unnamed"
         self.strategy_version = "0"
+        self.tick_p99_ms = 0.0
+        self.tick_timeouts = 0
+        self._sleep_frames = 0
 
     def get(self, key, default=None):
         return self._data.get(key, default)
@@ -75,6 +89,15 @@ class StrategyContext:
         self._data.clear()
         self.tick_count = 0
 
+    def sleep_ticks(self, n):
+        """Skip the next n frames; tick() is not called again until they pass.
+
+        Useful for strategies that are only observing or waiting:
+            ctx.sleep_ticks(10)   # wake again in ~0.5s at 20Hz
+            return []
+        """
+        self._sleep_frames = max(0, int(n))
+
 
 class StrategyLoader:
     """Loads and hot-reloads strategy files via exec().
@@ -88,11 +111,20 @@ class StrategyLoader:
             print("Strategy updated!")
     """
 
-    def __init__(self, strategy_path):
+    def __init__(self, strategy_path, tick_deadline=TICK_DEADLINE):
         self.path = os.path.abspath(strategy_path)
+        self.tick_deadline = tick_deadline
+        self._tick_times = deque(maxlen=TICK_STATS_WINDOW)
+        self._inflight = None  # executor future of a sync tick that overran
+        self._error_log = {}  # repr(exc) -> [last_logged, suppressed_count]
+        self._module = None
         self._namespace = {}
+        self._import_key = None
+        self._import_names = frozenset()
         self._mtime = 0
         self._ctx = StrategyContext()
+        self._frame = 0
+        self.next_frame = 0  # first frame at which tick() runs the strategy again
         self._load()
 
     def _load(self):
@@ -100,8 +132,44 @@ class StrategyLoader:
         with open(self.path, 'r') as f:
             code = f.read()
 
-        ns = {'__builtins__': __builtins__}
-        exec(compile(code, self.path, 'exec'), ns)
+        tree = ast.parse(code, self.path)
+        imports = [n for n in tree.body if isinstance(n, (ast.Import, ast.ImportFrom))]
+        import_key = tuple(ast.dump(n) for n in imports)
+        # __future__ flags and star imports can't be carried over a partial re-exec
+        full_reload = any(
+            isinstance(n, ast.ImportFrom)
+            and (n.module == '__future__' or any(a.name == '*' for a in n.names))
+            for n in imports
+        )
+
+        module = types.ModuleType(os.path.splitext(os.path.basename(self.path))[0])
+        module.__file__ = self.path
+        module.__builtins__ = __builtins__
+        partial = self._module is not None and import_key == self._import_key and not full_reload
+        if partial:
+            # Imports unchanged: carry the imported names over and re-run
+            # only the non-import statements.
+            old_ns = self._module.__dict__
+            module.__dict__.update(
+                (name, old_ns[name]) for name in self._import_names if name in old_ns
+            )
+            body = ast.Module(
+                body=[n for n in tree.body if not isinstance(n, (ast.Import, ast.ImportFrom))],
+                type_ignores=[],
+            )
+            exec(compile(body, self.path, 'exec'), module.__dict__)
+        else:
+            exec(compile(tree, self.path, 'exec'), module.__dict__)
+            self._import_key = import_key
+            self._import_names = frozenset(
+                (alias.asname or alias.name).split('.')[0]
+                for n in imports for alias in n.names
+            )
+        # Swapped in only after the body ran cleanly: a reload that raises
+        # leaves the running strategy untouched.
+        self._module = module
+        ns = module.__dict__
+
         self._namespace = ns
         self._mtime = os.path.getmtime(self.path)
 
@@ -117,7 +185,7 @@ class StrategyLoader:
             try:
                 on_spawn(self._ctx)
             except Exception as e:
-                logger.error(f"on_spawn error: {e}\n{traceback.format_exc()}")
+                logger.error("on_spawn error: %s", e, exc_info=True)
 
         logger.info(f"Strategy loaded: {self._ctx.strategy_name} "
                      f"v{self._ctx.strategy_version} from {self.path}")
@@ -134,25 +202,106 @@ class StrategyLoader:
             pass
         return False
 
-    async def tick(self, bot, game):
-        """Call the strategy's tick function. Returns list of action strings."""
+    async def tick(self, bot, game, frame=None):
+        """Call the strategy's tick function. Returns list of action strings.
+
+        ``frame`` is the caller's frame number (StrategyScheduler passes its
+        own); without it the loader counts calls. Frames before
+        ``next_frame`` are skipped: strategies push it forward with
+        ``ctx.sleep_ticks(n)``, and dead bots only tick every
+        DEAD_TICK_INTERVAL frames.
+
+        Each call gets ``tick_deadline`` seconds. Async tick functions are
+        cancelled when they overrun; sync ones run on a worker thread so they
+        can't stall the event loop, and further ticks are skipped until an
+        overrunning thread finishes. Either way the tick yields no actions.
+        """
+        if frame is None:
+            self._frame += 1
+            frame = self._frame
+        if frame < self.next_frame:
+            return []
+
         tick_fn = self._namespace.get('tick')
         if not tick_fn:
             return []
+        if self._inflight is not None:
+            if not self._inflight.done():
+                return []
+            if not self._inflight.cancelled():
+                self._inflight.exception()  # mark any late error as retrieved
+            self._inflight = None
 
         self._ctx.tick_count += 1
+        start = time.perf_counter()
 
         try:
-            result = tick_fn(bot, game, self._ctx)
             # Support both sync and async tick functions
-            if asyncio.iscoroutine(result):
-                result = await result
+            if asyncio.iscoroutinefunction(tick_fn):
+                result = await asyncio.wait_for(
+                    tick_fn(bot, game, self._ctx), self.tick_deadline)
+            else:
+                future = asyncio.get_running_loop().run_in_executor(
+                    None, tick_fn, bot, game, self._ctx)
+                try:
+                    result = await asyncio.wait_for(
+                        asyncio.shield(future), self.tick_deadline)
+                except asyncio.TimeoutError:
+                    self._inflight = future
+                    raise
             if isinstance(result, list):
                 return result
             return []
+        except asyncio.TimeoutError:
+            self._ctx.tick_timeouts += 1
+            logger.warning(f"Strategy tick exceeded {self.tick_deadline * 1000:.0f}ms, "
+                           f"skipping (tick {self._ctx.tick_count})")
+            return []
         except Exception as e:
-            logger.error(f"Strategy tick error: {e}\n{traceback.format_exc()}")
+            self._log_tick_error(e)
             return []
+        finally:
+            self._record_tick_time(time.perf_counter() - start)
+            self._schedule_next(game, frame)
+
+    def _schedule_next(self, game, frame):
+        interval = 1
+        sleep = self._ctx._sleep_frames
+        if sleep:
+            interval = sleep + 1
+            self._ctx._sleep_frames = 0
+        else:
+            health = getattr(game, 'my_health', None)
+            if isinstance(health, (int, float)) and health <= 0:
+                interval = DEAD_TICK_INTERVAL
+        self.next_frame = frame + interval
+
+    def _log_tick_error(self, exc):
+        """Log a tick error with its traceback, at most once per ERROR_LOG_INTERVAL per error."""
+        key = repr(exc)
+        now = time.monotonic()
+        entry = self._error_log.get(key)
+        if entry and now - entry[0] < ERROR_LOG_INTERVAL:
+            entry[1] += 1
+            return
+        suppressed = entry[1] if entry else 0
+        if len(self._error_log) > 100:
+            self._error_log.clear()
+        self._error_log[key] = [now, 0]
+        # exc_info defers traceback formatting to the handler
+        if suppressed:
+            logger.error("Strategy tick error: %s (repeated %d times since last report)",
+                         exc, suppressed, exc_info=exc)
+        else:
+            logger.error("Strategy tick error: %s", exc, exc_info=exc)
+
+    def _record_tick_time(self, elapsed):
+        self._tick_times.append(elapsed)
+        # Refresh the p99 periodically rather than sorting every tick
+        if self._ctx.tick_count % 50 == 0 or len(self._tick_times) < 50:
+            ordered = sorted(self._tick_times)
+            idx = min(len(ordered) - 1, int(len(ordered) * 0.99))
+            self._ctx.tick_p99_ms = round(ordered[idx] * 1000, 2)
 
     @property
     def context(self):
@@ -165,3 +314,40 @@ class StrategyLoader:
     @property
     def version(self):
         return self._ctx.strategy_version
+
+
+class StrategyScheduler:
+    """Ticks many strategies per frame, skipping ones that are asleep.
+
+    Loaders sit in a heap keyed by their next due frame, so each frame only
+    touches the bots that are due instead of dispatching to every one:
+
+        scheduler = StrategyScheduler()
+        scheduler.add(loader, bot, game)
+        results = await scheduler.step()   # {loader: actions} for due bots
+    """
+
+    def __init__(self):
+        self.frame = 0
+        self._heap = []
+        self._seq = itertools.count()  # tie-breaker so loaders are never compared
+
+    def add(self, loader, bot, game):
+        heapq.heappush(self._heap, (max(loader.next_frame, self.frame + 1),
+                                    next(self._seq), loader, bot, game))
+
+    def __len__(self):
+        return len(self._heap)
+
+    async def step(self):
+        """Advance one frame and tick every strategy due on it."""
+        self.frame += 1
+        due = []
+        while self._heap and self._heap[0][0] <= self.frame:
+            due.append(heapq.heappop(self._heap))
+
+        results = {}
+        for _, _, loader, bot, game in due:
+            results[loader] = await loader.tick(bot, game, frame=self.frame)
+            heapq.heappush(self._heap, (loader.next_frame, next(self._seq), loader, bot, game))
+        return results
@@ -0,0 +1,82 @@
+"""
+Vector helpers for per-tick strategy math (nearest target, aim angles).
+
+GameView and ClawBot route their distance/aim calculations through here.
+If numba is installed the kernels are JIT-compiled; otherwise they fall
+back to plain Python using the C-implemented ``math.hypot``.
+"""
+
+import math
+
+try:
+    import numpy as np
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+# No fastmath: its nnan/ninf flags would make the comparisons below
+# undefined for inf/NaN coordinates.
+@njit(cache=True)
+def _nearest_index(xs, ys, zs, mx, my, mz):
+    dx = xs[0] - mx
+    dy = ys[0] - my
+    dz = zs[0] - mz
+    best = 0
+    best_d2 = dx * dx + dy * dy + dz * dz
+    for i in range(1, len(xs)):
+        dx = xs[i] - mx
+        dy = ys[i] - my
+        dz = zs[i] - mz
+        d2 = dx * dx + dy * dy + dz * dz
+        if d2 < best_d2:
+            best_d2 = d2
+            best = i
+    return best
+
+
+def origin_columns(origins):
+    """Split (x, y, z) origins into the (xs, ys, zs) columns nearest_index takes.
+
+    Build these once per snapshot at the call site: with numba they are
+    contiguous float64 arrays, otherwise plain lists.
+    """
+    if HAVE_NUMBA:
+        return tuple(np.ascontiguousarray(np.array(origins, dtype=np.float64).reshape(-1, 3).T))
+    return (
+        [o[0] for o in origins],
+        [o[1] for o in origins],
+        [o[2] for o in origins],
+    )
+
+
+def nearest_index(columns, my_origin) -> int:
+    """Index of the origin closest to my_origin, or -1 if there are none.
+
+    ``columns`` is the (xs, ys, zs) triple from origin_columns().
+    """
+    xs, ys, zs = columns
+    if len(xs) == 0:
+        return -1
+    return int(_nearest_index(xs, ys, zs, my_origin[0], my_origin[1], my_origin[2]))
+
+
+def distance(from_, to) -> float:
+    """Euclidean distance between two (x, y, z) points."""
+    return math.hypot(to[0] - from_[0], to[1] - from_[1], to[2] - from_[2])
+
+
+def aim_angles(from_, to) -> tuple[float, float]:
+    """(pitch, yaw) in degrees to look from one point at another."""
+    dx = to[0] - from_[0]
+    dy = to[1] - from_[1]
+    dz = to[2] - from_[2]
+    yaw = math.degrees(math.atan2(dy, dx))
+    pitch = -math.degrees(math.atan2(dz, max(math.hypot(dx, dy), 1e-6)))
+    return pitch, yaw
@@ -18,33 +18,48 @@ import argparse
 import time
 import sys
 
-from q3client import Q3Client
+from q3client import Q3Client, UNCHANGED
 
+# Last rendered status block; reprinted as-is while the server reply is unchanged
+_rendered_status: list[str] = []
 
-def print_status(client: Q3Client):
-    """Print current server status."""
-    status = client.get_status()
-
-    if not status.get("online"):
-        print("  Server: OFFLINE")
-        return False
 
+def render_status(status: dict) -> list[str]:
+    """Format a parsed status as display lines (scoreboard sorted by score)."""
     info = status.get("info", {})
     players = status.get("players", [])
 
-    print(f"  Server: {info.get('sv_hostname', 'Unknown')}")
-    print(f"  Map: {info.get('mapname', 'Unknown')}")
-    print(f"  Players: {len(players)}/{info.get('sv_maxclients', '?')}")
-    print(f"  Gametype: {info.get('g_gametype', '?')} | Fraglimit: {info.get('fraglimit', '?')}")
+    lines = [
+        f"  Server: {info.get('sv_hostname', 'Unknown')}",
+        f"  Map: {info.get('mapname', 'Unknown')}",
+        f"  Players: {len(players)}/{info.get('sv_maxclients', '?')}",
+        f"  Gametype: {info.get('g_gametype', '?')} | Fraglimit: {info.get('fraglimit', '?')}",
+    ]
 
     if players:
-        print("  ── Scoreboard ──")
+        lines.append("  ── Scoreboard ──")
         sorted_players = sorted(players, key=lambda p: p["score"], reverse=True)
         for i, p in enumerate(sorted_players, 1):
-            print(f"    {i}. {p['name']:20s} Score: {p['score']:4d}  Ping: {p['ping']}ms")
+            lines.append(f"    {i}. {p['name']:20s} Score: {p['score']:4d}  Ping: {p['ping']}ms")
     else:
-        print("  No players connected")
+        lines.append("  No players connected")
+
+    return lines
+
+
+def print_status(client: Q3Client):
+    """Print current server status."""
+    global _rendered_status
+    status = client.get_status(if_changed=True)
+
+    if status is not UNCHANGED:
+        if not status.get("online"):
+            _rendered_status = []
+            print("  Server: OFFLINE")
+            return False
+        _rendered_status = render_status(status)
 
+    print("\n".join(_rendered_status))
     return True
 
 
@@ -11,6 +11,7 @@ Based on the Q3 network protocol specification.
 Reference: https://github.com/jfedor2/quake3-proxy-aimbot
 """
 
+import asyncio
 import socket
 import struct
 import time
@@ -25,6 +26,43 @@ PROTOCOL_VERSION = 68  # Standard Q3 protocol version
 MAX_PACKET_SIZE = 16384
 OOB_HEADER = b"\xff\xff\xff\xff"
 
+# Returned by Q3Client.get_status(if_changed=True) when the server's reply
+# is byte-for-byte the same as last time.
+UNCHANGED = object()
+
+
+def parse_status_response(response: str) -> dict:
+    """Parse a statusResponse payload into info cvars and a player list."""
+    lines = response.strip().split("\n")
+    result = {"online": True, "info": {}, "players": []}
+
+    if len(lines) >= 2:
+        info_line = lines[1] if lines[0].startswith("statusResponse") else lines[0]
+        parts = info_line.split("\\")
+        for i in range(1, len(parts) - 1, 2):
+            result["info"][parts[i]] = parts[i + 1]
+
+        player_start = 2 if lines[0].startswith("statusResponse") else 1
+        for line in lines[player_start:]:
+            tokens = line.strip().split()
+            if len(tokens) >= 3:
+                result["players"].append({
+                    "score": int(tokens[0]),
+                    "ping": int(tokens[1]),
+                    "name": " ".join(tokens[2:]).strip('"'),
+                })
+
+    return result
+
+
+def parse_info_response(response: str) -> dict:
+    """Parse an infoResponse payload into a cvar dict."""
+    result = {}
+    parts = response.split("\\")
+    for i in range(1, len(parts) - 1, 2):
+        result[parts[i]] = parts[i + 1]
+    return result
+
 
 class Q3Entity:
     """Represents a game entity (player, item, projectile)."""
@@ -75,6 +113,8 @@ class Q3Client:
         self.client_num = -1
         self.challenge = ""
         self.connected = False
+        self._last_status_raw: Optional[str] = None
+        self._last_status: Optional[dict] = None
 
     def _send_oob(self, data: str) -> Optional[str]:
         """Send an out-of-band (connectionless) packet and return response."""
@@ -88,44 +128,28 @@ class Q3Client:
             return None
         return None
 
-    def get_status(self) -> dict:
-        """Query server status (getstatus)."""
+    def get_status(self, if_changed: bool = False):
+        """Query server status (getstatus).
+
+        An identical reply reuses the previous parse; with if_changed=True
+        it returns UNCHANGED instead so callers can skip re-rendering.
+        """
         response = self._send_oob("getstatus")
         if not response:
+            self._last_status_raw = self._last_status = None
             return {"online": False}
-
-        lines = response.strip().split("\n")
-        result = {"online": True, "info": {}, "players": []}
-
-        if len(lines) >= 2:
-            info_line = lines[1] if lines[0].startswith("statusResponse") else lines[0]
-            parts = info_line.split("\\")
-            for i in range(1, len(parts) - 1, 2):
-                result["info"][parts[i]] = parts[i + 1]
-
-            player_start = 2 if lines[0].startswith("statusResponse") else 1
-            for line in lines[player_start:]:
-                tokens = line.strip().split()
-                if len(tokens) >= 3:
-                    result["players"].append({
-                        "score": int(tokens[0]),
-                        "ping": int(tokens[1]),
-                        "name": " ".join(tokens[2:]).strip('"'),
-                    })
-
-        return result
+        if response == self._last_status_raw:
+            return UNCHANGED if if_changed else self._last_status
+        self._last_status_raw = response
+        self._last_status = parse_status_response(response)
+        return self._last_status
 
     def get_info(self) -> dict:
         """Quick server info query (getinfo)."""
         response = self._send_oob("getinfo")
         if not response:
             return {}
-
-        result = {}
-        parts = response.split("\\")
-        for i in range(1, len(parts) - 1, 2):
-            result[parts[i]] = parts[i + 1]
-        return result
+        return parse_info_response(response)
 
     def connect(self, player_name: str = "ClawBot") -> bool:
         """
@@ -178,3 +202,102 @@ class Q3Client:
     def close(self):
         """Close the socket."""
         self.disconnect()
+
+
+class _OOBProtocol(asyncio.DatagramProtocol):
+    """Routes connectionless replies to the query that is waiting for them."""
+
+    def __init__(self):
+        # addr -> {challenge: future}, in send order
+        self.pending: dict[tuple, dict[str, asyncio.Future]] = {}
+
+    def datagram_received(self, data, addr):
+        if data[:4] != OOB_HEADER:
+            return
+        waiters = self.pending.get(addr[:2])
+        if not waiters:
+            return
+        text = data[4:].decode("ascii", errors="replace")
+        # Servers echo the query's challenge in the infostring; fall back to
+        # the oldest outstanding query for servers that don't.
+        for challenge, future in waiters.items():
+            if f"\\challenge\\{challenge}" in text:
+                break
+        else:
+            challenge, future = next(iter(waiters.items()))
+        waiters.pop(challenge)
+        if not future.done():
+            future.set_result(text)
+
+
+class Q3AsyncClient:
+    """
+    Connectionless Q3 queries over a single shared UDP socket.
+
+    Every query is in flight at once, so surveying N servers takes about one
+    round-trip instead of N:
+
+        async with Q3AsyncClient() as client:
+            statuses = await client.survey([("10.0.0.5", 27960), ("10.0.0.6", 27961)])
+    """
+
+    def __init__(self, timeout: float = 2.0):
+        self.timeout = timeout
+        self._transport = None
+        self._protocol: Optional[_OOBProtocol] = None
+
+    async def open(self):
+        loop = asyncio.get_running_loop()
+        self._transport, self._protocol = await loop.create_datagram_endpoint(
+            _OOBProtocol, family=socket.AF_INET,
+        )
+
+    async def close(self):
+        if self._transport:
+            self._transport.close()
+            self._transport = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _send_oob(self, host: str, port: int, command: str) -> Optional[str]:
+        """Send `command <challenge>` and wait for the matching reply."""
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(host, port, family=socket.AF_INET, type=socket.SOCK_DGRAM)
+        addr = infos[0][4][:2]
+
+        challenge = str(random.randint(0, 2**31 - 1))
+        future = loop.create_future()
+        waiters = self._protocol.pending.setdefault(addr, {})
+        waiters[challenge] = future
+        self._transport.sendto(OOB_HEADER + f"{command} {challenge}".encode("ascii"), addr)
+        try:
+            return await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            waiters.pop(challenge, None)
+            if not waiters:
+                self._protocol.pending.pop(addr, None)
+
+    async def get_status(self, host: str, port: int = 27960) -> dict:
+        """Query server status (getstatus)."""
+        response = await self._send_oob(host, port, "getstatus")
+        if not response:
+            return {"online": False}
+        return parse_status_response(response)
+
+    async def get_info(self, host: str, port: int = 27960) -> dict:
+        """Quick server info query (getinfo)."""
+        response = await self._send_oob(host, port, "getinfo")
+        if not response:
+            return {}
+        return parse_info_response(response)
+
+    async def survey(self, servers: list[tuple[str, int]]) -> list[dict]:
+        """getstatus every (host, port) concurrently; results keep input order."""
+        return await asyncio.gather(*(self.get_status(h, p) for h, p in servers))
@@ -9,8 +9,8 @@ from typing import Optional, Tuple
 
 from sqlalchemy.orm import Session
 
-from api_keys import hash_api_key
-from models import AgentRegistrationDB, ApiKeyDB, BotDB
+from api_keys import hash_api_key, record_api_key_use, resolve_api_key
+from models import AgentRegistrationDB, BotDB
 
 
 def get_agent_registration_by_key(
@@ -58,22 +58,16 @@ def get_bot_by_user_api_key(
     if not raw_key:
         return None
 
-    key_hash = hash_api_key(raw_key)
-    key = (
-        db.query(ApiKeyDB)
-        .filter(ApiKeyDB.key_hash == key_hash, ApiKeyDB.is_active == 1)
-        .first()
-    )
-    if not key:
+    identity = resolve_api_key(db, raw_key)
+    if not identity:
         return None
 
-    if key.expires_at and key.expires_at <= datetime.utcnow():
+    if identity.expires_at and identity.expires_at <= datetime.utcnow():
         return None
 
     bot = db.query(BotDB).filter(BotDB.id == bot_id).first()
-    if not bot or bot.owner_id != key.user_id:
+    if not bot or bot.owner_id != identity.user_id:
         return None
 
-    key.last_used = datetime.utcnow()
-    db.commit()
+    record_api_key_use(db, identity.key_id)
     return bot
@@ -4,55 +4,80 @@ AI Agent Interface for interactive bot control.
 External agents call:
   - observe: read latest bot state snapshot (HTTP)
   - act: queue an action for the bot (HTTP)
+  - observe_batch / act_batch: the same for many owned bots in one call (HTTP)
   - ws /api/agent/stream: bidirectional telemetry + commands (WebSocket)
 
 Agent runners call:
-  - internal/sync: push latest state and receive pending actions (HTTP fallback)
+  - internal/state: push latest state (HTTP, fire-and-forget)
+  - internal/actions/{bot_id}: long-poll for pending actions (HTTP)
+  - internal/sync: push state and drain actions in one call (legacy HTTP)
   - ws /api/internal/telemetry: push telemetry, drain commands (WebSocket)
 """
 
 import asyncio
+import hmac
 import json
 import logging
 import os
 import time
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.security import HTTPAuthorizationCredentials
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
+try:
+    from orjson import loads as _json_loads
+    FastJSONResponse = ORJSONResponse
+except ImportError:  # orjson is optional
+    _json_loads = json.loads
+    FastJSONResponse = JSONResponse
+
 from agent_auth import (
     get_agent_registration_by_key,
     get_bot_by_user_api_key,
     mark_agent_registration_used,
 )
+from api_keys import record_api_key_use, resolve_api_key
 from auth import _get_user_from_token, get_db, optional_security
 from models import (
     BotDB, MatchDB, MatchParticipantDB, QueueEntryDB, SessionLocal,
     TournamentDB, TournamentMatchDB, TournamentParticipantDB, UserDB,
 )
+from state_store import StateStore, create_state_store
 from telemetry_hub import TelemetryHub, validate_action
 
 logger = logging.getLogger("clawquake.agent_interface")
 
-router = APIRouter(prefix="/api/agent", tags=["agent"])
+router = APIRouter(prefix="/api/agent", tags=["agent"], default_response_class=FastJSONResponse)
 
 # TelemetryHub instance — set by main.py at startup
 telemetry_hub: Optional[TelemetryHub] = None
 
+INTERNAL_SECRET = os.environ.get("INTERNAL_SECRET")
+if not INTERNAL_SECRET:
+    raise RuntimeError("INTERNAL_SECRET environment variable is required. Set it before starting the server.")
+_INTERNAL_SECRET_BYTES = INTERNAL_SECRET.encode()
+
 HEARTBEAT_INTERVAL = 5.0  # seconds
 HEARTBEAT_TIMEOUT = 10.0  # seconds
 MAX_FRAME_SIZE = 65536  # 64KB max telemetry frame
 
-# In-memory stores (single-orchestrator MVP)
+MAX_QUEUE_SIZE = 256
+MAX_BATCH_SIZE = 64  # bots per observe_batch / act_batch call
+ACTION_POLL_TIMEOUT = 30.0  # seconds a runner long-poll waits for actions
+
+# Backing dicts for the in-memory store (unused when REDIS_URL is set)
 # bot_id -> latest_state
 LATEST_STATES: Dict[int, Dict[str, Any]] = {}
-# bot_id -> queued action payloads
-ACTION_QUEUES: Dict[int, List[Dict[str, Any]]] = {}
+# bot_id -> queued action payloads (only touched from the event loop)
+ACTION_QUEUES: Dict[int, asyncio.Queue] = {}
 
-MAX_QUEUE_SIZE = 256
+state_store: StateStore = create_state_store(LATEST_STATES, ACTION_QUEUES, MAX_QUEUE_SIZE)
 
 # ── Fog of War ────────────────────────────────────────────────────
 # Perception range: 2D (XY) distance + Z band filter.
@@ -77,25 +102,16 @@ class ActionRequest(BaseModel):
     params: Dict[str, Any] = {}
 
 
-class AgentState(BaseModel):
-    tick: Optional[int] = None
-    position: Optional[List[float]] = None
-    health: Optional[int] = None
-    armor: Optional[int] = None
-    weapon: Optional[str] = None
-    ammo: Dict[str, int] = {}
-    visible_enemies: List[Dict[str, Any]] = []
-    nearby_items: List[Dict[str, Any]] = []
-    last_hit_by: Optional[str] = None
-    score: Dict[str, int] = {}
+class ObserveBatchRequest(BaseModel):
+    bot_ids: List[int]
 
-    class Config:
-        extra = "allow"
 
-
-class RunnerUpdate(BaseModel):
+class BatchAction(ActionRequest):
     bot_id: int
-    state: AgentState
+
+
+class ActBatchRequest(BaseModel):
+    actions: List[BatchAction]
 
 
 def _require_owned_bot(db: Session, user: UserDB, bot_id: int) -> BotDB:
@@ -107,44 +123,116 @@ def _require_owned_bot(db: Session, user: UserDB, bot_id: int) -> BotDB:
     return bot
 
 
-def _resolve_bot_access(
+def _authorize_bots(
     db: Session,
-    bot_id: int,
+    bot_ids: set[int],
     credentials: Optional[HTTPAuthorizationCredentials],
     x_api_key: Optional[str],
     x_agent_key: Optional[str],
-) -> BotDB:
+) -> Dict[int, BotDB]:
+    """Authenticate the caller once and check it may drive every bot in bot_ids.
+
+    Shared by the single-bot and batch endpoints so both apply the same
+    agent-key scope, API-key expiry and ownership rules.
+    """
     if x_agent_key:
+        # Agent keys are scoped to one bot, so a request can only name that bot.
         resolved = get_agent_registration_by_key(db, x_agent_key)
         if not resolved:
             raise HTTPException(status_code=401, detail="Invalid agent key")
         registration, bot = resolved
-        if bot.id != bot_id:
+        if bot_ids - {bot.id}:
             raise HTTPException(status_code=403, detail="Forbidden")
         mark_agent_registration_used(db, registration)
-        return bot
+        return {bot.id: bot}
 
+    key_id = None
     if credentials and credentials.scheme.lower() == "bearer":
-        user = _get_user_from_token(credentials.credentials, db)
-        return _require_owned_bot(db, user, bot_id)
+        user_id = _get_user_from_token(credentials.credentials, db).id
+    elif x_api_key:
+        identity = resolve_api_key(db, x_api_key)
+        if not identity or (identity.expires_at and identity.expires_at <= datetime.utcnow()):
+            raise HTTPException(status_code=401, detail="Invalid API key")
+        user_id, key_id = identity.user_id, identity.key_id
+    else:
+        raise HTTPException(status_code=401, detail="Authentication required")
+
+    bots = {bot.id: bot for bot in db.query(BotDB).filter(BotDB.id.in_(bot_ids))}
+    if len(bots) != len(bot_ids):
+        raise HTTPException(status_code=404, detail="Bot not found")
+    if any(bot.owner_id != user_id for bot in bots.values()):
+        raise HTTPException(status_code=403, detail="Forbidden")
+    if key_id is not None:
+        record_api_key_use(db, key_id)
+    return bots
+
 
-    if x_api_key:
-        bot = get_bot_by_user_api_key(db, x_api_key, bot_id)
-        if bot:
-            return bot
-        raise HTTPException(status_code=401, detail="Invalid API key")
+def _resolve_bot_access(
+    db: Session,
+    bot_id: int,
+    credentials: Optional[HTTPAuthorizationCredentials],
+    x_api_key: Optional[str],
+    x_agent_key: Optional[str],
+) -> BotDB:
+    return _authorize_bots(db, {bot_id}, credentials, x_api_key, x_agent_key)[bot_id]
+
+
+def _resolve_batch_access(
+    db: Session,
+    bot_ids: List[int],
+    credentials: Optional[HTTPAuthorizationCredentials],
+    x_api_key: Optional[str],
+    x_agent_key: Optional[str],
+):
+    """Authenticate once and check ownership of every bot with a single query."""
+    wanted = set(bot_ids)
+    if len(wanted) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_SIZE} bots per batch")
+    _authorize_bots(db, wanted, credentials, x_api_key, x_agent_key)
 
-    raise HTTPException(status_code=401, detail="Authentication required")
 
+async def _parse_runner_update(request: Request) -> tuple[int, Dict[str, Any]]:
+    """Decode a runner's ``{"bot_id": int, "state": {...}}`` body.
 
-def _validate_internal_secret(x_internal_secret: str):
-    expected = os.environ.get("INTERNAL_SECRET", "")
-    if not expected or x_internal_secret != expected:
+    Runner updates arrive per bot every tick from a trusted, secret-checked
+    caller, so the state dict (tick, position, health, armor, weapon, ammo,
+    visible_enemies, nearby_items, score, ...) is stored as sent rather
+    than validated field by field.
+    """
+    try:
+        payload = _json_loads(await request.body())
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON")
+    bot_id = payload.get("bot_id") if isinstance(payload, dict) else None
+    state = payload.get("state") if isinstance(payload, dict) else None
+    if type(bot_id) is not int or not isinstance(state, dict):
+        raise HTTPException(status_code=422, detail="Expected {bot_id: int, state: object}")
+    return bot_id, state
+
+
+def _check_internal_secret(provided: str):
+    """Constant-time check shared by every internal endpoint (here and in main)."""
+    if not hmac.compare_digest(provided.encode(), _INTERNAL_SECRET_BYTES):
         raise HTTPException(status_code=403, detail="Invalid internal secret")
 
 
-def _observe_for_bot(bot_id: int) -> Dict[str, Any]:
-    state = LATEST_STATES.get(bot_id)
+def _validate_internal_secret(x_internal_secret: str = Header(..., alias="X-Internal-Secret")):
+    # Used as a route dependency so forged requests are rejected before the
+    # body model is validated.
+    _check_internal_secret(x_internal_secret)
+
+
+async def _enqueue_action(bot_id: int, action: str, params: Optional[Dict[str, Any]] = None) -> bool:
+    """Queue an action for a bot. Returns False if the bot's queue is full."""
+    return await state_store.push_action(bot_id, {
+        "action": action,
+        "params": params or {},
+        "queued_at": time.time(),
+    })
+
+
+def _observe_for_bot(bot_id: int, state: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Fog-of-war filtered view of a bot's state snapshot."""
     if not state:
         return {"status": "waiting_for_connection", "bot_id": bot_id}
 
@@ -167,27 +255,32 @@ def _observe_for_bot(bot_id: int) -> Dict[str, Any]:
 
 
 @router.get("/observe")
-def observe_get(
+async def observe_get(
     bot_id: int = Query(...),
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
     x_api_key: Optional[str] = Header(default=None, alias="X-API-Key"),
     x_agent_key: Optional[str] = Header(default=None, alias="X-Agent-Key"),
     db: Session = Depends(get_db),
 ):
-    _resolve_bot_access(db, bot_id, credentials, x_api_key, x_agent_key)
-    return _observe_for_bot(bot_id)
+    await run_in_threadpool(
+        _resolve_bot_access, db, bot_id, credentials, x_api_key, x_agent_key,
+    )
+    # State snapshots are plain JSON types, so skip jsonable_encoder entirely.
+    return FastJSONResponse(_observe_for_bot(bot_id, await state_store.get_state(bot_id)))
 
 
 @router.post("/observe")
-def observe_post(
+async def observe_post(
     bot_id: int = Query(...),
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
     x_api_key: Optional[str] = Header(default=None, alias="X-API-Key"),
     x_agent_key: Optional[str] = Header(default=None, alias="X-Agent-Key"),
     db: Session = Depends(get_db),
 ):
-    _resolve_bot_access(db, bot_id, credentials, x_api_key, x_agent_key)
-    return _observe_for_bot(bot_id)
+    await run_in_threadpool(
+        _resolve_bot_access, db, bot_id, credentials, x_api_key, x_agent_key,
+    )
+    return FastJSONResponse(_observe_for_bot(bot_id, await state_store.get_state(bot_id)))
 
 
 @router.get("/bot-status")
@@ -292,15 +385,17 @@ def bot_status(
     if active_participant:
         match = db.query(MatchDB).filter(MatchDB.id == active_participant.match_id).first()
         if match:
-            opponents = []
-            participants = db.query(MatchParticipantDB).filter(
-                MatchParticipantDB.match_id == match.id,
-                MatchParticipantDB.bot_id != bot_id,
-            ).all()
-            for p in participants:
-                opp = db.query(BotDB).filter(BotDB.id == p.bot_id).first()
-                if opp:
-                    opponents.append(opp.name)
+            opp_ids = [
+                row.bot_id
+                for row in db.query(MatchParticipantDB.bot_id).filter(
+                    MatchParticipantDB.match_id == match.id,
+                    MatchParticipantDB.bot_id != bot_id,
+                )
+            ]
+            names = dict(
+                db.query(BotDB.id, BotDB.name).filter(BotDB.id.in_(opp_ids)).all()
+            ) if opp_ids else {}
+            opponents = [names[i] for i in opp_ids if i in names]
 
             result["active_match"] = {
                 "match_id": match.id,
@@ -351,7 +446,7 @@ def mark_ready(
 
 
 @router.post("/act")
-def act(
+async def act(
     action: ActionRequest,
     bot_id: int = Query(...),
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
@@ -359,49 +454,88 @@ def act(
     x_agent_key: Optional[str] = Header(default=None, alias="X-Agent-Key"),
     db: Session = Depends(get_db),
 ):
-    _resolve_bot_access(db, bot_id, credentials, x_api_key, x_agent_key)
+    # Auth touches the DB, so keep it off the event loop; the queue itself
+    # is only ever touched from the loop.
+    await run_in_threadpool(
+        _resolve_bot_access, db, bot_id, credentials, x_api_key, x_agent_key,
+    )
 
     action_name = action.action.strip()
     if not action_name:
         raise HTTPException(status_code=400, detail="Action is required")
 
-    queue = ACTION_QUEUES.setdefault(bot_id, [])
-    if len(queue) >= MAX_QUEUE_SIZE:
+    if not await _enqueue_action(bot_id, action_name, action.params):
         raise HTTPException(status_code=429, detail="Action queue full")
+    return {"ok": True, "queued": True, "queue_length": await state_store.queue_length(bot_id)}
 
-    queue.append(
-        {
-            "action": action_name,
-            "params": action.params or {},
-            "queued_at": time.time(),
-        }
+
+@router.post("/observe_batch")
+async def observe_batch(
+    request: ObserveBatchRequest,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    x_api_key: Optional[str] = Header(default=None, alias="X-API-Key"),
+    x_agent_key: Optional[str] = Header(default=None, alias="X-Agent-Key"),
+    db: Session = Depends(get_db),
+):
+    """Observe several owned bots with one auth check and one round-trip."""
+    await run_in_threadpool(
+        _resolve_batch_access, db, request.bot_ids, credentials, x_api_key, x_agent_key,
+    )
+    states = await state_store.get_states(request.bot_ids)
+    return FastJSONResponse(
+        {"bots": {bot_id: _observe_for_bot(bot_id, state) for bot_id, state in states.items()}}
     )
-    return {"ok": True, "queued": True, "queue_length": len(queue)}
+
+
+@router.post("/act_batch")
+async def act_batch(
+    request: ActBatchRequest,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    x_api_key: Optional[str] = Header(default=None, alias="X-API-Key"),
+    x_agent_key: Optional[str] = Header(default=None, alias="X-Agent-Key"),
+    db: Session = Depends(get_db),
+):
+    """Queue actions for several owned bots with one auth check."""
+    bot_ids = [a.bot_id for a in request.actions]
+    await run_in_threadpool(
+        _resolve_batch_access, db, bot_ids, credentials, x_api_key, x_agent_key,
+    )
+
+    names = [a.action.strip() for a in request.actions]
+    if not all(names):
+        raise HTTPException(status_code=400, detail="Action is required")
+
+    rejected = []
+    for item, name in zip(request.actions, names):
+        if not await _enqueue_action(item.bot_id, name, item.params):
+            rejected.append(item.bot_id)
+    return {"ok": not rejected, "queued": len(names) - len(rejected), "rejected": rejected}
 
 
 @router.get("/live-positions")
-def live_positions(
+async def live_positions(
     bot_id: Optional[int] = Query(default=None, description="Your bot ID for fog-of-war filtering"),
     db: Session = Depends(get_db),
 ):
     """Returns active bot positions. If bot_id is given, applies fog-of-war:
     only shows bots within perception range (800 XY units, ±128 Z)."""
-    active_ids = list(LATEST_STATES.keys())
+    states = await state_store.all_states()
     bot_names = {}
-    if active_ids:
-        from models import BotDB
-        for bot in db.query(BotDB).filter(BotDB.id.in_(active_ids)).all():
-            bot_names[bot.id] = bot.name
+    if states:
+        rows = await run_in_threadpool(
+            lambda: db.query(BotDB.id, BotDB.name).filter(BotDB.id.in_(list(states))).all()
+        )
+        bot_names = dict(rows)
 
     # Get requesting bot's position for fog-of-war filtering
     my_pos = None
     if bot_id is not None:
-        my_state = LATEST_STATES.get(bot_id)
+        my_state = states.get(bot_id)
         if my_state:
             my_pos = my_state.get("my_position") or my_state.get("position")
 
     bots = []
-    for bid, state in LATEST_STATES.items():
+    for bid, state in states.items():
         pos = state.get("my_position") or state.get("position") or state.get("pos")
         if not pos or not isinstance(pos, (list, tuple)) or len(pos) < 2:
             continue
@@ -434,7 +568,7 @@ def live_positions(
     # Aggregate discovered items from ALL bots (combined map reveal)
     seen_positions = set()
     items = []
-    for bid, state in LATEST_STATES.items():
+    for bid, state in states.items():
         for item in (state.get("nearby_items") or state.get("items") or []):
             pos = item.get("position")
             if not pos or not isinstance(pos, (list, tuple)) or len(pos) < 2:
@@ -455,23 +589,40 @@ def live_positions(
     return {"bots": bots, "count": len(bots), "items": items}
 
 
-@router.post("/internal/sync")
-def sync_runner(
-    update: RunnerUpdate,
-    x_internal_secret: str = Header(..., alias="X-Internal-Secret"),
+@router.post("/internal/sync", dependencies=[Depends(_validate_internal_secret)])
+async def sync_runner(
+    request: Request,
     db: Session = Depends(get_db),
 ):
-    _validate_internal_secret(x_internal_secret)
+    """Legacy combined push-state/drain-actions call (one round-trip per tick)."""
+    bot_id, state = await _parse_runner_update(request)
 
-    bot = db.query(BotDB).filter(BotDB.id == update.bot_id).first()
+    bot = await run_in_threadpool(
+        lambda: db.query(BotDB).filter(BotDB.id == bot_id).first()
+    )
     if not bot:
         raise HTTPException(status_code=404, detail="Bot not found")
 
-    LATEST_STATES[update.bot_id] = update.state.dict(exclude_none=True)
+    await state_store.set_state(bot_id, state)
+    return FastJSONResponse({"actions": await state_store.drain_actions(bot_id)})
 
-    actions = ACTION_QUEUES.get(update.bot_id, [])
-    ACTION_QUEUES[update.bot_id] = []
-    return {"actions": actions}
+
+@router.post("/internal/state", dependencies=[Depends(_validate_internal_secret)])
+async def push_runner_state(request: Request):
+    """Fire-and-forget state update from an agent runner."""
+    bot_id, state = await _parse_runner_update(request)
+    await state_store.set_state(bot_id, state)
+    return {"ok": True}
+
+
+@router.get("/internal/actions/{bot_id}", dependencies=[Depends(_validate_internal_secret)])
+async def poll_runner_actions(
+    bot_id: int,
+    timeout: float = Query(default=ACTION_POLL_TIMEOUT, ge=0, le=60),
+):
+    """Long-poll: return as soon as actions are queued, or empty after timeout."""
+
+    return FastJSONResponse({"actions": await state_store.wait_actions(bot_id, timeout)})
 
 
 # ── WebSocket: External Agent Stream ─────────────────────────────
@@ -527,9 +678,9 @@ async def agent_stream(
     logger.info("External agent connected for bot %d", bot_id)
 
     # Send initial state snapshot (fog-of-war filtered)
-    initial = LATEST_STATES.get(bot_id)
+    initial = await state_store.get_state(bot_id)
     if initial:
-        await websocket.send_json({"type": "state_snapshot", "state": _observe_for_bot(bot_id)})
+        await websocket.send_json({"type": "state_snapshot", "state": _observe_for_bot(bot_id, initial)})
 
     # Subscribe to telemetry
     queue = await telemetry_hub.subscribe(bot_id)
@@ -562,7 +713,6 @@ async def agent_stream(
 
                 if msg.get("type") == "command":
                     actions = msg.get("actions", [])
-                    queue_list = ACTION_QUEUES.setdefault(bot_id, [])
                     for action_str in actions:
                         if not validate_action(action_str):
                             await websocket.send_json({
@@ -570,12 +720,7 @@ async def agent_stream(
                                 "message": f"Invalid action: {action_str}",
                             })
                             continue
-                        if len(queue_list) < MAX_QUEUE_SIZE:
-                            queue_list.append({
-                                "action": action_str,
-                                "params": {},
-                                "queued_at": time.time(),
-                            })
+                        await _enqueue_action(bot_id, action_str)
         except (WebSocketDisconnect, Exception):
             pass
 
@@ -613,8 +758,9 @@ async def internal_telemetry(
     - Runner → Orchestrator: telemetry frames (20Hz)
     - Orchestrator → Runner: pending commands
     """
-    expected_secret = os.environ.get("INTERNAL_SECRET", "")
-    if not expected_secret or secret != expected_secret:
+    try:
+        _check_internal_secret(secret)
+    except HTTPException:
         await websocket.close(code=4001, reason="Invalid internal secret")
         return
 
@@ -642,17 +788,15 @@ async def internal_telemetry(
             if msg_type == "telemetry":
                 # Store latest state
                 state = msg.get("state", {})
-                LATEST_STATES[bot_id] = state
+                await state_store.set_state(bot_id, state)
 
                 # Publish to subscribers
                 await telemetry_hub.publish(bot_id, msg)
 
                 # Return pending commands
-                actions = ACTION_QUEUES.get(bot_id, [])
-                ACTION_QUEUES[bot_id] = []
                 await websocket.send_json({
                     "type": "commands",
-                    "actions": actions,
+                    "actions": await state_store.drain_actions(bot_id),
                 })
 
             elif msg_type == "event":
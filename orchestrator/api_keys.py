@@ -2,9 +2,15 @@
 API key helpers for bot and queue authentication.
 """
 
+import functools
 import hashlib
 import hmac
+import os
 import secrets
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
 
 from sqlalchemy.orm import Session
@@ -13,6 +19,40 @@ from models import ApiKeyDB, UserDB
 
 API_KEY_PREFIX = "cq_"
 
+# Resolved keys are cached in-process so repeat callers (agents polling
+# observe/act) skip the DB. Revocation through the API invalidates the
+# entry immediately; out-of-band DB edits take effect within the TTL.
+API_KEY_CACHE_TTL = float(os.environ.get("API_KEY_CACHE_TTL", "60"))  # seconds
+API_KEY_CACHE_MAX = 10_000
+LAST_USED_FLUSH_INTERVAL = float(os.environ.get("API_KEY_LAST_USED_FLUSH", "30"))  # seconds
+
+
+@dataclass(frozen=True)
+class ApiKeyIdentity:
+    """Plain snapshot of an active API key and its owning user."""
+    key_id: int
+    key_hash: str
+    user_id: int
+    username: str
+    email: str
+    is_admin: int
+    expires_at: Optional[datetime]
+
+    def to_user(self) -> UserDB:
+        """Build a detached UserDB carrying the cached identity fields."""
+        return UserDB(
+            id=self.user_id,
+            username=self.username,
+            email=self.email,
+            is_admin=self.is_admin,
+        )
+
+
+_cache: dict[str, tuple[float, ApiKeyIdentity]] = {}
+_pending_last_used: dict[int, datetime] = {}
+_last_flush = time.monotonic()
+_flush_lock = threading.Lock()
+
 
 def generate_api_key() -> str:
     """Generate a new user-facing API key."""
@@ -20,8 +60,14 @@ def generate_api_key() -> str:
     return f"{API_KEY_PREFIX}{token}"
 
 
+@functools.lru_cache(maxsize=4096)
 def hash_api_key(api_key: str) -> str:
-    """Return a stable hash for DB storage."""
+    """Return a stable hash for DB storage.
+
+    hashlib's SHA-256 comes from OpenSSL, which uses the CPU's SHA
+    extensions where available; a key fits in a single compression block.
+    Memoized so repeat callers skip the encode + hash entirely.
+    """
     return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
 
 
@@ -31,14 +77,80 @@ def verify_api_key(api_key: str, api_key_hash: str) -> bool:
     return hmac.compare_digest(candidate, api_key_hash)
 
 
-def get_user_by_api_key(api_key: str, db: Session) -> Optional[UserDB]:
-    """Resolve and validate an active API key to its owning user."""
+def resolve_api_key(db: Session, api_key: str) -> Optional[ApiKeyIdentity]:
+    """Resolve an active API key to its owner with one JOIN, cached for API_KEY_CACHE_TTL.
+
+    Expiry is not checked here — callers apply their own comparison.
+    """
     key_hash = hash_api_key(api_key)
-    key = (
-        db.query(ApiKeyDB)
+    now = time.monotonic()
+    cached = _cache.get(key_hash)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    row = (
+        db.query(UserDB, ApiKeyDB)
+        .join(ApiKeyDB, ApiKeyDB.user_id == UserDB.id)
         .filter(ApiKeyDB.key_hash == key_hash, ApiKeyDB.is_active == 1)
         .first()
     )
-    if not key:
+    if not row:
+        _cache.pop(key_hash, None)
+        return None
+
+    user, key = row
+    identity = ApiKeyIdentity(
+        key_id=key.id,
+        key_hash=key_hash,
+        user_id=user.id,
+        username=user.username,
+        email=user.email,
+        is_admin=user.is_admin or 0,
+        expires_at=key.expires_at,
+    )
+    if len(_cache) >= API_KEY_CACHE_MAX:
+        _cache.pop(next(iter(_cache)), None)
+    _cache[key_hash] = (now + API_KEY_CACHE_TTL, identity)
+    return identity
+
+
+def invalidate_api_key(key_hash: Optional[str] = None):
+    """Drop one cached key (or all keys) so revocation takes effect immediately."""
+    # Also forget memoized raw keys so a revoked secret isn't kept in memory.
+    hash_api_key.cache_clear()
+    if key_hash:
+        _cache.pop(key_hash, None)
+    else:
+        _cache.clear()
+
+
+def record_api_key_use(db: Session, key_id: int):
+    """Note a key's last_used time; persisted in batches every LAST_USED_FLUSH_INTERVAL."""
+    with _flush_lock:
+        _pending_last_used[key_id] = datetime.utcnow()
+        due = time.monotonic() - _last_flush >= LAST_USED_FLUSH_INTERVAL
+    if due:
+        flush_api_key_last_used(db)
+
+
+def flush_api_key_last_used(db: Session):
+    """Write all pending last_used times now (periodic task and shutdown)."""
+    global _last_flush, _pending_last_used
+    with _flush_lock:
+        pending, _pending_last_used = _pending_last_used, {}
+        _last_flush = time.monotonic()
+    if not pending:
+        return
+    for pending_id, used_at in pending.items():
+        db.query(ApiKeyDB).filter(ApiKeyDB.id == pending_id).update(
+            {ApiKeyDB.last_used: used_at}, synchronize_session=False,
+        )
+    db.commit()
+
+
+def get_user_by_api_key(api_key: str, db: Session) -> Optional[UserDB]:
+    """Resolve and validate an active API key to its owning user."""
+    identity = resolve_api_key(db, api_key)
+    if not identity:
         return None
-    return db.query(UserDB).filter(UserDB.id == key.user_id).first()
+    return identity.to_user()
@@ -1,24 +1,44 @@
+import asyncio
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
+import jwt
 from passlib.context import CryptContext
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from api_keys import hash_api_key
+from api_keys import record_api_key_use, resolve_api_key
 from models import UserDB, SessionLocal
-from models import ApiKeyDB
 
 SECRET_KEY = os.environ.get("JWT_SECRET")
 if not SECRET_KEY:
     raise RuntimeError("JWT_SECRET environment variable is required. Set it before starting the server.")
 ALGORITHM = "HS256"
+# Encoded once; PyJWT would otherwise re-encode the str key on every sign/verify.
+_SIGNING_KEY = SECRET_KEY.encode("utf-8")
 ACCESS_TOKEN_EXPIRE_HOURS = 24
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Verified token -> (cache expiry, username). Entries never outlive the
+# token's own exp claim, so a cache hit can skip the HMAC check safely.
+TOKEN_CACHE_TTL = 300  # seconds
+TOKEN_CACHE_MAX = 10_000
+_token_cache: dict[str, tuple[float, str]] = {}
+
+# bcrypt is deliberately slow and must only run on register/login. Per-request
+# auth (Bearer JWT, X-API-Key, X-Agent-Key) never touches pwd_context.
+# Rounds are pinned so the cost is explicit; hashes made with other costs still verify.
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "12"))
+pwd_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=BCRYPT_ROUNDS, deprecated="auto")
+# bcrypt runs on its own executor so a burst of logins can't occupy the
+# default threadpool that sync endpoints and DB work share. bcrypt releases
+# the GIL while hashing, so threads (one per core) parallelise it without a
+# process pool's pickling and startup cost.
+_hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="pwd-hash")
 security = HTTPBearer()
 optional_security = HTTPBearer(auto_error=False)
 
@@ -39,11 +59,19 @@ def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
 
 
+async def hash_password_async(password: str) -> str:
+    return await asyncio.get_running_loop().run_in_executor(_hash_executor, hash_password, password)
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    return await asyncio.get_running_loop().run_in_executor(_hash_executor, verify_password, plain, hashed)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     expire = datetime.utcnow() + (expires_delta or timedelta(hours=ACCESS_TOKEN_EXPIRE_HOURS))
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, _SIGNING_KEY, algorithm=ALGORITHM)
 
 
 def get_current_user(
@@ -54,16 +82,43 @@ def get_current_user(
     return _get_user_from_token(token, db)
 
 
-def _get_user_from_token(token: str, db: Session) -> UserDB:
+def require_token(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> str:
+    """
+    Authenticate without loading the user row; returns the token's username.
+
+    For read-only global endpoints (leaderboard, match history) that only
+    need a valid login. Verification hits the token cache, so a polling
+    dashboard costs no DB query and no HMAC per request.
+    """
+    return _decode_token_subject(credentials.credentials)
+
+
+def _decode_token_subject(token: str) -> str:
+    """Verify a JWT and return its subject, reusing recent verifications."""
+    now = time.time()
+    cached = _token_cache.get(token)
+    if cached and cached[0] > now:
+        return cached[1]
+
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise HTTPException(status_code=401, detail="Invalid token")
-    except JWTError:
+        payload = jwt.decode(token, _SIGNING_KEY, algorithms=[ALGORITHM], options={"require": ["exp"]})
+    except jwt.PyJWTError:
+        raise HTTPException(status_code=401, detail="Invalid token")
+    username = payload.get("sub")
+    if username is None:
         raise HTTPException(status_code=401, detail="Invalid token")
 
-    user = db.query(UserDB).filter(UserDB.username == username).first()
+    if len(_token_cache) >= TOKEN_CACHE_MAX:
+        _token_cache.pop(next(iter(_token_cache)), None)
+    _token_cache[token] = (min(payload["exp"], now + TOKEN_CACHE_TTL), username)
+    return username
+
+
+def _get_user_from_token(token: str, db: Session) -> UserDB:
+    username = _decode_token_subject(token)
+    user = db.scalar(select(UserDB).where(UserDB.username == username))
     if user is None:
         raise HTTPException(status_code=401, detail="User not found")
     return user
@@ -83,26 +138,16 @@ def get_current_user_or_apikey(
         return _get_user_from_token(credentials.credentials, db)
 
     if x_api_key:
-        key_hash = hash_api_key(x_api_key)
-        key = (
-            db.query(ApiKeyDB)
-            .filter(ApiKeyDB.key_hash == key_hash, ApiKeyDB.is_active == 1)
-            .first()
-        )
-        if not key:
+        identity = resolve_api_key(db, x_api_key)
+        if not identity:
             raise HTTPException(status_code=401, detail="Invalid API key")
 
         # Check expiry
-        if key.expires_at and key.expires_at < datetime.utcnow():
+        if identity.expires_at and identity.expires_at < datetime.utcnow():
             raise HTTPException(status_code=401, detail="API key has expired")
 
-        user = db.query(UserDB).filter(UserDB.id == key.user_id).first()
-        if not user:
-            raise HTTPException(status_code=401, detail="User not found")
-
-        key.last_used = datetime.utcnow()
-        db.commit()
-        return user
+        record_api_key_use(db, identity.key_id)
+        return identity.to_user()
 
     if x_agent_key:
         from agent_auth import get_agent_registration_by_key, mark_agent_registration_used
@@ -111,7 +156,7 @@ def get_current_user_or_apikey(
             raise HTTPException(status_code=401, detail="Invalid agent key")
         registration, bot = resolved
         mark_agent_registration_used(db, registration)
-        user = db.query(UserDB).filter(UserDB.id == registration.created_by_user_id).first()
+        user = db.get(UserDB, registration.created_by_user_id)
         if not user:
             raise HTTPException(status_code=401, detail="User not found")
         return user
@@ -0,0 +1,38 @@
+"""
+In-process cache for the first page of the leaderboard.
+
+The top-50 only changes when a bot is registered or a match is finalized,
+both of which call invalidate(); the TTL bounds staleness for out-of-band
+DB edits. Entries are keyed by the engine the request's session is bound
+to, so separate databases (e.g. test fixtures) never share an entry.
+"""
+
+import os
+import threading
+import time
+import weakref
+from typing import Optional
+
+LEADERBOARD_CACHE_TTL = float(os.environ.get("LEADERBOARD_CACHE_TTL", "300"))  # seconds
+
+# engine -> (expires_at, serialized JSON body)
+_entries: "weakref.WeakKeyDictionary[object, tuple[float, bytes]]" = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def get(bind) -> Optional[bytes]:
+    with _lock:
+        entry = _entries.get(bind)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def put(bind, body: bytes):
+    with _lock:
+        _entries[bind] = (time.monotonic() + LEADERBOARD_CACHE_TTL, body)
+
+
+def invalidate():
+    with _lock:
+        _entries.clear()
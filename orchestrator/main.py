@@ -3,26 +3,36 @@ ClawQuake Orchestrator — FastAPI service for auth, match control, and leaderbo
 """
 
 import asyncio
+import hashlib
+import inspect
 import json
 import logging
 import os
+import re
+import time
 from contextlib import suppress
 from datetime import datetime
-from queue import SimpleQueue
+from pathlib import Path
 from typing import Optional
 
-from fastapi import FastAPI, Depends, Header, HTTPException, WebSocket, WebSocketDisconnect
+import anyio.to_thread
+from fastapi import FastAPI, Depends, Header, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, raiseload
 
+from api_keys import LAST_USED_FLUSH_INTERVAL, flush_api_key_last_used
 from auth import (
-    get_db, hash_password, verify_password,
-    create_access_token, get_current_user, require_admin,
+    get_db, hash_password_async, verify_password_async,
+    create_access_token, get_current_user, require_admin, require_token,
 )
 from models import (
-    UserDB, MatchDB, BotDB, MatchParticipantDB, QueueEntryDB, SessionLocal,
+    UserDB, MatchDB, BotDB, MatchParticipantDB, QueueEntryDB, SessionLocal, engine, init_db,
+    DB_POOL_SIZE, DB_MAX_OVERFLOW,
     UserCreate, UserLogin, UserResponse, TokenResponse,
     MatchResponse, BotResponse, ServerStatus,
     MatchResultReport, MatchDetailResponse,
@@ -32,17 +42,26 @@ from routes_bots import router as bots_router
 from routes_agents import router as agents_router
 from routes_keys import router as keys_router
 from routes_queue import router as queue_router
-from rcon import get_server_status, add_bot, change_map, server_say, send_rcon
+from rcon import get_server_status_async, add_bot, server_say, send_rcon, send_rcon_many
 from rcon_pool import RconPool
 from process_manager import BotProcessManager
 from matchmaker import MatchMaker
 from websocket_hub import WebSocketHub
+from report_batcher import MatchReportBatcher
+from schemas_fast import dumps as _dumps, json_response
+import leaderboard_cache
 from tournament.bracket import TournamentBracket
 from models import (
-    TournamentCreate, TournamentJoin, TournamentResponse, TournamentDB, TournamentParticipantDB
+    TournamentCreate, TournamentJoin, TournamentResponse, TournamentDB, TournamentParticipantDB,
+    dump_tournament_list,
 )
 from models import TournamentMatchDB
-from ai_agent_interface import router as ai_agent_router
+from ai_agent_interface import (
+    FastJSONResponse,
+    INTERNAL_SECRET,
+    _check_internal_secret,
+    router as ai_agent_router,
+)
 import ai_agent_interface
 from telemetry_hub import TelemetryHub
 from telemetry_recorder import TelemetryRecorder
@@ -73,12 +92,11 @@ def _load_server_list() -> list[dict]:
 _server_list = _load_server_list()
 rcon_pool = RconPool(_server_list)
 
-_internal_secret = os.environ.get("INTERNAL_SECRET", "")
-_orchestrator_url = os.environ.get("ORCHESTRATOR_URL", "http://localhost:8000")
+ORCHESTRATOR_URL = os.environ.get("ORCHESTRATOR_URL", "http://localhost:8000")
 
 process_manager = BotProcessManager(
-    orchestrator_url=_orchestrator_url,
-    internal_secret=_internal_secret,
+    orchestrator_url=ORCHESTRATOR_URL,
+    internal_secret=INTERNAL_SECRET,
 )
 
 telemetry_hub = TelemetryHub()
@@ -91,13 +109,22 @@ matchmaker = MatchMaker(
     telemetry_recorder=telemetry_recorder,
 )
 websocket_hub = WebSocketHub()
+report_batcher = MatchReportBatcher()
 ai_agent_interface.telemetry_hub = telemetry_hub
-event_queue: SimpleQueue[tuple[str, dict]] = SimpleQueue()
+# Created on startup so it belongs to the serving event loop; sync handlers
+# publish into it through _publish_event.
+event_queue: asyncio.Queue[tuple[str, dict]] | None = None
+_event_loop: asyncio.AbstractEventLoop | None = None
 websocket_publisher_task: asyncio.Task | None = None
+last_used_flush_task: asyncio.Task | None = None
 tournament_tasks: dict[int, asyncio.Task] = {}
 
 
-app = FastAPI(title="ClawQuake Orchestrator", version="0.2.0")
+app = FastAPI(
+    title="ClawQuake Orchestrator",
+    version="0.2.0",
+    default_response_class=FastJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -114,9 +141,9 @@ app.include_router(queue_router)
 app.include_router(ai_agent_router)
 
 
-def _status_payload() -> dict:
+async def _status_payload() -> dict:
     """Current server status payload used by HTTP and WebSocket paths."""
-    data = get_server_status()
+    data = await get_server_status_async()
     if not data["online"]:
         # QuakeJS websocket servers may not answer UDP getstatus probes.
         # If bot processes are actively running a match, treat status as live.
@@ -158,12 +185,14 @@ def _queue_payload() -> dict:
     """Queue and active match summary for live clients."""
     db = SessionLocal()
     try:
-        waiting = db.query(BotDB).count()
-        waiting_entries = (
-            db.query(QueueEntryDB)
-            .filter(QueueEntryDB.status == "waiting")
-            .count()
-        )
+        # Both counts in one round-trip: SELECT (SELECT COUNT(*) ...), (SELECT COUNT(*) ...)
+        waiting, waiting_entries = db.execute(select(
+            select(func.count()).select_from(BotDB).scalar_subquery(),
+            select(func.count())
+            .select_from(QueueEntryDB)
+            .where(QueueEntryDB.status == "waiting")
+            .scalar_subquery(),
+        )).one()
         active = process_manager.active_matches()
         return {
             "waiting_entries": int(waiting_entries),
@@ -175,41 +204,122 @@ def _queue_payload() -> dict:
         db.close()
 
 
+def _etag_json_response(request: Request, body: bytes) -> Response:
+    """JSON response with an ETag; 304 with no body when the client already has it."""
+    etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+class _PayloadCache:
+    """Last computed payload, refreshed at most once per TTL.
+
+    ``compute`` is either a coroutine function (awaited on the loop) or a
+    plain function (run in a worker thread).
+
+    Concurrent readers of a stale cache share a single refresh, so N status
+    requests plus the publisher cost one status probe / one COUNT query.
+    """
+
+    def __init__(self, compute, ttl: float):
+        self._compute = compute
+        self.ttl = ttl
+        self.ts = 0.0
+        self.data: Optional[dict] = None
+        self.body: bytes = b""  # data as JSON, encoded once per refresh
+        self._lock = asyncio.Lock()
+
+    def _fresh(self) -> bool:
+        return self.data is not None and time.monotonic() - self.ts < self.ttl
+
+    async def get(self) -> dict:
+        if self._fresh():
+            return self.data
+        async with self._lock:
+            if not self._fresh():
+                if inspect.iscoroutinefunction(self._compute):
+                    data = await self._compute()
+                else:
+                    data = await asyncio.to_thread(self._compute)
+                self.body = _dumps(data)
+                self.data = data
+                self.ts = time.monotonic()
+        return self.data
+
+    async def get_body(self) -> bytes:
+        await self.get()
+        return self.body
+
+
+PAYLOAD_CACHE_TTL = 1.0  # seconds
+status_cache = _PayloadCache(_status_payload, PAYLOAD_CACHE_TTL)
+queue_cache = _PayloadCache(_queue_payload, PAYLOAD_CACHE_TTL)
+
+
+def _publish_event(event_type: str, payload: dict):
+    """Queue a live event for WebSocket clients; safe to call from worker threads."""
+    if event_queue is None or _event_loop is None:
+        return
+    _event_loop.call_soon_threadsafe(event_queue.put_nowait, (event_type, payload))
+
+
+PUBLISH_INTERVAL = 3.0  # seconds between status/queue ticks
+
+
 async def _websocket_publish_loop():
-    """Pushes live status/queue updates and queued events to connected clients."""
+    """Pushes live status/queue updates and queued events to connected clients.
+
+    Queued events (kill reports, ...) are broadcast as soon as they arrive.
+    Every PUBLISH_INTERVAL the status/queue snapshot and a "match_delta"
+    event ({started: [ids], ended: [ids]}) go out as a single "tick" frame
+    whose data.events holds the individual {event_type, data} events.
+    """
     previous_active: set[int] = set()
+    next_tick = time.monotonic()
     while True:
         if websocket_hub.connection_count == 0:
             await asyncio.sleep(1.0)
             continue
 
-        # Drain queued events first.
-        while not event_queue.empty():
-            event_type, payload = event_queue.get_nowait()
+        try:
+            event_type, payload = await asyncio.wait_for(
+                event_queue.get(), timeout=max(0.0, next_tick - time.monotonic()),
+            )
+        except asyncio.TimeoutError:
+            pass
+        else:
             await websocket_hub.broadcast(event_type, payload)
+            continue
 
-        queue_data = _queue_payload()
-        await websocket_hub.broadcast("status_update", _status_payload())
-        await websocket_hub.broadcast("queue_update", queue_data)
+        events = []
+        queue_data = await queue_cache.get()
+        events.append({"event_type": "status_update", "data": await status_cache.get()})
+        events.append({"event_type": "queue_update", "data": queue_data})
 
         active_ids = {int(m.get("match_id")) for m in queue_data["active_matches"] if "match_id" in m}
-        started = active_ids - previous_active
-        ended = previous_active - active_ids
-        for match_id in started:
-            await websocket_hub.broadcast(
-                "match_started",
-                {"match_id": match_id, "spectate_path": "/play/"},
-            )
-        for match_id in ended:
-            await websocket_hub.broadcast("match_ended", {"match_id": match_id})
+        started = sorted(active_ids - previous_active)
+        ended = sorted(previous_active - active_ids)
+        if started or ended:
+            events.append({
+                "event_type": "match_delta",
+                "data": {"started": started, "ended": ended, "spectate_path": "/play/"},
+            })
         previous_active = active_ids
 
-        await asyncio.sleep(3.0)
+        await websocket_hub.broadcast("tick", {"events": events})
+        next_tick = time.monotonic() + PUBLISH_INTERVAL
 
 
 matchmaker_task: asyncio.Task | None = None
 
 
+@app.on_event("startup")
+def _init_db():
+    """Create tables and indexes before anything else touches the DB."""
+    init_db()
+
+
 @app.on_event("startup")
 async def _migrate_tournament_columns():
     """Add new tournament columns if missing (SQLite ALTER TABLE)."""
@@ -232,6 +342,18 @@ async def _migrate_tournament_columns():
         db.close()
 
 
+@app.on_event("startup")
+async def _size_threadpool():
+    """Match the sync-endpoint threadpool to the DB pool capacity.
+
+    Sync handlers run on anyio's worker threads (default 40). With fewer
+    threads than pooled connections, requests queue while connections sit
+    idle; with more, threads block inside the pool waiting for checkout.
+    """
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(limiter.total_tokens, DB_POOL_SIZE + DB_MAX_OVERFLOW)
+
+
 @app.on_event("startup")
 async def _startup_matchmaker():
     global matchmaker_task
@@ -241,11 +363,38 @@ async def _startup_matchmaker():
 
 @app.on_event("startup")
 async def _startup_websocket_publisher():
-    global websocket_publisher_task
+    global websocket_publisher_task, event_queue, _event_loop
+    _event_loop = asyncio.get_running_loop()
+    event_queue = asyncio.Queue()
     if websocket_publisher_task is None or websocket_publisher_task.done():
         websocket_publisher_task = asyncio.create_task(_websocket_publish_loop())
 
 
+def _flush_key_last_used():
+    db = SessionLocal()
+    try:
+        flush_api_key_last_used(db)
+    finally:
+        db.close()
+
+
+async def _last_used_flush_loop():
+    """Persist pending API-key last_used times at least once per interval."""
+    while True:
+        await asyncio.sleep(LAST_USED_FLUSH_INTERVAL)
+        try:
+            await asyncio.to_thread(_flush_key_last_used)
+        except Exception:
+            logger.exception("API key last_used flush failed")
+
+
+@app.on_event("startup")
+async def _startup_last_used_flush():
+    global last_used_flush_task
+    if last_used_flush_task is None or last_used_flush_task.done():
+        last_used_flush_task = asyncio.create_task(_last_used_flush_loop())
+
+
 @app.on_event("shutdown")
 async def _shutdown_matchmaker():
     global matchmaker_task
@@ -257,6 +406,25 @@ async def _shutdown_matchmaker():
         matchmaker_task = None
 
 
+@app.on_event("shutdown")
+async def _shutdown_last_used_flush():
+    global last_used_flush_task
+    if last_used_flush_task:
+        last_used_flush_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await last_used_flush_task
+        last_used_flush_task = None
+    try:
+        await asyncio.to_thread(_flush_key_last_used)
+    except Exception:
+        logger.exception("API key last_used flush failed")
+
+
+@app.on_event("shutdown")
+async def _shutdown_report_batcher():
+    await report_batcher.stop()
+
+
 @app.on_event("shutdown")
 async def _shutdown_tournaments():
     for task in list(tournament_tasks.values()):
@@ -266,13 +434,6 @@ async def _shutdown_tournaments():
     tournament_tasks.clear()
 
 
-def _bot_name_map(db: Session) -> dict[int, str]:
-    return {
-        bot.id: bot.name
-        for bot in db.query(BotDB).all()
-    }
-
-
 async def _run_tournament(tournament_id: int):
     try:
         while True:
@@ -317,7 +478,10 @@ async def _run_tournament(tournament_id: int):
                 continue
 
             t_match_id, game_match_id, bot1_id, bot2_id = match_info
-            logger.info(f"Tournament {tournament_id}: launching match {game_match_id} ({bot1_id} vs {bot2_id})")
+            logger.info(
+                "Tournament %s: launching match %s (%s vs %s)",
+                tournament_id, game_match_id, bot1_id, bot2_id,
+            )
 
             result = await matchmaker.run_existing_match(
                 game_match_id,
@@ -326,11 +490,17 @@ async def _run_tournament(tournament_id: int):
             )
 
             if not result or not result.get("winner_id"):
-                logger.warning(f"Tournament {tournament_id}: match {game_match_id} returned no winner")
+                logger.warning(
+                    "Tournament %s: match %s returned no winner",
+                    tournament_id, game_match_id,
+                )
                 await asyncio.sleep(1.0)
                 continue
 
-            logger.info(f"Tournament {tournament_id}: match {game_match_id} winner={result['winner_id']}")
+            logger.info(
+                "Tournament %s: match %s winner=%s",
+                tournament_id, game_match_id, result['winner_id'],
+            )
             db = SessionLocal()
             try:
                 system = TournamentBracket(db)
@@ -392,8 +562,8 @@ async def websocket_bot_telemetry(ws: WebSocket, bot_id: int):
     await ws.accept()
 
     # Send initial state snapshot if available
-    from ai_agent_interface import LATEST_STATES
-    initial = LATEST_STATES.get(bot_id)
+    import ai_agent_interface
+    initial = await ai_agent_interface.state_store.get_state(bot_id)
     if initial:
         await ws.send_json({"type": "state_snapshot", "bot_id": bot_id, "state": initial})
 
@@ -441,107 +611,194 @@ async def websocket_bot_telemetry(ws: WebSocket, bot_id: int):
 
 # ── Auth Endpoints ──────────────────────────────────────────────
 
-@app.post("/api/auth/register", response_model=TokenResponse)
-def register(user: UserCreate, db: Session = Depends(get_db)):
-    if db.query(UserDB).filter(UserDB.username == user.username).first():
+# Register/login are async so the ~100ms bcrypt KDF runs on auth's dedicated
+# hash executor (hash_password_async / verify_password_async), leaving the
+# request threadpool free for DB-bound endpoints; their own ORM calls go
+# through run_in_threadpool.
+
+def _check_new_user(db: Session, user: UserCreate):
+    # One round-trip for both checks; both columns are unique, so at most two rows.
+    taken = db.execute(
+        select(UserDB.username, UserDB.email)
+        .where(or_(UserDB.username == user.username, UserDB.email == user.email))
+    ).all()
+    if any(row.username == user.username for row in taken):
         raise HTTPException(status_code=400, detail="Username already taken")
-    if db.query(UserDB).filter(UserDB.email == user.email).first():
+    if taken:
         raise HTTPException(status_code=400, detail="Email already registered")
 
+
+def _insert_user(db: Session, db_user: UserDB) -> UserDB:
+    db.add(db_user)
+    try:
+        db.commit()
+    except IntegrityError:
+        # Lost a race with a concurrent registration between check and insert
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Username or email already registered")
+    db.refresh(db_user)
+    return db_user
+
+
+@app.post("/api/auth/register", response_model=TokenResponse)
+async def register(user: UserCreate, db: Session = Depends(get_db)):
+    await run_in_threadpool(_check_new_user, db, user)
+
     db_user = UserDB(
         username=user.username,
         email=user.email,
-        hashed_password=hash_password(user.password),
+        hashed_password=await hash_password_async(user.password),
     )
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await run_in_threadpool(_insert_user, db, db_user)
 
     token = create_access_token({"sub": db_user.username})
-    logger.info(f"User registered: {db_user.username}")
+    logger.info("User registered: %s", db_user.username)
     return TokenResponse(access_token=token)
 
 
 @app.post("/api/auth/login", response_model=TokenResponse)
-def login(creds: UserLogin, db: Session = Depends(get_db)):
-    user = db.query(UserDB).filter(UserDB.username == creds.username).first()
-    if not user or not verify_password(creds.password, user.hashed_password):
+async def login(creds: UserLogin, db: Session = Depends(get_db)):
+    user = await run_in_threadpool(
+        db.scalar, select(UserDB).where(UserDB.username == creds.username)
+    )
+    if not user or not await verify_password_async(creds.password, user.hashed_password):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
     token = create_access_token({"sub": user.username})
-    logger.info(f"User login: {user.username}")
+    logger.info("User login: %s", user.username)
     return TokenResponse(access_token=token)
 
 
 @app.get("/api/auth/me", response_model=UserResponse)
 def me(user: UserDB = Depends(get_current_user)):
-    return UserResponse(
-        id=user.id,
-        username=user.username,
-        email=user.email,
-        is_admin=bool(user.is_admin),
-        created_at=user.created_at,
-    )
+    return UserResponse.from_orm_row(user, is_admin=bool(user.is_admin))
 
 
 # ── Public Status ───────────────────────────────────────────────
 
 @app.get("/api/status")
-def status():
+async def status():
     """Current server status — public endpoint."""
-    return _status_payload()
+    return Response(content=await status_cache.get_body(), media_type="application/json")
 
 
 # ── Leaderboard ─────────────────────────────────────────────────
 
+# Hot statements are built once; SQLAlchemy's compiled cache keys on their structure.
+_LEADERBOARD_STMT = (
+    select(
+        BotDB.id, BotDB.name, BotDB.elo,
+        BotDB.wins, BotDB.losses, BotDB.kills, BotDB.deaths,
+    )
+    .order_by(BotDB.elo.desc(), BotDB.id)
+    .limit(50)
+)
+_MATCHES_STMT = (
+    select(
+        MatchDB.id, MatchDB.map_name, MatchDB.gametype,
+        MatchDB.started_at, MatchDB.ended_at,
+        MatchDB.winner,
+    )
+    .order_by(MatchDB.started_at.desc(), MatchDB.id)
+    .limit(50)
+)
+
+
 @app.get("/api/leaderboard", response_model=list[BotResponse])
 def leaderboard(
-    user: UserDB = Depends(get_current_user),
+    request: Request,
+    after_id: Optional[int] = None,
+    _username: str = Depends(require_token),
     db: Session = Depends(get_db),
 ):
-    bots = db.query(BotDB).order_by(BotDB.elo.desc()).limit(50).all()
-    return [
-        BotResponse(
-            id=b.id, name=b.name, elo=b.elo,
-            wins=b.wins, losses=b.losses,
-            kills=b.kills, deaths=b.deaths,
-        )
-        for b in bots
-    ]
+    """Top bots by ELO. Pass the last bot's id as ``after_id`` for the next page."""
+    bind = db.get_bind()
+    if after_id is None:
+        cached = leaderboard_cache.get(bind)
+        if cached is not None:
+            return _etag_json_response(request, cached)
+
+    # Plain column rows straight to JSON: no ORM objects, no per-row BotResponse.
+    stmt = _LEADERBOARD_STMT
+    if after_id is not None:
+        cursor = db.scalar(select(BotDB.elo).where(BotDB.id == after_id))
+        if cursor is None:
+            raise HTTPException(status_code=400, detail="Unknown after_id")
+        stmt = stmt.where(or_(
+            BotDB.elo < cursor,
+            and_(BotDB.elo == cursor, BotDB.id > after_id),
+        ))
+    rows = db.execute(stmt).all()
+    # strategy is deliberately not exposed (custom strategy names are private);
+    # the key stays for BotResponse compatibility.
+    body = _dumps([{**row._asdict(), "strategy": "default"} for row in rows])
+    if after_id is None:
+        leaderboard_cache.put(bind, body)
+    return _etag_json_response(request, body)
 
 
 # ── Match History ───────────────────────────────────────────────
 
 @app.get("/api/matches", response_model=list[MatchResponse])
 def matches(
-    user: UserDB = Depends(get_current_user),
+    request: Request,
+    after_id: Optional[int] = None,
+    _username: str = Depends(require_token),
     db: Session = Depends(get_db),
 ):
-    results = db.query(MatchDB).order_by(MatchDB.started_at.desc()).limit(50).all()
-    return [
-        MatchResponse(
-            id=m.id, map_name=m.map_name, gametype=m.gametype,
-            started_at=m.started_at, ended_at=m.ended_at,
-            winner=m.winner, scores_json=m.scores_json,
-        )
-        for m in results
-    ]
+    """Most recent matches. Pass the last match's id as ``after_id`` for the next page."""
+    stmt = _MATCHES_STMT
+    if after_id is not None:
+        cursor = db.scalar(select(MatchDB.started_at).where(MatchDB.id == after_id))
+        if cursor is None:
+            raise HTTPException(status_code=400, detail="Unknown after_id")
+        stmt = stmt.where(or_(
+            MatchDB.started_at < cursor,
+            and_(MatchDB.started_at == cursor, MatchDB.id > after_id),
+        ))
+    rows = db.execute(stmt).all()
+    return _etag_json_response(request, _dumps([row._asdict() for row in rows]))
 
 
 # ── Admin: Match Control ────────────────────────────────────────
 
+# Map and bot names are interpolated into RCON command lines; anything
+# beyond these characters (';', quotes, whitespace) could inject commands.
+_RCON_NAME_RE = re.compile(r"[A-Za-z0-9_-]+")
+
+
+def _rcon_name(value: str, field: str) -> str:
+    if not _RCON_NAME_RE.fullmatch(value):
+        raise HTTPException(status_code=400, detail=f"Invalid {field}: use letters, digits, '_' or '-'")
+    return value
+
+
 @app.post("/api/admin/match/start")
 def start_match(
     map_name: str = "q3dm17",
+    bots: Optional[str] = None,
+    bot_skill: int = 3,
     admin: UserDB = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
-    change_map(map_name)
+    """Change map and optionally add built-in bots (comma-separated names) in one RCON packet.
+
+    Only the server's first reply is returned by RCON, so output from the
+    addbot commands (including errors such as an unknown bot name) is
+    discarded; the response does not confirm that the bots joined.
+    """
+    commands = [f"map {_rcon_name(map_name, 'map name')}"]
+    if bots:
+        commands.extend(
+            f"addbot {_rcon_name(name.strip(), 'bot name')} {bot_skill}"
+            for name in bots.split(",") if name.strip()
+        )
+    send_rcon_many(commands)
     match = MatchDB(map_name=map_name, gametype="ffa")
     db.add(match)
     db.commit()
     db.refresh(match)
-    logger.info(f"Match started: {map_name} (by {admin.username})")
+    logger.info("Match started: %s (by %s)", map_name, admin.username)
     return {"match_id": match.id, "map": map_name}
 
 
@@ -551,7 +808,7 @@ def admin_add_bot(
     skill: int = 3,
     admin: UserDB = Depends(require_admin),
 ):
-    result = add_bot(name, skill)
+    result = add_bot(_rcon_name(name, "bot name"), skill)
     return {"result": result, "bot": name, "skill": skill}
 
 
@@ -570,9 +827,21 @@ def admin_rcon(command: str, admin: UserDB = Depends(require_admin)):
 # ── Admin: Active Matches (Batch 2) ────────────────────────────
 
 @app.get("/api/admin/matches/active")
-def admin_active_matches(admin: UserDB = Depends(require_admin)):
+async def admin_active_matches(admin: UserDB = Depends(require_admin)):
     """List all active matches with process status."""
-    return {"matches": process_manager.active_matches()}
+    return {"matches": (await queue_cache.get())["active_matches"]}
+
+
+@app.get("/api/admin/pool")
+def admin_pool_status(admin: UserDB = Depends(require_admin)):
+    """Database connection pool usage."""
+    pool = engine.pool
+    stats = {"status": pool.status()}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        fn = getattr(pool, name, None)
+        if callable(fn):
+            stats[name] = fn()
+    return stats
 
 
 @app.get("/api/admin/servers")
@@ -583,41 +852,27 @@ def admin_server_list(admin: UserDB = Depends(require_admin)):
 
 # ── Internal: Match Reporting (Claude — Batch 1) ──────────────
 
-INTERNAL_SECRET = os.environ.get("INTERNAL_SECRET", "")
-
-
 @app.post("/api/internal/match/report")
-def internal_match_report(
+async def internal_match_report(
     report: MatchResultReport,
     x_internal_secret: str = Header(..., alias="X-Internal-Secret"),
     db: Session = Depends(get_db),
 ):
     """Bot agent_runner POSTs results here after a round ends."""
-    if not INTERNAL_SECRET or x_internal_secret != INTERNAL_SECRET:
-        raise HTTPException(status_code=403, detail="Invalid internal secret")
+    _check_internal_secret(x_internal_secret)
 
-    # Find the participant record and update it
-    participant = (
-        db.query(MatchParticipantDB)
-        .filter(
-            MatchParticipantDB.match_id == report.match_id,
-            MatchParticipantDB.bot_id == report.bot_id,
-        )
-        .first()
+    # Reports arriving together at round end share one transaction
+    found = await report_batcher.submit(
+        db, report.match_id, report.bot_id, report.kills, report.deaths,
     )
-    if not participant:
+    if not found:
         raise HTTPException(status_code=404, detail="Match participant not found")
 
-    participant.kills = report.kills
-    participant.deaths = report.deaths
-    participant.score = report.kills - report.deaths
-    db.commit()
-
     logger.info(
-        f"Match {report.match_id}: {report.bot_name} reported "
-        f"K={report.kills} D={report.deaths}"
+        "Match %s: %s reported K=%s D=%s",
+        report.match_id, report.bot_name, report.kills, report.deaths,
     )
-    event_queue.put((
+    _publish_event(
         "kill_event",
         {
             "match_id": report.match_id,
@@ -626,54 +881,51 @@ def internal_match_report(
             "kills": report.kills,
             "deaths": report.deaths,
         },
-    ))
+    )
     return {"ok": True}
 
 
-@app.get("/api/matches/{match_id}")
+@app.get("/api/matches/{match_id}", response_model=MatchDetailResponse)
 def get_match_detail(
     match_id: int,
     db: Session = Depends(get_db),
 ):
     """Get match details with all participants."""
-    match = db.query(MatchDB).filter(MatchDB.id == match_id).first()
+    # Participants are read below with a column query; never lazy-load them.
+    match = db.get(MatchDB, match_id, options=[raiseload("*")])
     if not match:
         raise HTTPException(status_code=404, detail="Match not found")
 
-    participants = (
-        db.query(MatchParticipantDB)
-        .filter(MatchParticipantDB.match_id == match_id)
-        .all()
-    )
-
-    participant_data = []
-    for p in participants:
-        bot = db.query(BotDB).filter(BotDB.id == p.bot_id).first()
-        participant_data.append({
-            "bot_id": p.bot_id,
-            "bot_name": bot.name if bot else "unknown",
-            "kills": p.kills,
-            "deaths": p.deaths,
-            "score": p.score,
-            "elo_before": p.elo_before,
-            "elo_after": p.elo_after,
-            "elo_change": round(p.elo_after - p.elo_before, 2),
-        })
+    rows = db.execute(
+        select(
+            MatchParticipantDB.bot_id,
+            func.coalesce(BotDB.name, "unknown").label("bot_name"),
+            MatchParticipantDB.kills,
+            MatchParticipantDB.deaths,
+            MatchParticipantDB.score,
+            MatchParticipantDB.elo_before,
+            MatchParticipantDB.elo_after,
+            func.round(MatchParticipantDB.elo_after - MatchParticipantDB.elo_before, 2).label("elo_change"),
+        )
+        .outerjoin(BotDB, BotDB.id == MatchParticipantDB.bot_id)
+        .where(MatchParticipantDB.match_id == match_id)
+    ).all()
+    participant_data = [row._asdict() for row in rows]
 
     duration = None
     if match.ended_at and match.started_at:
         duration = (match.ended_at - match.started_at).total_seconds()
 
-    return MatchDetailResponse(
-        id=match.id,
-        map_name=match.map_name,
-        gametype=match.gametype,
-        started_at=match.started_at,
-        ended_at=match.ended_at,
-        winner=match.winner,
-        duration_seconds=duration,
-        participants=participant_data,
-    )
+    return json_response({
+        "id": match.id,
+        "map_name": match.map_name,
+        "gametype": match.gametype,
+        "started_at": match.started_at,
+        "ended_at": match.ended_at,
+        "winner": match.winner,
+        "duration_seconds": duration,
+        "participants": participant_data,
+    })
 
 
 
@@ -842,7 +1094,7 @@ def create_tournament(
     bracket.frag_limit = t.frag_limit
     db.commit()
     db.refresh(bracket)
-    return TournamentResponse(
+    return TournamentResponse.model_construct(
         id=bracket.id, name=bracket.name, description=bracket.description or "",
         format=bracket.format, max_participants=bracket.max_participants or 16,
         created_by_user_id=bracket.created_by_user_id, creator_name=user.username,
@@ -858,25 +1110,27 @@ def list_tournaments(
     status: Optional[str] = None,
     db: Session = Depends(get_db),
 ):
-    query = db.query(TournamentDB).order_by(TournamentDB.created_at.desc())
+    query = db.query(TournamentDB).options(raiseload("*")).order_by(TournamentDB.created_at.desc())
     if status:
         query = query.filter(TournamentDB.status == status)
     tournaments = query.limit(100).all()
 
-    # Batch-load creator names and winner names
+    # Batch-load creator names, winner names and participant counts:
+    # three bounded queries for the whole page instead of one per tournament.
     user_ids = {t.created_by_user_id for t in tournaments if t.created_by_user_id}
-    user_map = {u.id: u.username for u in db.query(UserDB).filter(UserDB.id.in_(user_ids)).all()} if user_ids else {}
-    bot_name_map = _bot_name_map(db)
+    user_map = dict(db.execute(select(UserDB.id, UserDB.username).where(UserDB.id.in_(user_ids))).all()) if user_ids else {}
+    winner_ids = {t.winner_bot_id for t in tournaments if t.winner_bot_id}
+    bot_name_map = dict(db.execute(select(BotDB.id, BotDB.name).where(BotDB.id.in_(winner_ids))).all()) if winner_ids else {}
+    participant_counts = dict(db.execute(
+        select(TournamentParticipantDB.tournament_id, func.count())
+        .where(TournamentParticipantDB.tournament_id.in_([t.id for t in tournaments]))
+        .group_by(TournamentParticipantDB.tournament_id)
+    ).all()) if tournaments else {}
 
     items: list[TournamentResponse] = []
     for tournament in tournaments:
-        participant_count = (
-            db.query(TournamentParticipantDB)
-            .filter(TournamentParticipantDB.tournament_id == tournament.id)
-            .count()
-        )
         items.append(
-            TournamentResponse(
+            TournamentResponse.model_construct(
                 id=tournament.id,
                 name=tournament.name,
                 description=getattr(tournament, "description", "") or "",
@@ -885,7 +1139,7 @@ def list_tournaments(
                 created_by_user_id=tournament.created_by_user_id,
                 creator_name=user_map.get(tournament.created_by_user_id),
                 status=tournament.status,
-                participant_count=participant_count,
+                participant_count=participant_counts.get(tournament.id, 0),
                 current_round=tournament.current_round,
                 winner_bot_id=tournament.winner_bot_id,
                 winner_name=bot_name_map.get(tournament.winner_bot_id),
@@ -894,7 +1148,7 @@ def list_tournaments(
                 frag_limit=getattr(tournament, "frag_limit", None),
             )
         )
-    return items
+    return Response(content=dump_tournament_list(items), media_type="application/json")
 
 @app.post("/api/tournaments/{tid}/join")
 def join_tournament(
@@ -991,11 +1245,13 @@ async def start_tournament(
     removed_names = []
     if any_ready:
         # At least one bot signaled ready — remove those that didn't
-        for p in all_participants:
-            if not getattr(p, "ready", 0):
-                bot = db.query(BotDB).filter(BotDB.id == p.bot_id).first()
-                removed_names.append(bot.name if bot else f"Bot {p.bot_id}")
-                db.delete(p)
+        unready = [p for p in all_participants if not getattr(p, "ready", 0)]
+        names = dict(db.execute(
+            select(BotDB.id, BotDB.name).where(BotDB.id.in_([p.bot_id for p in unready]))
+        ).all()) if unready else {}
+        for p in unready:
+            removed_names.append(names.get(p.bot_id, f"Bot {p.bot_id}"))
+            db.delete(p)
         if removed_names:
             db.commit()
 
@@ -1067,56 +1323,68 @@ def get_tournament(
     tid: int,
     db: Session = Depends(get_db),
 ):
-    system = TournamentBracket(db)
-    # Get tournament info
+    # Read path: a fixed handful of bounded queries, no TournamentBracket and
+    # no full bots-table scan for names.
     t = db.query(TournamentDB).get(tid)
     if not t:
         raise HTTPException(status_code=404, detail="Tournament not found")
-        
-    count = db.query(TournamentParticipantDB).filter_by(tournament_id=tid).count()
-    bracket_data = system.get_bracket(tid)
-    bot_names = _bot_name_map(db)
+
     participants = (
         db.query(TournamentParticipantDB)
+        .options(raiseload("*"))
         .filter_by(tournament_id=tid)
         .order_by(TournamentParticipantDB.seed.asc(), TournamentParticipantDB.id.asc())
         .all()
     )
-    
+    count = len(participants)
+    bracket_matches = (
+        db.query(TournamentMatchDB)
+        .options(raiseload("*"))
+        .filter_by(tournament_id=tid)
+        .order_by(TournamentMatchDB.round_num, TournamentMatchDB.match_num)
+        .all()
+    )
+
+    # Every bot referenced by the page, fetched in one IN query
+    bot_ids = {p.bot_id for p in participants}
+    for m in bracket_matches:
+        bot_ids.update((m.player1_bot_id, m.player2_bot_id, m.winner_bot_id))
+    bot_ids.add(t.winner_bot_id)
+    bot_ids.discard(None)
+    bots_detail = {
+        b.id: b for b in db.query(BotDB).options(raiseload("*")).filter(BotDB.id.in_(bot_ids)).all()
+    } if bot_ids else {}
+    bot_names = {bot_id: b.name for bot_id, b in bots_detail.items()}
+
     # Format matches for JSON
     rounds_json = {}
-    for r_num, matches in bracket_data.items():
-        m_list = []
-        for m in matches:
-            m_list.append({
-                "match_id": m.id,
-                "match_num": m.match_num,
-                "p1": m.player1_bot_id,
-                "p1_name": bot_names.get(m.player1_bot_id, "TBD") if m.player1_bot_id else "TBD",
-                "p2": m.player2_bot_id,
-                "p2_name": bot_names.get(m.player2_bot_id, "TBD") if m.player2_bot_id else "TBD",
-                "winner": m.winner_bot_id,
-                "winner_name": bot_names.get(m.winner_bot_id) if m.winner_bot_id else None,
-                "next": m.next_match_id,
-                "game_match_id": m.game_match_id,
-            })
-        rounds_json[r_num] = m_list
-        
-    # Get creator name
-    creator = db.query(UserDB).filter(UserDB.id == t.created_by_user_id).first() if t.created_by_user_id else None
+    for m in bracket_matches:
+        rounds_json.setdefault(m.round_num, []).append({
+            "match_id": m.id,
+            "match_num": m.match_num,
+            "p1": m.player1_bot_id,
+            "p1_name": bot_names.get(m.player1_bot_id, "TBD") if m.player1_bot_id else "TBD",
+            "p2": m.player2_bot_id,
+            "p2_name": bot_names.get(m.player2_bot_id, "TBD") if m.player2_bot_id else "TBD",
+            "winner": m.winner_bot_id,
+            "winner_name": bot_names.get(m.winner_bot_id) if m.winner_bot_id else None,
+            "next": m.next_match_id,
+            "game_match_id": m.game_match_id,
+        })
 
-    # Get bot details (ELO, owner) for participants
-    bot_ids = [p.bot_id for p in participants]
-    bots_detail = {b.id: b for b in db.query(BotDB).filter(BotDB.id.in_(bot_ids)).all()} if bot_ids else {}
-    owner_ids = {b.owner_id for b in bots_detail.values()}
-    owner_map = {u.id: u.username for u in db.query(UserDB).filter(UserDB.id.in_(owner_ids)).all()} if owner_ids else {}
+    # Creator and participant owners' usernames in one query
+    user_ids = {b.owner_id for b in bots_detail.values()}
+    if t.created_by_user_id:
+        user_ids.add(t.created_by_user_id)
+    owner_map = {u.id: u.username for u in db.query(UserDB).filter(UserDB.id.in_(user_ids)).all()} if user_ids else {}
+    creator_name = owner_map.get(t.created_by_user_id) if t.created_by_user_id else None
 
     return {
-        "info": TournamentResponse(
+        "info": TournamentResponse.model_construct(
              id=t.id, name=t.name, description=getattr(t, "description", "") or "",
              format=t.format, max_participants=getattr(t, "max_participants", 16) or 16,
              status=t.status, created_by_user_id=t.created_by_user_id,
-             creator_name=creator.username if creator else None,
+             creator_name=creator_name,
              participant_count=count, current_round=t.current_round,
              winner_bot_id=t.winner_bot_id,
              winner_name=bot_names.get(t.winner_bot_id),
@@ -1147,9 +1415,8 @@ def record_tournament_match(
     x_internal_secret: str = Header(..., alias="X-Internal-Secret"),
     db: Session = Depends(get_db),
 ):
-    if x_internal_secret != INTERNAL_SECRET:
-         raise HTTPException(status_code=403)
-         
+    _check_internal_secret(x_internal_secret)
+
     system = TournamentBracket(db)
     system.record_result(tid, mid, winner_bot_id)
     return {"ok": True}
@@ -1161,21 +1428,32 @@ def health():
 
 # ── Docs Pages ───────────────────────────────────────────────────
 
+# In production nginx serves these pages directly; the in-process fallback
+# resolves the paths once at import instead of stat-ing on every request.
+STATIC_DIR = os.environ.get("STATIC_DIR", "/app/static")
+_STATIC_DIR_EXISTS = os.path.isdir(STATIC_DIR)
+
+
+def _static_page(name: str) -> Optional[str]:
+    path = os.path.join(STATIC_DIR, name)
+    return path if _STATIC_DIR_EXISTS and os.path.isfile(path) else None
+
+
+_DOCS_PATH = _static_page("docs.html")
+_GETTING_STARTED_PATH = _static_page("getting-started.html")
+
+
 @app.get("/docs-page")
 def docs_page():
-    if os.path.isdir(STATIC_DIR):
-        path = os.path.join(STATIC_DIR, "docs.html")
-        if os.path.exists(path):
-            return FileResponse(path)
+    if _DOCS_PATH:
+        return FileResponse(_DOCS_PATH)
     raise HTTPException(status_code=404, detail="docs.html not found")
 
 
 @app.get("/getting-started")
 def getting_started_page():
-    if os.path.isdir(STATIC_DIR):
-        path = os.path.join(STATIC_DIR, "getting-started.html")
-        if os.path.exists(path):
-            return FileResponse(path)
+    if _GETTING_STARTED_PATH:
+        return FileResponse(_GETTING_STARTED_PATH)
     raise HTTPException(status_code=404, detail="getting-started.html not found")
 
 
@@ -1188,34 +1466,35 @@ REPLAY_DIR = os.environ.get("REPLAY_DIR", "replays")
 def list_replays():
     if not os.path.isdir(REPLAY_DIR):
         return []
-    files = []
-    for f in os.listdir(REPLAY_DIR):
-        if f.endswith(".json"):
-            path = os.path.join(REPLAY_DIR, f)
-            stat = os.stat(path)
-            files.append({
-                "filename": f,
-                "size": stat.st_size,
-                "modified": datetime.fromtimestamp(stat.st_mtime)
-            })
+    # scandir's DirEntry.stat() reuses data from the directory read where the
+    # platform provides it; "modified" is epoch seconds.
+    with os.scandir(REPLAY_DIR) as entries:
+        files = []
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.is_file():
+                st = entry.stat()
+                files.append({
+                    "filename": entry.name,
+                    "size": st.st_size,
+                    "modified": st.st_mtime,
+                })
     # Sort by recent
     files.sort(key=lambda x: x["modified"], reverse=True)
     return files
 
 @app.get("/api/replays/{filename}")
 def get_replay(filename: str):
-    # Security check: no path traversal
-    if ".." in filename or "/" in filename:
+    # Security check: the resolved path must stay inside REPLAY_DIR
+    base = Path(REPLAY_DIR).resolve()
+    target = (base / filename).resolve()
+    if target.parent != base:
         raise HTTPException(status_code=400, detail="Invalid filename")
-        
-    path = os.path.join(REPLAY_DIR, filename)
-    if not os.path.exists(path):
+    if not target.is_file():
         raise HTTPException(status_code=404, detail="Replay not found")
-        
-    return FileResponse(path)
+
+    return FileResponse(target)
 
 # ── Static Files (must be last — catch-all) ─────────────────────
 
-STATIC_DIR = os.environ.get("STATIC_DIR", "/app/static")
-if os.path.isdir(STATIC_DIR):
+if _STATIC_DIR_EXISTS:
     app.mount("/", StaticFiles(directory=STATIC_DIR, html=True), name="static")
@@ -8,12 +8,17 @@ import asyncio
 import logging
 import math
 import os
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Iterator, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.orm import Session, joinedload
 
 from models import QueueEntryDB, MatchDB, MatchParticipantDB, BotDB, SessionLocal
+import leaderboard_cache
 
 logger = logging.getLogger("clawquake.matchmaker")
 
@@ -21,20 +26,88 @@ logger = logging.getLogger("clawquake.matchmaker")
 
 MATCH_DURATION = int(os.environ.get("MATCH_DURATION", "300"))    # seconds
 QUEUE_POLL_INTERVAL = int(os.environ.get("QUEUE_POLL_INTERVAL", "5"))  # seconds
+FALLBACK_SERVER_URL = os.environ.get("GAME_SERVER_URLS", "ws://localhost:27960").split(",")[0].strip()
+DEFAULT_STRATEGY = os.environ.get("DEFAULT_STRATEGY", "strategies/default.py")
 MIN_PLAYERS = 2
 MAX_PLAYERS = 4
 DEFAULT_MAP = "q3dm1"
 
+# 10 ** (x / 400) == exp(x * ln(10) / 400); one exp() is cheaper than pow()
+_LN10_OVER_400 = math.log(10) / 400.0
+_by_score = itemgetter("score")  # C-level sort key, no lambda frame per item
+
+
+# ── Statements ──────────────────────────────────────────────────
+# Built once; SQLAlchemy's compiled cache keys on their structure, so the
+# matchmaker's hot queries skip both construction and compilation.
+
+# The inner join skips entries whose bot was deleted: they are never
+# claimed, so they cannot end up "matched" without a participant row.
+_WAITING_STMT = (
+    select(QueueEntryDB)
+    .join(BotDB, BotDB.id == QueueEntryDB.bot_id)
+    .where(QueueEntryDB.status == "waiting")
+    .order_by(QueueEntryDB.queued_at.asc())
+    .limit(MAX_PLAYERS)
+)
+_PARTICIPANT_STMT = select(MatchParticipantDB).where(
+    MatchParticipantDB.match_id == bindparam("match_id"),
+    MatchParticipantDB.bot_id == bindparam("bot_id"),
+)
+
+
+# ── Strategy Paths ──────────────────────────────────────────────
+
+@lru_cache(maxsize=512)
+def _global_strategy_path(name: str) -> Optional[str]:
+    """
+    strategies/{name}.py if it exists, else None.
+
+    Global strategies ship with the image, so the stat() is done once per
+    name. Custom strategies are uploaded at runtime and are not cached.
+    """
+    path = f"strategies/{name}.py"
+    return path if os.path.exists(path) else None
+
 
 # ── ELO Calculator ──────────────────────────────────────────────
 
+def _ffa_changes(elos: list[float], scores: list[int], pair_k: float) -> list[float]:
+    """
+    Pairwise FFA kernel: total ELO change per position.
+
+    Plain floats and lists only, with the expected-score formula inlined,
+    so a batch replay calling this thousands of times pays no attribute
+    lookups or dict hashing per pair. Each pair is zero-sum: whatever i
+    gains from the outcome, j loses.
+    """
+    n = len(elos)
+    changes = [0.0] * n
+    for i in range(n):
+        elo_i = elos[i]
+        score_i = scores[i]
+        for j in range(i + 1, n):
+            score_j = scores[j]
+            if score_i > score_j:
+                outcome = 1.0
+            elif score_i == score_j:
+                outcome = 0.5
+            else:
+                outcome = 0.0
+            expected_i = 1.0 / (1.0 + math.exp((elos[j] - elo_i) * _LN10_OVER_400))
+            delta = pair_k * (outcome - expected_i)
+            changes[i] += delta
+            changes[j] -= delta
+    return changes
+
+
 class EloCalculator:
     """Standard ELO rating calculator."""
 
     @staticmethod
     def expected_score(rating_a: float, rating_b: float) -> float:
         """Expected probability of A winning against B."""
-        return 1.0 / (1.0 + math.pow(10, (rating_b - rating_a) / 400.0))
+        return 1.0 / (1.0 + math.exp((rating_b - rating_a) * _LN10_OVER_400))
 
     @staticmethod
     def calculate(winner_elo: float, loser_elo: float, k: int = 32) -> tuple[float, float]:
@@ -44,7 +117,7 @@ class EloCalculator:
         Total ELO is conserved.
         """
         expected_winner = EloCalculator.expected_score(winner_elo, loser_elo)
-        expected_loser = EloCalculator.expected_score(loser_elo, winner_elo)
+        expected_loser = 1.0 - expected_winner  # the two expectations are complementary
 
         new_winner = winner_elo + k * (1.0 - expected_winner)
         new_loser = loser_elo + k * (0.0 - expected_loser)
@@ -68,37 +141,33 @@ class EloCalculator:
                 p["elo_change"] = 0.0
             return participants
 
+        if n == 2:
+            # Head-to-head (the common case): a single pair, so skip the sort
+            # and the kernel's list building.
+            a, b = participants
+            if a["score"] < b["score"]:
+                a, b = b, a
+            outcome = 1.0 if a["score"] > b["score"] else 0.5
+            delta = k * (outcome - EloCalculator.expected_score(a["elo"], b["elo"]))
+            for p, total in ((a, delta), (b, -delta)):
+                change = round(total, 2)
+                p["elo_change"] = change
+                p["new_elo"] = round(p["elo"] + change, 2)
+            return participants
+
         # Sort by score descending
-        ranked = sorted(participants, key=lambda p: p["score"], reverse=True)
-
-        # Initialize changes
-        elo_changes = {p["bot_id"]: 0.0 for p in ranked}
-
-        # Pairwise comparisons — scale K by number of opponents
-        pair_k = k / (n - 1) if n > 1 else k
-        for i in range(n):
-            for j in range(i + 1, n):
-                a = ranked[i]
-                b = ranked[j]
-                # a has higher or equal rank (higher score)
-                expected_a = EloCalculator.expected_score(a["elo"], b["elo"])
-                expected_b = 1.0 - expected_a
-
-                if a["score"] > b["score"]:
-                    # a wins
-                    elo_changes[a["bot_id"]] += pair_k * (1.0 - expected_a)
-                    elo_changes[b["bot_id"]] += pair_k * (0.0 - expected_b)
-                elif a["score"] == b["score"]:
-                    # draw
-                    elo_changes[a["bot_id"]] += pair_k * (0.5 - expected_a)
-                    elo_changes[b["bot_id"]] += pair_k * (0.5 - expected_b)
-                else:
-                    # b wins (shouldn't happen since sorted, but be safe)
-                    elo_changes[a["bot_id"]] += pair_k * (0.0 - expected_a)
-                    elo_changes[b["bot_id"]] += pair_k * (1.0 - expected_b)
-
-        for p in participants:
-            change = round(elo_changes[p["bot_id"]], 2)
+        ranked = sorted(participants, key=_by_score, reverse=True)
+
+        # Flatten into parallel lists so the pair loop only touches floats,
+        # not dicts (the array layout a vectorized version would use).
+        changes = _ffa_changes(
+            [p["elo"] for p in ranked],
+            [p["score"] for p in ranked],
+            k / (n - 1),  # scale K by number of opponents
+        )
+
+        for p, total in zip(ranked, changes):
+            change = round(total, 2)
             p["elo_change"] = change
             p["new_elo"] = round(p["elo"] + change, 2)
 
@@ -130,29 +199,48 @@ class MatchMaker:
     def _get_db(self) -> Session:
         return self.db_factory()
 
-    def poll_queue(self) -> Optional[int]:
+    @contextmanager
+    def _session(self, db: Optional[Session] = None) -> Iterator[Session]:
+        """Use the caller's session if given (caller closes it), else a fresh one."""
+        if db is not None:
+            yield db
+            return
+        db = self._get_db()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def poll_queue(self, db: Optional[Session] = None) -> Optional[int]:
         """
         Check queue for waiting bots. If >= MIN_PLAYERS, create a match.
         Returns match_id if match created, None otherwise.
         """
-        db = self._get_db()
-        try:
-            waiting = (
-                db.query(QueueEntryDB)
-                .filter(QueueEntryDB.status == "waiting")
-                .order_by(QueueEntryDB.queued_at.asc())
-                .limit(MAX_PLAYERS)
-                .all()
-            )
+        with self._session(db) as db:
+            waiting = db.scalars(_WAITING_STMT).all()
 
             if len(waiting) < MIN_PLAYERS:
                 return None
 
-            # Create the match
+            # Claim the entries in the same transaction. The status guard makes
+            # the claim atomic: if another poller took any of them since our
+            # SELECT, fewer rows match and we back off until the next poll.
+            claimed = db.execute(
+                update(QueueEntryDB)
+                .where(
+                    QueueEntryDB.id.in_([e.id for e in waiting]),
+                    QueueEntryDB.status == "waiting",
+                )
+                .values(status="matched"),
+                execution_options={"synchronize_session": "evaluate"},
+            ).rowcount
+            if claimed != len(waiting):
+                db.rollback()
+                return None
+
+            # Create the match (commits the claim with it)
             match_id = self.create_match(db, waiting)
             return match_id
-        finally:
-            db.close()
 
     def create_match(self, db: Session, queue_entries: list[QueueEntryDB],
                      map_name: str = DEFAULT_MAP) -> int:
@@ -165,39 +253,42 @@ class MatchMaker:
         db.add(match)
         db.flush()  # get match.id
 
-        participants = []
+        # Current ELO of every queued bot, in one query
+        elos = dict(
+            db.query(BotDB.id, BotDB.elo)
+            .filter(BotDB.id.in_([e.bot_id for e in queue_entries]))
+            .all()
+        )
+
+        participant_rows = []
         for entry in queue_entries:
-            # Get bot's current ELO
-            bot = db.query(BotDB).filter(BotDB.id == entry.bot_id).first()
-            if not bot:
+            if entry.bot_id not in elos:
                 continue
-
-            participant = MatchParticipantDB(
-                match_id=match.id,
-                bot_id=entry.bot_id,
-                elo_before=bot.elo,
-            )
-            db.add(participant)
-            participants.append(participant)
+            participant_rows.append({
+                "match_id": match.id,
+                "bot_id": entry.bot_id,
+                "elo_before": elos[entry.bot_id],
+            })
 
             # Update queue status
             entry.status = "matched"
 
+        # One executemany INSERT instead of a unit-of-work flush per participant
+        db.bulk_insert_mappings(MatchParticipantDB, participant_rows)
+        match_id = match.id  # read before commit expires the instance
+        bot_ids = [e.bot_id for e in queue_entries]
         db.commit()
-        db.refresh(match)
 
-        logger.info(
-            f"Match {match.id} created: map={map_name}, "
-            f"bots={[e.bot_id for e in queue_entries]}"
-        )
+        logger.info("Match %s created: map=%s, bots=%s", match_id, map_name, bot_ids)
 
-        self._active_matches[match.id] = {
-            "match": match,
+        # Plain values only: holding the ORM instance here would pin it (and
+        # its session state) for the life of the match.
+        self._active_matches[match_id] = {
             "started_at": datetime.utcnow(),
-            "bot_ids": [e.bot_id for e in queue_entries],
+            "bot_ids": bot_ids,
         }
 
-        return match.id
+        return match_id
 
     def create_direct_match(
         self,
@@ -213,102 +304,85 @@ class MatchMaker:
         db.add(match)
         db.flush()
 
-        valid_bot_ids: list[int] = []
-        for bot_id in bot_ids:
-            bot = db.query(BotDB).filter(BotDB.id == bot_id).first()
-            if not bot:
-                continue
-            participant = MatchParticipantDB(
-                match_id=match.id,
-                bot_id=bot.id,
-                elo_before=bot.elo,
-            )
-            db.add(participant)
-            valid_bot_ids.append(bot.id)
-
+        elos = dict(db.query(BotDB.id, BotDB.elo).filter(BotDB.id.in_(bot_ids)).all())
+        valid_bot_ids = [bot_id for bot_id in bot_ids if bot_id in elos]
+        db.bulk_insert_mappings(MatchParticipantDB, [
+            {"match_id": match.id, "bot_id": bot_id, "elo_before": elos[bot_id]}
+            for bot_id in valid_bot_ids
+        ])
+        match_id = match.id
         db.commit()
-        db.refresh(match)
 
-        self._active_matches[match.id] = {
-            "match": match,
+        self._active_matches[match_id] = {
             "started_at": datetime.utcnow(),
             "bot_ids": valid_bot_ids,
         }
         logger.info(
             "Direct match %s created: map=%s, bots=%s",
-            match.id,
+            match_id,
             map_name,
             valid_bot_ids,
         )
-        return match.id
+        return match_id
 
     def collect_result(self, match_id: int, bot_id: int,
-                       kills: int, deaths: int, score: Optional[int] = None):
+                       kills: int, deaths: int, score: Optional[int] = None,
+                       db: Optional[Session] = None):
         """
         Record a single bot's results for a match.
-        Called when agent_runner POSTs to /api/internal/match/report.
+        Called when agent_runner POSTs to /api/internal/match/report;
+        pass the request's session as db to avoid opening another.
         """
-        db = self._get_db()
-        try:
-            participant = (
-                db.query(MatchParticipantDB)
-                .filter(
-                    MatchParticipantDB.match_id == match_id,
-                    MatchParticipantDB.bot_id == bot_id,
-                )
-                .first()
-            )
+        with self._session(db) as db:
+            participant = db.scalars(
+                _PARTICIPANT_STMT, {"match_id": match_id, "bot_id": bot_id}
+            ).first()
             if participant:
                 participant.kills = kills
                 participant.deaths = deaths
                 participant.score = score if score is not None else (kills - deaths)
                 db.commit()
                 logger.info(
-                    f"Match {match_id}: bot {bot_id} reported "
-                    f"K={kills} D={deaths} S={participant.score}"
+                    "Match %s: bot %s reported K=%s D=%s S=%s",
+                    match_id, bot_id, kills, deaths, participant.score,
                 )
-        finally:
-            db.close()
 
-    def finalize_match(self, match_id: int):
+    def finalize_match(self, match_id: int, db: Optional[Session] = None):
         """
         Finalize a match: calculate ELO for all participants,
         update BotDB stats, mark match as ended.
         """
-        db = self._get_db()
-        try:
-            match = db.query(MatchDB).filter(MatchDB.id == match_id).first()
+        with self._session(db) as db:
+            # Match and participants in one round-trip
+            match = db.get(MatchDB, match_id, options=[joinedload(MatchDB.participants)])
             if not match:
-                logger.error(f"Match {match_id} not found for finalization")
+                logger.error("Match %s not found for finalization", match_id)
                 return
 
-            participants = (
-                db.query(MatchParticipantDB)
-                .filter(MatchParticipantDB.match_id == match_id)
-                .all()
-            )
+            participants = match.participants
 
             if not participants:
-                logger.warning(f"Match {match_id}: no participants to finalize")
+                logger.warning("Match %s: no participants to finalize", match_id)
                 return
 
+            bots = {
+                b.id: b
+                for b in db.scalars(select(BotDB).where(BotDB.id.in_([p.bot_id for p in participants])))
+            }
+
             # Build participant data for ELO calculation
-            elo_data = []
-            for p in participants:
-                bot = db.query(BotDB).filter(BotDB.id == p.bot_id).first()
-                if bot:
-                    elo_data.append({
-                        "bot_id": p.bot_id,
-                        "elo": p.elo_before,
-                        "score": p.score,
-                    })
+            rated = [p for p in participants if p.bot_id in bots]
+            elo_data = [
+                {"bot_id": p.bot_id, "elo": p.elo_before, "score": p.score}
+                for p in rated
+            ]
 
             # Calculate ELO changes
             elo_results = EloCalculator.calculate_ffa(elo_data)
             elo_map = {r["bot_id"]: r for r in elo_results}
 
             # Determine winner (highest score)
-            winner_id = max(elo_data, key=lambda x: x["score"])["bot_id"] if elo_data else None
+            winner_id = max(rated, key=attrgetter("score")).bot_id if rated else None
             winner_name = None
 
             # Update participant records and bot stats
@@ -317,7 +391,7 @@ class MatchMaker:
                     result = elo_map[p.bot_id]
                     p.elo_after = result["new_elo"]
 
-                bot = db.query(BotDB).filter(BotDB.id == p.bot_id).first()
+                bot = bots.get(p.bot_id)
                 if bot:
                     bot.kills += p.kills
                     bot.deaths += p.deaths
@@ -334,27 +408,26 @@ class MatchMaker:
             match.ended_at = datetime.utcnow()
             match.winner = winner_name
 
-            # Clean up queue entries
-            for p in participants:
-                queue_entry = (
-                    db.query(QueueEntryDB)
-                    .filter(
-                        QueueEntryDB.bot_id == p.bot_id,
-                        QueueEntryDB.status.in_(["matched", "playing"]),
-                    )
-                    .first()
+            # Clean up queue entries in one UPDATE
+            db.execute(
+                update(QueueEntryDB)
+                .where(
+                    QueueEntryDB.bot_id.in_([p.bot_id for p in participants]),
+                    QueueEntryDB.status.in_(["matched", "playing"]),
                 )
-                if queue_entry:
-                    queue_entry.status = "done"
+                .values(status="done"),
+                execution_options={"synchronize_session": False},
+            )
 
             db.commit()
+            leaderboard_cache.invalidate()
 
             # Clean up active matches tracking
             self._active_matches.pop(match_id, None)
 
             logger.info(
-                f"Match {match_id} finalized: winner={winner_name}, "
-                f"participants={len(participants)}"
+                "Match %s finalized: winner=%s, participants=%s",
+                match_id, winner_name, len(participants),
             )
             return {
                 "match_id": match_id,
@@ -363,9 +436,6 @@ class MatchMaker:
                 "participant_count": len(participants),
             }
 
-        finally:
-            db.close()
-
     def _get_server_url(self) -> Optional[str]:
         """Get an available server URL for a new match."""
         if self.rcon_pool:
@@ -375,14 +445,13 @@ class MatchMaker:
                 host = server.get("ws_host", server.get("host", "localhost"))
                 port = server.get("ws_port", server.get("port", 27960))
                 return f"ws://{host}:{port}"
-        # Fallback to env var or default
-        urls = os.environ.get("GAME_SERVER_URLS", "ws://localhost:27960")
-        return urls.split(",")[0].strip()
+        # Fallback to GAME_SERVER_URLS or default
+        return FALLBACK_SERVER_URL
 
     def _get_bot_strategy(self, db: Session, bot_id: int) -> str:
         """Get the strategy path for a bot from the DB. Falls back to default."""
-        default = os.environ.get("DEFAULT_STRATEGY", "strategies/default.py")
-        bot = db.query(BotDB).filter(BotDB.id == bot_id).first()
+        default = DEFAULT_STRATEGY
+        bot = db.get(BotDB, bot_id)
         if not bot:
             return default
 
@@ -393,23 +462,29 @@ class MatchMaker:
             custom_name = strategy_name[7:]
             custom_path = f"custom_strategies/{bot.owner_id}_{custom_name}.py"
             if os.path.exists(custom_path):
-                logger.info(f"Bot {bot.name} (id={bot_id}): using custom strategy '{custom_name}' -> {custom_path}")
+                logger.info(
+                    "Bot %s (id=%s): using custom strategy '%s' -> %s",
+                    bot.name, bot_id, custom_name, custom_path,
+                )
                 return custom_path
             logger.warning(
-                f"Bot {bot.name} (id={bot_id}): custom strategy '{custom_name}' not found at {custom_path}, "
-                f"falling back to default"
+                "Bot %s (id=%s): custom strategy '%s' not found at %s, falling back to default",
+                bot.name, bot_id, custom_name, custom_path,
             )
             return default
 
         # Global strategies
-        strategy_path = f"strategies/{strategy_name}.py"
-        if os.path.exists(strategy_path):
-            logger.info(f"Bot {bot.name} (id={bot_id}): using strategy '{strategy_name}' -> {strategy_path}")
+        strategy_path = _global_strategy_path(strategy_name)
+        if strategy_path:
+            logger.info(
+                "Bot %s (id=%s): using strategy '%s' -> %s",
+                bot.name, bot_id, strategy_name, strategy_path,
+            )
             return strategy_path
 
         logger.warning(
-            f"Bot {bot.name} (id={bot_id}): strategy '{strategy_name}' not found at {strategy_path}, "
-            f"falling back to default"
+            "Bot %s (id=%s): strategy '%s' not found at strategies/%s.py, falling back to default",
+            bot.name, bot_id, strategy_name, strategy_name,
         )
         return default
 
@@ -422,13 +497,15 @@ class MatchMaker:
         try:
             server_url = self._get_server_url()
             if not server_url:
-                logger.error(f"Match {match_id}: no available server")
+                logger.error("Match %s: no available server", match_id)
                 return
 
-            # Build bot info list
+            # Build bot info list. The IN query also populates the session's
+            # identity map, so _get_bot_strategy's db.get() needs no SELECT.
+            bots = {b.id: b for b in db.query(BotDB).filter(BotDB.id.in_(bot_ids))}
             bots_info = []
             for bot_id in bot_ids:
-                bot = db.query(BotDB).filter(BotDB.id == bot_id).first()
+                bot = bots.get(bot_id)
                 if bot:
                     bots_info.append({
                         "bot_id": bot.id,
@@ -437,7 +514,7 @@ class MatchMaker:
                     })
 
             if not bots_info:
-                logger.error(f"Match {match_id}: no valid bots found")
+                logger.error("Match %s: no valid bots found", match_id)
                 return self.finalize_match(match_id)
 
             # Change map via RCON only if the server is on a different map.
@@ -456,11 +533,17 @@ class MatchMaker:
                                 current_map = line.split(":", 1)[1].strip()
                                 break
                         if current_map != map_name:
-                            logger.info(f"Match {match_id}: RCON map {map_name} on {sid} (was {current_map})")
+                            logger.info(
+                                "Match %s: RCON map %s on %s (was %s)",
+                                match_id, map_name, sid, current_map,
+                            )
                             self.rcon_pool.send_rcon(sid, f"map {map_name}")
                             await asyncio.sleep(3)
                         else:
-                            logger.info(f"Match {match_id}: server already on {map_name}, skipping map change")
+                            logger.info(
+                                "Match %s: server already on %s, skipping map change",
+                                match_id, map_name,
+                            )
                         break
 
             # Start telemetry recording
@@ -468,6 +551,10 @@ class MatchMaker:
                 rec_bots = [{"id": b["bot_id"], "name": b["bot_name"]} for b in bots_info]
                 self.telemetry_recorder.start_recording(match_id, rec_bots)
 
+            # Release the pooled connection (and SQLite read snapshot) for the
+            # length of the match; the session reconnects on next use.
+            db.close()
+
             # Launch all bots
             match_duration = duration if duration is not None else MATCH_DURATION
             self.process_manager.launch_match(
@@ -479,14 +566,14 @@ class MatchMaker:
 
             # Wait for all bots to finish
             status = await self.process_manager.wait_for_match(match_id)
-            logger.info(f"Match {match_id}: all bots finished — {status}")
+            logger.info("Match %s: all bots finished — %s", match_id, status)
 
             # Stop telemetry recording and write files
             if self.telemetry_recorder:
                 try:
                     await self.telemetry_recorder.stop_recording(match_id)
                 except Exception as e:
-                    logger.error(f"Match {match_id}: telemetry save error: {e}")
+                    logger.error("Match %s: telemetry save error: %s", match_id, e)
 
             # Finalize the match (ELO calculation)
             result = self.finalize_match(match_id)
@@ -496,7 +583,7 @@ class MatchMaker:
             return result
 
         except Exception as e:
-            logger.error(f"Match {match_id} process error: {e}")
+            logger.error("Match %s process error: %s", match_id, e)
             return None
         finally:
             db.close()
@@ -527,11 +614,14 @@ class MatchMaker:
         """Main matchmaker loop — runs as a background task."""
         self._running = True
         logger.info("Matchmaker started")
+        # One Session for the life of the loop; close() after each poll only
+        # returns its connection to the pool.
+        db = self._get_db()
         while self._running:
             try:
-                match_id = self.poll_queue()
+                match_id = self.poll_queue(db)
                 if match_id:
-                    logger.info(f"Match {match_id} created from queue")
+                    logger.info("Match %s created from queue", match_id)
 
                     # If we have a process manager, launch bots in background
                     if self.process_manager:
@@ -544,7 +634,9 @@ class MatchMaker:
                         )
 
             except Exception as e:
-                logger.error(f"Matchmaker error: {e}")
+                logger.error("Matchmaker error: %s", e)
+            finally:
+                db.close()
 
             await asyncio.sleep(QUEUE_POLL_INTERVAL)
 
@@ -1,10 +1,14 @@
+import json
+import logging
 import os
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
-from pydantic import BaseModel
-from sqlalchemy import Column, Integer, String, DateTime, Float, create_engine, inspect, text
-from sqlalchemy.orm import declarative_base, sessionmaker
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Column, Integer, String, DateTime, Float, Index, create_engine, event, exc, inspect, text
+from sqlalchemy.orm import declarative_base, relationship, sessionmaker
+
+logger = logging.getLogger("clawquake.models")
 
 # DB path: honour DATABASE_URL env var, or put in /app/data/ if that dir exists (Docker named volume)
 _db_dir = os.environ.get("DATABASE_DIR", "")
@@ -16,7 +20,44 @@ if _db_dir:
 else:
     DATABASE_URL = os.environ.get("DATABASE_URL", "sqlite:///./clawquake.db")
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# Connection pool: size for WORKERS x typical concurrent requests per worker.
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "40"))
+DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "1800"))  # seconds
+DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", "5"))  # seconds to wait for a connection
+# Compiled-statement cache entries per engine (SQLAlchemy default: 500)
+DB_QUERY_CACHE_SIZE = int(os.environ.get("DB_QUERY_CACHE_SIZE", "1200"))
+# Seconds a SQLite writer waits on a locked database before "database is locked"
+DB_BUSY_TIMEOUT = float(os.environ.get("DB_BUSY_TIMEOUT", "30"))
+
+_engine_kwargs = {"pool_pre_ping": True, "query_cache_size": DB_QUERY_CACHE_SIZE}
+if DATABASE_URL.startswith("sqlite"):
+    _engine_kwargs["connect_args"] = {"check_same_thread": False, "timeout": DB_BUSY_TIMEOUT}
+if ":memory:" not in DATABASE_URL:
+    # In-memory SQLite uses a single shared connection; pool sizing does not apply.
+    _engine_kwargs.update(
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_timeout=DB_POOL_TIMEOUT,
+    )
+engine = create_engine(DATABASE_URL, **_engine_kwargs)
+
+
+if engine.dialect.name == "sqlite" and ":memory:" not in DATABASE_URL:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _record):
+        # WAL lets readers (leaderboard, status polls) proceed during writes.
+        # synchronous=NORMAL is durable under WAL except on power loss, and
+        # skips the fsync per commit that dominates matchmaker write cost.
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-16384")  # 16 MiB page cache per pooled connection
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB memory-mapped reads
+        cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -41,7 +82,14 @@ class MatchDB(Base):
     started_at = Column(DateTime, default=datetime.utcnow)
     ended_at = Column(DateTime, nullable=True)
     winner = Column(String, nullable=True)
-    scores_json = Column(String, default="{}")
+    # Per-bot results live in match_participants (kills/deaths/score columns).
+    # The schema has no FK constraint, so the join is spelled out. Load it
+    # explicitly (joinedload / selectinload); API read queries use raiseload.
+    participants = relationship(
+        "MatchParticipantDB",
+        primaryjoin="MatchDB.id == foreign(MatchParticipantDB.match_id)",
+        viewonly=True,
+    )
 
 
 class BotDB(Base):
@@ -60,6 +108,26 @@ class BotDB(Base):
 
 # Pydantic schemas
 
+# Response models built from our own DB rows are trusted: the columns are
+# already typed, so they are constructed without validation (model_construct).
+# Request bodies (UserCreate, QueueJoin, MatchResultReport, ...) come from
+# clients and always go through normal validation.
+
+class _FromRow:
+    """Mixin for response models that can be built straight from an ORM row."""
+
+    @classmethod
+    def from_orm_row(cls, row, **overrides):
+        """model_construct() from row's same-named attributes; overrides win."""
+        values = {
+            name: getattr(row, name)
+            for name in cls.model_fields
+            if name not in overrides and hasattr(row, name)
+        }
+        values.update(overrides)
+        return cls.model_construct(**values)
+
+
 class UserCreate(BaseModel):
     username: str
     email: str
@@ -71,7 +139,7 @@ class UserLogin(BaseModel):
     password: str
 
 
-class UserResponse(BaseModel):
+class UserResponse(_FromRow, BaseModel):
     id: int
     username: str
     email: str
@@ -91,10 +159,9 @@ class MatchResponse(BaseModel):
     started_at: datetime
     ended_at: Optional[datetime]
     winner: Optional[str]
-    scores_json: str
 
 
-class BotResponse(BaseModel):
+class BotResponse(_FromRow, BaseModel):
     id: int
     name: str
     strategy: str = "default"
@@ -179,7 +246,7 @@ class MatchDetailResponse(BaseModel):
 class ApiKeyDB(Base):
     __tablename__ = "api_keys"
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, nullable=False, index=True)
+    user_id = Column(Integer, nullable=False)
     name = Column(String, nullable=False, default="default")
     key_hash = Column(String, nullable=False, unique=True, index=True)
     key_prefix = Column(String, nullable=False, default="cq_")
@@ -196,7 +263,7 @@ class ApiKeyCreate(BaseModel):
     expires_in_days: Optional[int] = None  # None = never expires
 
 
-class ApiKeyResponse(BaseModel):
+class ApiKeyResponse(_FromRow, BaseModel):
     id: int
     name: str
     key_prefix: str
@@ -284,7 +351,7 @@ class TournamentDB(Base):
 class TournamentParticipantDB(Base):
     __tablename__ = "tournament_participants"
     id = Column(Integer, primary_key=True, index=True)
-    tournament_id = Column(Integer, nullable=False, index=True) # FK tournaments.id
+    tournament_id = Column(Integer, nullable=False)  # FK tournaments.id
     bot_id = Column(Integer, nullable=False) # FK bots.id
     seed = Column(Integer, nullable=True)
     eliminated = Column(Integer, default=0) # boolean
@@ -334,6 +401,16 @@ class TournamentResponse(BaseModel):
     match_duration: int = 300
     frag_limit: Optional[int] = None
 
+# ── List serializers ────────────────────────────────────────────
+# Built once at import: constructing a TypeAdapter compiles a serializer,
+# which is far too expensive to repeat per request. List endpoints return
+# these bytes directly instead of re-validating through response_model.
+
+dump_api_key_list = TypeAdapter(list[ApiKeyResponse]).dump_json
+dump_agent_registration_list = TypeAdapter(list[AgentRegistrationResponse]).dump_json
+dump_tournament_list = TypeAdapter(list[TournamentResponse]).dump_json
+
+
 # ── Telemetry Recording Index (Claude — Session 8) ────────────
 
 class TelemetryRecordingDB(Base):
@@ -355,16 +432,36 @@ class OpponentProfileDB(Base):
     __tablename__ = "opponent_profiles"
     id = Column(Integer, primary_key=True, index=True)
     opponent_name = Column(String, unique=True, index=True, nullable=False)
-    weapon_counts = Column(String, default="{}") # JSON
-    damage_taken = Column(String, default="{}") # JSON
     engagement_range_avg = Column(Float, default=0.0)
     games_analyzed = Column(Integer, default=0)
     last_updated = Column(DateTime, default=datetime.utcnow)
     ttl_days = Column(Integer, default=30)
 
-# ── Create all tables (must be AFTER all model definitions) ───
-Base.metadata.create_all(bind=engine)
-
+class WeaponStatDB(Base):
+    """How often an opponent was seen using each weapon (one row per weapon)."""
+    __tablename__ = "weapon_stats"
+    opponent_id = Column(Integer, primary_key=True)  # FK opponent_profiles.id
+    weapon = Column(Integer, primary_key=True)  # weapon_t value
+    count = Column(Integer, nullable=False, default=0)
+
+# ── Query indexes ────────────────────────────────────────────
+# (sort column DESC, id) so leaderboard / match history ORDER BY ... LIMIT and
+# keyset cursors are index scans; (match_id, bot_id) serves match report
+# lookups and per-match participant lists, and enforces one row per bot;
+# (bot_id, status) serves the per-bot queue lookups in finalize/queue status;
+# (status, queued_at) serves the matchmaker's oldest-waiting poll and queue
+# positions without a sort; (tournament_id, bot_id) and (user_id, is_active)
+# cover the participant and active-key lookups and replace the single-column
+# tournament_id / user_id indexes.
+QUERY_INDEXES = (
+    Index("ix_bots_elo_id", BotDB.elo.desc(), BotDB.id),
+    Index("ix_matches_started_at_id", MatchDB.started_at.desc(), MatchDB.id),
+    Index("ix_mp_match_bot", MatchParticipantDB.match_id, MatchParticipantDB.bot_id, unique=True),
+    Index("ix_queue_bot_status", QueueEntryDB.bot_id, QueueEntryDB.status),
+    Index("ix_queue_status_queued", QueueEntryDB.status, QueueEntryDB.queued_at),
+    Index("ix_tp_tournament_bot", TournamentParticipantDB.tournament_id, TournamentParticipantDB.bot_id),
+    Index("ix_api_keys_user_active", ApiKeyDB.user_id, ApiKeyDB.is_active),
+)
 
 def _add_sqlite_column_if_missing(table_name: str, column_name: str, ddl: str):
     if engine.dialect.name != "sqlite":
@@ -379,8 +476,68 @@ def _add_sqlite_column_if_missing(table_name: str, column_name: str, ddl: str):
         conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {ddl}"))
 
 
-_add_sqlite_column_if_missing(
-    "tournaments",
-    "created_by_user_id",
-    "created_by_user_id INTEGER",
-)
+# ── Schema setup ────────────────────────────────────────────────
+
+def init_db():
+    """
+    Create tables, query indexes and late-added columns.
+
+    Called once at application startup rather than on import, so modules
+    (and tools) that only need the models never touch the database.
+    """
+    Base.metadata.create_all(bind=engine)
+    # create_all only builds indexes alongside new tables; add them to existing DBs too.
+    for index in QUERY_INDEXES:
+        try:
+            index.create(bind=engine, checkfirst=True)
+        except exc.IntegrityError:
+            logger.warning("Skipping index %s: existing rows violate its unique constraint", index.name)
+    _add_sqlite_column_if_missing(
+        "tournaments",
+        "created_by_user_id",
+        "created_by_user_id INTEGER",
+    )
+    _migrate_weapon_counts()
+
+
+def _migrate_weapon_counts():
+    """Copy legacy opponent_profiles.weapon_counts JSON into weapon_stats rows.
+
+    Older databases still carry the column; each blob is moved once and then
+    reset to '{}' so later startups skip it. Opponents that already have
+    weapon_stats rows keep them.
+    """
+    inspector = inspect(engine)
+    if "opponent_profiles" not in inspector.get_table_names():
+        return
+    columns = {col["name"] for col in inspector.get_columns("opponent_profiles")}
+    if "weapon_counts" not in columns:
+        return
+    with engine.begin() as conn:
+        legacy = conn.execute(text(
+            "SELECT id, weapon_counts FROM opponent_profiles "
+            "WHERE weapon_counts IS NOT NULL AND weapon_counts NOT IN ('', '{}')"
+        )).fetchall()
+        for opponent_id, blob in legacy:
+            try:
+                rows = [
+                    {"opponent_id": opponent_id, "weapon": int(weapon), "count": int(count)}
+                    for weapon, count in json.loads(blob).items()
+                ]
+            except (ValueError, TypeError, AttributeError):
+                logger.warning("Skipping unreadable weapon_counts for opponent %s", opponent_id)
+                continue
+            has_rows = conn.execute(
+                text("SELECT 1 FROM weapon_stats WHERE opponent_id = :id LIMIT 1"),
+                {"id": opponent_id},
+            ).first()
+            if rows and not has_rows:
+                conn.execute(
+                    text("INSERT INTO weapon_stats (opponent_id, weapon, count) "
+                         "VALUES (:opponent_id, :weapon, :count)"),
+                    rows,
+                )
+            conn.execute(
+                text("UPDATE opponent_profiles SET weapon_counts = '{}' WHERE id = :id"),
+                {"id": opponent_id},
+            )
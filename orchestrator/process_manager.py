@@ -31,6 +31,12 @@ AGENT_RUNNER_PATH = os.environ.get(
         _AGENT_RUNNER_CANDIDATES[0],
     ),
 )
+# When set, each bot's stdout/stderr goes straight to
+# BOT_LOG_DIR/bot_<match>_<bot>.log instead of the orchestrator's own output.
+BOT_LOG_DIR = os.environ.get("BOT_LOG_DIR")
+# pidfd_open (Linux 5.3+, Python 3.9+) lets the event loop wake on child exit
+# instead of polling every bot process on a timer.
+_HAS_PIDFD = hasattr(os, "pidfd_open")
 
 
 # ── Data Classes ─────────────────────────────────────────────────
@@ -45,6 +51,12 @@ class BotProcess:
     started_at: float = field(default_factory=time.time)
     finished: bool = False
     return_code: Optional[int] = None
+    pidfd: Optional[int] = field(default=None, repr=False)  # readable once the process exits
+
+    def close_pidfd(self):
+        if self.pidfd is not None:
+            os.close(self.pidfd)
+            self.pidfd = None
 
 
 @dataclass
@@ -56,6 +68,20 @@ class MatchProcessGroup:
     duration: int = DEFAULT_MATCH_DURATION
     server_id: Optional[str] = None
     finalized: bool = False
+    # Bots whose process has not exited yet: the poll loop's worklist. It is
+    # only rebuilt when a process exits, so steady-state polls allocate nothing.
+    running: list[BotProcess] = field(default_factory=list)
+
+    def __post_init__(self):
+        if not self.running:
+            self.running = [
+                bot_proc for bot_proc in self.bot_processes.values()
+                if bot_proc.process and not bot_proc.finished
+            ]
+
+    @property
+    def all_finished(self) -> bool:
+        return not self.running
 
 
 # ── Process Manager ──────────────────────────────────────────────
@@ -132,32 +158,52 @@ class BotProcessManager:
         cmd.extend(["--ws-url", ws_url])
 
         logger.info(
-            f"Launching bot {bot_name} (id={bot_id}) for match {match_id} "
-            f"on server {server_url} with strategy={strategy_path}"
+            "Launching bot %s (id=%s) for match %s on server %s with strategy=%s",
+            bot_name, bot_id, match_id, server_url, strategy_path,
         )
 
+        # Never PIPE: nobody reads it, and a full pipe would block the bot.
+        # The child writes to an inherited fd (docker logs) or its own log file.
+        log_file = None
+        if BOT_LOG_DIR:
+            os.makedirs(BOT_LOG_DIR, exist_ok=True)
+            log_file = open(os.path.join(BOT_LOG_DIR, f"bot_{match_id}_{bot_id}.log"), "ab")
+
         try:
             process = subprocess.Popen(
                 cmd,
-                stdout=None,   # inherit parent stdout → visible in docker logs
-                stderr=None,   # inherit parent stderr → visible in docker logs
+                stdout=log_file,  # None inherits parent stdout → visible in docker logs
+                stderr=subprocess.STDOUT if log_file else None,
                 # Start in a new process group so we can kill the whole group
                 preexec_fn=os.setsid if hasattr(os, "setsid") else None,
             )
         except FileNotFoundError:
             logger.error(
-                f"Failed to launch bot: agent_runner not found at {self.agent_runner_path}"
+                "Failed to launch bot: agent_runner not found at %s",
+                self.agent_runner_path,
             )
             raise
         except Exception as e:
-            logger.error(f"Failed to launch bot {bot_name}: {e}")
+            logger.error("Failed to launch bot %s: %s", bot_name, e)
             raise
+        finally:
+            if log_file is not None:
+                log_file.close()  # the child holds its own copy of the fd
+
+        # Opened once at spawn; wait_for_match sleeps on these instead of polling.
+        pidfd = None
+        if _HAS_PIDFD:
+            try:
+                pidfd = os.pidfd_open(process.pid)
+            except (OSError, TypeError):
+                pass  # this match falls back to interval polling
 
         bot_proc = BotProcess(
             match_id=match_id,
             bot_id=bot_id,
             bot_name=bot_name,
             process=process,
+            pidfd=pidfd,
         )
 
         # Track in match group
@@ -166,7 +212,9 @@ class BotProcessManager:
                 match_id=match_id,
                 duration=duration,
             )
-        self._matches[match_id].bot_processes[bot_id] = bot_proc
+        group = self._matches[match_id]
+        group.bot_processes[bot_id] = bot_proc
+        group.running.append(bot_proc)
 
         return bot_proc
 
@@ -201,11 +249,45 @@ class BotProcessManager:
 
         group = self._matches[match_id]
         group.server_id = server_url
-        logger.info(
-            f"Match {match_id}: launched {len(bots)} bots on {server_url}"
-        )
+        logger.info("Match %s: launched %s bots on %s", match_id, len(bots), server_url)
         return group
 
+    def _poll_group(self, group: MatchProcessGroup) -> bool:
+        """
+        Reap exited processes and return whether the whole match is done.
+
+        Only the group's running worklist is polled; a finished group has an
+        empty worklist and costs nothing.
+        """
+        exited = False
+        for bot_proc in group.running:
+            rc = bot_proc.process.poll()
+            if rc is None:
+                continue
+            exited = True
+            bot_proc.finished = True
+            bot_proc.return_code = rc
+            bot_proc.close_pidfd()
+            if rc != 0:
+                logger.warning(
+                    "Bot %s (match=%s) exited with code %s. (check docker logs for stderr)",
+                    bot_proc.bot_name, group.match_id, rc,
+                )
+        if exited:
+            group.running = [bot_proc for bot_proc in group.running if not bot_proc.finished]
+        return not group.running
+
+    @staticmethod
+    def _bot_statuses(group: MatchProcessGroup) -> dict:
+        return {
+            bot_id: {
+                "finished": bot_proc.finished,
+                "return_code": bot_proc.return_code,
+                "bot_name": bot_proc.bot_name,
+            }
+            for bot_id, bot_proc in group.bot_processes.items()
+        }
+
     def check_match(self, match_id: int) -> dict:
         """
         Check the status of all processes in a match.
@@ -217,29 +299,7 @@ class BotProcessManager:
             return {"all_finished": True, "bots": {}, "error": "Match not found"}
 
         group = self._matches[match_id]
-        result = {"all_finished": True, "bots": {}}
-
-        for bot_id, bot_proc in group.bot_processes.items():
-            if bot_proc.process and not bot_proc.finished:
-                rc = bot_proc.process.poll()
-                if rc is not None:
-                    bot_proc.finished = True
-                    bot_proc.return_code = rc
-                    if rc != 0:
-                        logger.warning(
-                            f"Bot {bot_proc.bot_name} (match={match_id}) exited with code {rc}. "
-                            f"(check docker logs for stderr)"
-                        )
-                else:
-                    result["all_finished"] = False
-
-            result["bots"][bot_id] = {
-                "finished": bot_proc.finished,
-                "return_code": bot_proc.return_code,
-                "bot_name": bot_proc.bot_name,
-            }
-
-        return result
+        return {"all_finished": self._poll_group(group), "bots": self._bot_statuses(group)}
 
     def is_match_timed_out(self, match_id: int) -> bool:
         """Check if a match has exceeded its duration + buffer."""
@@ -250,6 +310,34 @@ class BotProcessManager:
         elapsed = time.time() - group.started_at
         return elapsed > (group.duration + PROCESS_TIMEOUT_BUFFER)
 
+    @staticmethod
+    async def _wait_for_exit(group: MatchProcessGroup, timeout: float) -> bool:
+        """
+        Sleep until any running process in the group exits or timeout passes.
+
+        The pidfds opened at spawn are registered as readers on the event
+        loop (one epoll set for the whole match); a pidfd becomes readable
+        when its child exits. Returns False when any running bot has no
+        pidfd (old kernel, mocked process) or the loop cannot watch file
+        descriptors, so the caller falls back to interval polling.
+        """
+        if any(bot_proc.pidfd is None for bot_proc in group.running):
+            return False
+        loop = asyncio.get_running_loop()
+        exited = loop.create_future()
+        registered = []
+        try:
+            for bot_proc in group.running:
+                loop.add_reader(bot_proc.pidfd, lambda: exited.done() or exited.set_result(None))
+                registered.append(bot_proc.pidfd)
+            await asyncio.wait([exited], timeout=max(timeout, 0.0))
+        except NotImplementedError:
+            return False
+        finally:
+            for fd in registered:
+                loop.remove_reader(fd)
+        return True
+
     async def wait_for_match(
         self,
         match_id: int,
@@ -259,21 +347,25 @@ class BotProcessManager:
         Async wait for all processes in a match to complete.
         Force-kills if match times out.
 
+        Wakes as soon as a bot exits where pidfds are supported; otherwise
+        polls every ``poll_interval`` seconds.
+
         Returns:
             Final status dict from check_match()
         """
         while True:
-            status = self.check_match(match_id)
-
-            if status["all_finished"]:
-                return status
+            group = self._matches.get(match_id)
+            if group is None or self._poll_group(group):
+                return self.check_match(match_id)
 
             if self.is_match_timed_out(match_id):
-                logger.warning(f"Match {match_id} timed out, force-killing")
+                logger.warning("Match %s timed out, force-killing", match_id)
                 self.kill_match(match_id)
                 return self.check_match(match_id)
 
-            await asyncio.sleep(poll_interval)
+            deadline = group.started_at + group.duration + PROCESS_TIMEOUT_BUFFER
+            if not await self._wait_for_exit(group, max(deadline - time.time(), poll_interval)):
+                await asyncio.sleep(poll_interval)
 
     def kill_match(self, match_id: int):
         """Force-kill all processes in a match."""
@@ -281,50 +373,54 @@ class BotProcessManager:
             return
 
         group = self._matches[match_id]
-        for bot_id, bot_proc in group.bot_processes.items():
-            if bot_proc.process and not bot_proc.finished:
-                try:
-                    # Kill the entire process group
-                    if hasattr(os, "killpg"):
-                        os.killpg(os.getpgid(bot_proc.process.pid), signal.SIGTERM)
-                    else:
-                        bot_proc.process.terminate()
-                    logger.info(
-                        f"Match {match_id}: terminated bot {bot_proc.bot_name} "
-                        f"(pid={bot_proc.process.pid})"
-                    )
-                except ProcessLookupError:
-                    pass  # Already dead
-                except Exception as e:
-                    logger.error(
-                        f"Error killing bot {bot_proc.bot_name}: {e}"
-                    )
-                finally:
-                    bot_proc.finished = True
-                    bot_proc.return_code = -1
+        for bot_proc in group.running:
+            try:
+                # Kill the entire process group
+                if hasattr(os, "killpg"):
+                    os.killpg(os.getpgid(bot_proc.process.pid), signal.SIGTERM)
+                else:
+                    bot_proc.process.terminate()
+                logger.info(
+                    "Match %s: terminated bot %s (pid=%s)",
+                    match_id, bot_proc.bot_name, bot_proc.process.pid,
+                )
+            except ProcessLookupError:
+                pass  # Already dead
+            except Exception as e:
+                logger.error("Error killing bot %s: %s", bot_proc.bot_name, e)
+            finally:
+                bot_proc.finished = True
+                bot_proc.return_code = -1
+                bot_proc.close_pidfd()
+        group.running = []
 
     def kill_bot(self, match_id: int, bot_id: int):
         """Force-kill a single bot process."""
         if match_id not in self._matches:
             return
-        bot_proc = self._matches[match_id].bot_processes.get(bot_id)
+        group = self._matches[match_id]
+        bot_proc = group.bot_processes.get(bot_id)
         if bot_proc and bot_proc.process and not bot_proc.finished:
             try:
                 bot_proc.process.terminate()
                 bot_proc.finished = True
                 bot_proc.return_code = -1
+                bot_proc.close_pidfd()
+                group.running.remove(bot_proc)
             except Exception as e:
-                logger.error(f"Error killing bot {bot_id}: {e}")
+                logger.error("Error killing bot %s: %s", bot_id, e)
 
     def cleanup_match(self, match_id: int):
         """Remove a match from tracking after finalization."""
-        self._matches.pop(match_id, None)
+        group = self._matches.pop(match_id, None)
+        if group is not None:
+            for bot_proc in group.bot_processes.values():
+                bot_proc.close_pidfd()
 
     def active_matches(self) -> list[dict]:
         """Get status of all active matches."""
         result = []
         for match_id, group in self._matches.items():
-            status = self.check_match(match_id)
             elapsed = time.time() - group.started_at
             result.append({
                 "match_id": match_id,
@@ -332,15 +428,12 @@ class BotProcessManager:
                 "elapsed_seconds": round(elapsed, 1),
                 "duration": group.duration,
                 "bot_count": len(group.bot_processes),
-                "all_finished": status["all_finished"],
+                "all_finished": self._poll_group(group),
                 "finalized": group.finalized,
-                "bots": status["bots"],
+                "bots": self._bot_statuses(group),
             })
         return result
 
     def active_match_count(self) -> int:
         """Number of matches still running."""
-        return sum(
-            1 for m in self._matches.values()
-            if not self.check_match(m.match_id)["all_finished"]
-        )
+        return sum(1 for group in self._matches.values() if not self._poll_group(group))
@@ -16,12 +16,17 @@ Usage:
         ...
     ):
         ...
+
+The default store is in-process, so each worker enforces its own limits.
+Set REDIS_URL (needs the optional ``redis`` package) to share one sliding
+window per key across all workers.
 """
 
 import logging
 import os
 import time
-from collections import defaultdict
+import uuid
+from collections import OrderedDict, deque
 from typing import Optional
 
 from fastapi import HTTPException, Request
@@ -32,6 +37,7 @@ logger = logging.getLogger("clawquake.rate_limiter")
 
 DEFAULT_MAX_CALLS = int(os.environ.get("RATE_LIMIT_MAX_CALLS", "60"))
 DEFAULT_WINDOW = int(os.environ.get("RATE_LIMIT_WINDOW", "60"))  # seconds
+MAX_TRACKED_KEYS = int(os.environ.get("RATE_LIMIT_MAX_KEYS", "100000"))
 
 # Exempt paths that should never be rate-limited
 EXEMPT_PATHS = frozenset({
@@ -48,14 +54,36 @@ class SlidingWindowStore:
     """
     In-memory sliding-window rate limiter.
 
-    Each key tracks a list of timestamps. Expired entries are
-    pruned on every check call.
+    Each key tracks a deque of monotonic timestamps, oldest first.
+    Expired entries are popped from the left on every check call, so
+    pruning is amortized O(1) per request.
+
+    Keys are kept in least-recently-checked order. Each check drops idle
+    keys (every timestamp older than the longest window seen) from the
+    front, and at most ``max_keys`` keys are tracked, so one-off clients
+    cannot grow the store without bound.
 
-    For production at scale, swap for Redis + EVALSHA.
+    Limits are per process; see RedisSlidingWindowStore for multi-worker
+    deployments.
     """
 
-    def __init__(self):
-        self._windows: dict[str, list[float]] = defaultdict(list)
+    def __init__(self, max_keys: int = MAX_TRACKED_KEYS):
+        self._windows: OrderedDict[str, deque[float]] = OrderedDict()
+        self.max_keys = max_keys
+        self._max_window = 0.0
+
+    def _evict_idle(self, now: float):
+        """Drop least-recently-checked keys whose entries have all expired."""
+        cutoff = now - self._max_window
+        windows = self._windows
+        while windows:
+            key, timestamps = next(iter(windows.items()))
+            if timestamps and timestamps[-1] > cutoff:
+                break
+            del windows[key]
+
+    def __len__(self) -> int:
+        return len(self._windows)
 
     def check(self, key: str, max_calls: int, window: float) -> tuple[bool, dict]:
         """
@@ -68,10 +96,21 @@ class SlidingWindowStore:
         """
         now = time.monotonic()
         cutoff = now - window
+        if window > self._max_window:
+            self._max_window = window
+        self._evict_idle(now)
+
+        timestamps = self._windows.get(key)
+        if timestamps is None:
+            if len(self._windows) >= self.max_keys:
+                self._windows.popitem(last=False)
+            timestamps = self._windows[key] = deque()
+        else:
+            self._windows.move_to_end(key)
 
         # Prune expired entries
-        timestamps = self._windows[key]
-        timestamps[:] = [t for t in timestamps if t > cutoff]
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
 
         remaining = max(0, max_calls - len(timestamps))
         reset = round(timestamps[0] - cutoff, 1) if timestamps else 0.0
@@ -98,12 +137,84 @@ class SlidingWindowStore:
             self._windows.clear()
 
 
+class RedisSlidingWindowStore:
+    """
+    Redis-backed sliding window shared by every orchestrator worker.
+
+    Each key is a sorted set of request ids scored by arrival time (ms).
+    Pruning, counting and recording run in one Lua script, so a check is a
+    single atomic round-trip (EVALSHA, re-loaded automatically on NOSCRIPT).
+    """
+
+    KEY_PREFIX = "clawquake:rl:"
+
+    # KEYS[1] = window key; ARGV = now_ms, window_ms, max_calls, member
+    # Returns {allowed, count, reset_ms}.
+    _SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local n = redis.call('ZCARD', KEYS[1])
+if n >= tonumber(ARGV[3]) then
+    local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+    return {0, n, tonumber(oldest[2]) + window - now}
+end
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+redis.call('PEXPIRE', KEYS[1], window)
+return {1, n + 1, window}
+"""
+
+    def __init__(self, url: str):
+        import redis
+
+        self._errors = redis.RedisError
+        self.redis = redis.Redis.from_url(url)
+        self._check_script = self.redis.register_script(self._SCRIPT)
+
+    def check(self, key: str, max_calls: int, window: float) -> tuple[bool, dict]:
+        """Same contract as SlidingWindowStore.check."""
+        window_ms = int(window * 1000)
+        try:
+            allowed, count, reset_ms = self._check_script(
+                keys=[self.KEY_PREFIX + key],
+                args=[int(time.time() * 1000), window_ms, max_calls, uuid.uuid4().hex],
+            )
+        except self._errors as exc:
+            # Fail open: an unreachable Redis must not take the API down with it.
+            logger.warning("Rate limit check skipped, Redis unavailable: %s", exc)
+            return True, {"remaining": max_calls, "reset": 0.0, "limit": max_calls}
+        return bool(allowed), {
+            "remaining": max(0, max_calls - count),
+            "reset": round(reset_ms / 1000, 1),
+            "limit": max_calls,
+        }
+
+    def clear(self, key: Optional[str] = None):
+        """Clear one key or all keys (useful for testing)."""
+        if key:
+            self.redis.delete(self.KEY_PREFIX + key)
+        else:
+            for redis_key in self.redis.scan_iter(match=self.KEY_PREFIX + "*"):
+                self.redis.delete(redis_key)
+
+
+def create_store():
+    """Pick the Redis store when REDIS_URL is set, otherwise the in-memory one."""
+    url = os.environ.get("REDIS_URL")
+    if url:
+        try:
+            return RedisSlidingWindowStore(url)
+        except ImportError:
+            logger.warning("REDIS_URL is set but the redis package is missing; using in-memory rate limits")
+    return SlidingWindowStore()
+
+
 # ── Global store instance ─────────────────────────────────────
 
-_store = SlidingWindowStore()
+_store = create_store()
 
 
-def get_store() -> SlidingWindowStore:
+def get_store():
     """Get the global rate-limit store (inject in tests)."""
     return _store
 
@@ -153,8 +264,8 @@ class RateLimit:
 
         if not allowed:
             logger.warning(
-                f"Rate limit exceeded: {key} "
-                f"(limit={info['limit']}, reset_in={info['reset']}s)"
+                "Rate limit exceeded: %s (limit=%s, reset_in=%ss)",
+                key, info['limit'], info['reset'],
             )
             raise HTTPException(
                 status_code=429,
@@ -205,8 +316,8 @@ class GlobalRateLimit:
 
         if not allowed:
             logger.warning(
-                f"Global rate limit exceeded: {client_ip} "
-                f"(limit={info['limit']}, reset_in={info['reset']}s)"
+                "Global rate limit exceeded: %s (limit=%s, reset_in=%ss)",
+                client_ip, info['limit'], info['reset'],
             )
             raise HTTPException(
                 status_code=429,
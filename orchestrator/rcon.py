@@ -3,9 +3,12 @@ Quake 3 RCON client for communicating with the game server.
 Sends commands and parses responses over UDP.
 """
 
+import asyncio
 import socket
 import os
 import logging
+import threading
+from typing import Optional
 
 logger = logging.getLogger("clawquake.rcon")
 
@@ -15,46 +18,159 @@ if not RCON_PASSWORD:
 GAME_SERVER_HOST = os.environ.get("GAME_SERVER_HOST", "gameserver")
 GAME_SERVER_PORT = int(os.environ.get("GAME_SERVER_PORT", "27960"))
 
+# Out-of-band packet headers, encoded once; only the command varies per call.
+_RCON_PREFIX = b"\xff\xff\xff\xffrcon " + RCON_PASSWORD.encode("ascii") + b" "
+_GETSTATUS = b"\xff\xff\xff\xffgetstatus"
+
+
+# ── Reused RCON socket ───────────────────────────────────────────
+# send_rcon keeps one UDP socket and the resolved server address across
+# calls instead of a socket() + DNS lookup + close() per command. RCON is
+# strictly request/response, so calls are serialized by a lock.
+
+_rcon_lock = threading.Lock()
+_rcon_sock: Optional[socket.socket] = None
+_rcon_target: Optional[tuple] = None  # ((host, port), resolved sockaddr)
+_rcon_stale = False  # a reply may still be in flight from a timed-out call
+
+
+def _drop_rcon_socket():
+    global _rcon_sock, _rcon_target, _rcon_stale
+    if _rcon_sock is not None:
+        _rcon_sock.close()
+    _rcon_sock = _rcon_target = None
+    _rcon_stale = False
+
+
+def _rcon_socket() -> tuple[socket.socket, tuple]:
+    """The shared socket and server address, (re)created if the target changed."""
+    global _rcon_sock, _rcon_target
+    key = (GAME_SERVER_HOST, GAME_SERVER_PORT)
+    if _rcon_sock is None or _rcon_target[0] != key:
+        _drop_rcon_socket()
+        family, _, _, _, sockaddr = socket.getaddrinfo(*key, type=socket.SOCK_DGRAM)[0]
+        _rcon_sock = socket.socket(family, socket.SOCK_DGRAM)
+        _rcon_target = (key, sockaddr)
+    return _rcon_sock, _rcon_target[1]
+
+
+def _discard_late_replies(sock: socket.socket):
+    """Drop replies to earlier timed-out commands so they aren't read as ours."""
+    sock.settimeout(0)
+    try:
+        while True:
+            sock.recvfrom(4096)
+    except (BlockingIOError, socket.timeout):
+        pass
+
 
 def send_rcon(command: str, timeout: float = 2.0) -> str:
     """Send an RCON command to the Q3 server and return the response."""
-    packet = b"\xff\xff\xff\xff" + f"rcon {RCON_PASSWORD} {command}".encode("ascii")
+    global _rcon_stale
+    packet = _RCON_PREFIX + command.encode("ascii")
+
+    with _rcon_lock:
+        try:
+            sock, addr = _rcon_socket()
+            if _rcon_stale:
+                _discard_late_replies(sock)
+                _rcon_stale = False
+            sock.settimeout(timeout)
+            sock.sendto(packet, addr)
+            data, _ = sock.recvfrom(4096)
+            # Strip the Q3 response header (0xffffffff + "print\n")
+            response = data[4:].decode("ascii", errors="replace")
+            if response.startswith("print\n"):
+                response = response[6:]
+            return response.strip()
+        except socket.timeout:
+            _rcon_stale = True
+            return ""
+        except OSError as exc:
+            logger.warning(
+                "RCON send failed for %s:%s: %s",
+                GAME_SERVER_HOST,
+                GAME_SERVER_PORT,
+                exc,
+            )
+            _drop_rcon_socket()
+            return ""
+
+
+def send_rcon_many(commands: list[str], timeout: float = 2.0) -> str:
+    """
+    Run several commands in one RCON packet ("cmd1; cmd2; ...").
+
+    The server splits the line on ';' (outside quotes) and executes each
+    command in order, so N commands cost one round-trip. Only the first
+    reply datagram is returned: output from later commands, including
+    their errors, is discarded before the next command. Commands must not
+    contain ';', '"' or newlines themselves; callers validate any
+    user-supplied names before building them.
+    """
+    global _rcon_stale
+    if not commands:
+        return ""
+    if any(ch in command for command in commands for ch in ';"\n'):
+        raise ValueError("RCON commands must not contain ';', '\"' or newlines")
+    response = send_rcon("; ".join(commands), timeout=timeout)
+    if len(commands) > 1:
+        with _rcon_lock:
+            _rcon_stale = True
+    return response
+
 
+def get_server_status(timeout: float = 2.0) -> dict:
+    """Query server status via getstatus packet (no RCON needed)."""
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     sock.settimeout(timeout)
     try:
-        sock.sendto(packet, (GAME_SERVER_HOST, GAME_SERVER_PORT))
-        data, _ = sock.recvfrom(4096)
-        # Strip the Q3 response header (0xffffffff + "print\n")
-        response = data[4:].decode("ascii", errors="replace")
-        if response.startswith("print\n"):
-            response = response[6:]
-        return response.strip()
+        sock.sendto(_GETSTATUS, (GAME_SERVER_HOST, GAME_SERVER_PORT))
+        data, _ = sock.recvfrom(8192)
+        return _parse_status_response(data)
     except socket.timeout:
-        return ""
+        return {"online": False, "players": [], "info": {}}
     except OSError as exc:
         logger.warning(
-            "RCON send failed for %s:%s: %s",
+            "Status probe failed for %s:%s: %s",
             GAME_SERVER_HOST,
             GAME_SERVER_PORT,
             exc,
         )
-        return ""
+        return {"online": False, "players": [], "info": {}}
     finally:
         sock.close()
 
 
-def get_server_status(timeout: float = 2.0) -> dict:
-    """Query server status via getstatus packet (no RCON needed)."""
-    packet = b"\xff\xff\xff\xff" + b"getstatus"
+class _StatusProtocol(asyncio.DatagramProtocol):
+    """Resolves a future with the first datagram received."""
 
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    sock.settimeout(timeout)
+    def __init__(self, future: asyncio.Future):
+        self.future = future
+
+    def datagram_received(self, data, addr):
+        if not self.future.done():
+            self.future.set_result(data)
+
+    def error_received(self, exc):
+        if not self.future.done():
+            self.future.set_exception(exc)
+
+
+async def get_server_status_async(timeout: float = 2.0) -> dict:
+    """Event-loop version of get_server_status: no blocking socket, no worker thread."""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    transport = None
     try:
-        sock.sendto(packet, (GAME_SERVER_HOST, GAME_SERVER_PORT))
-        data, _ = sock.recvfrom(8192)
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: _StatusProtocol(future),
+            remote_addr=(GAME_SERVER_HOST, GAME_SERVER_PORT),
+        )
+        transport.sendto(_GETSTATUS)
+        data = await asyncio.wait_for(future, timeout=timeout)
         return _parse_status_response(data)
-    except socket.timeout:
+    except asyncio.TimeoutError:
         return {"online": False, "players": [], "info": {}}
     except OSError as exc:
         logger.warning(
@@ -65,7 +181,8 @@ def get_server_status(timeout: float = 2.0) -> dict:
         )
         return {"online": False, "players": [], "info": {}}
     finally:
-        sock.close()
+        if transport is not None:
+            transport.close()
 
 
 def _parse_status_response(data: bytes) -> dict:
@@ -80,18 +197,18 @@ def _parse_status_response(data: bytes) -> dict:
 
     # First line: "statusResponse" header
     # Second line: backslash-delimited server info
-    info_line = lines[1] if lines[0].startswith("statusResponse") else lines[0]
-    parts = info_line.split("\\")
-    # Skip first empty element from leading backslash
-    for i in range(1, len(parts) - 1, 2):
-        result["info"][parts[i]] = parts[i + 1]
+    info_index = 1 if lines[0].startswith("statusResponse") else 0
+    parts = lines[info_index].split("\\")
+    # parts[0] is the empty string before the leading backslash; pair the
+    # rest as key/value (a trailing key without a value is dropped)
+    result["info"] = dict(zip(parts[1::2], parts[2::2]))
 
     # Remaining lines: player data "score ping name"
-    player_start = 2 if lines[0].startswith("statusResponse") else 1
-    for line in lines[player_start:]:
-        tokens = line.strip().split()
+    players = result["players"]
+    for line in lines[info_index + 1:]:
+        tokens = line.split()
         if len(tokens) >= 3:
-            result["players"].append({
+            players.append({
                 "score": int(tokens[0]),
                 "ping": int(tokens[1]),
                 "name": " ".join(tokens[2:]).strip('"'),
@@ -11,6 +11,8 @@ from typing import Optional
 
 logger = logging.getLogger("clawquake.rcon_pool")
 
+_GETSTATUS = b"\xff\xff\xff\xffgetstatus"
+
 
 class RconPool:
     """
@@ -24,6 +26,11 @@ class RconPool:
         """
         self.servers = {s["id"]: s for s in servers}
         self._busy: set[str] = set()
+        # "\xff\xff\xff\xffrcon <password> " per server, encoded once
+        self._rcon_prefixes = {
+            s["id"]: b"\xff\xff\xff\xffrcon " + s["rcon_password"].encode("ascii") + b" "
+            for s in servers
+        }
 
     def get_available_server(self) -> Optional[dict]:
         """Find a server that is not currently busy."""
@@ -35,12 +42,12 @@ class RconPool:
     def mark_busy(self, server_id: str):
         """Mark a server as hosting an active match."""
         self._busy.add(server_id)
-        logger.info(f"Server {server_id} marked busy")
+        logger.info("Server %s marked busy", server_id)
 
     def mark_free(self, server_id: str):
         """Mark a server as available again."""
         self._busy.discard(server_id)
-        logger.info(f"Server {server_id} marked free")
+        logger.info("Server %s marked free", server_id)
 
     def is_busy(self, server_id: str) -> bool:
         return server_id in self._busy
@@ -52,13 +59,10 @@ class RconPool:
         """Send an RCON command to a specific server."""
         server = self.servers.get(server_id)
         if not server:
-            logger.error(f"Unknown server: {server_id}")
+            logger.error("Unknown server: %s", server_id)
             return ""
 
-        packet = (
-            b"\xff\xff\xff\xff"
-            + f"rcon {server['rcon_password']} {command}".encode("ascii")
-        )
+        packet = self._rcon_prefixes[server_id] + command.encode("ascii")
 
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.settimeout(timeout)
@@ -80,12 +84,10 @@ class RconPool:
         if not server:
             return {"online": False, "players": [], "info": {}}
 
-        packet = b"\xff\xff\xff\xff" + b"getstatus"
-
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.settimeout(timeout)
         try:
-            sock.sendto(packet, (server["host"], server["port"]))
+            sock.sendto(_GETSTATUS, (server["host"], server["port"]))
             data, _ = sock.recvfrom(8192)
             return self._parse_status(data)
         except socket.timeout:
@@ -103,16 +105,15 @@ class RconPool:
         if len(lines) < 2:
             return result
 
-        info_line = lines[1] if lines[0].startswith("statusResponse") else lines[0]
-        parts = info_line.split("\\")
-        for i in range(1, len(parts) - 1, 2):
-            result["info"][parts[i]] = parts[i + 1]
+        info_index = 1 if lines[0].startswith("statusResponse") else 0
+        parts = lines[info_index].split("\\")
+        result["info"] = dict(zip(parts[1::2], parts[2::2]))
 
-        player_start = 2 if lines[0].startswith("statusResponse") else 1
-        for line in lines[player_start:]:
-            tokens = line.strip().split()
+        players = result["players"]
+        for line in lines[info_index + 1:]:
+            tokens = line.split()
             if len(tokens) >= 3:
-                result["players"].append({
+                players.append({
                     "score": int(tokens[0]),
                     "ping": int(tokens[1]),
                     "name": " ".join(tokens[2:]).strip('"'),
@@ -0,0 +1,193 @@
+"""
+Coalesces match result reports into batched transactions.
+
+At round end every bot's agent_runner reports within a few milliseconds of
+the others. Instead of one UPDATE + COMMIT (and fsync) per report, reports
+that arrive within REPORT_BATCH_WINDOW are written in a single transaction
+with one UPDATE ... FROM (derived table) RETURNING statement (executemany on
+databases without UPDATE FROM). Each caller still waits for its own report
+to be committed, so the HTTP response keeps its meaning.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import defaultdict
+from contextlib import suppress
+from dataclasses import dataclass, field
+
+from sqlalchemy import Integer, bindparam, literal, select, union_all, update
+from sqlalchemy.orm import Session
+
+from models import MatchParticipantDB
+
+logger = logging.getLogger("clawquake.report_batcher")
+
+REPORT_BATCH_WINDOW = 0.05  # seconds to linger after the first report
+REPORT_BATCH_MAX = 32
+
+_participants = MatchParticipantDB.__table__
+_UPDATE_PARTICIPANT = (
+    update(_participants)
+    .where(
+        _participants.c.match_id == bindparam("p_match_id"),
+        _participants.c.bot_id == bindparam("p_bot_id"),
+    )
+    .values(
+        kills=bindparam("p_kills"),
+        deaths=bindparam("p_deaths"),
+        score=bindparam("p_score"),
+    )
+)
+
+
+def _update_from_values(reports: list["_PendingReport"]):
+    """
+    One statement for the whole batch:
+
+        UPDATE match_participants SET kills=v.kills, ...
+        FROM (SELECT :m AS match_id, ... UNION ALL ...) AS v
+        WHERE match_id=v.match_id AND bot_id=v.bot_id
+        RETURNING match_id, bot_id
+
+    A UNION ALL derived table is used rather than a VALUES list because
+    SQLite cannot name VALUES columns in the FROM clause.
+    """
+    v = union_all(*(
+        select(
+            literal(r.match_id, Integer).label("match_id"),
+            literal(r.bot_id, Integer).label("bot_id"),
+            literal(r.kills, Integer).label("kills"),
+            literal(r.deaths, Integer).label("deaths"),
+        )
+        for r in reports
+    )).subquery("v")
+    return (
+        update(_participants)
+        .where(_participants.c.match_id == v.c.match_id, _participants.c.bot_id == v.c.bot_id)
+        .values(kills=v.c.kills, deaths=v.c.deaths, score=v.c.kills - v.c.deaths)
+        .returning(_participants.c.match_id, _participants.c.bot_id)
+    )
+
+
+def _supports_update_from(bind) -> bool:
+    dialect = bind.dialect
+    if dialect.name == "sqlite":
+        # UPDATE ... FROM needs 3.33, RETURNING needs 3.35
+        return dialect.dbapi.sqlite_version_info >= (3, 35)
+    return dialect.name == "postgresql"
+
+
+@dataclass
+class _PendingReport:
+    bind: object
+    match_id: int
+    bot_id: int
+    kills: int
+    deaths: int
+    future: asyncio.Future = field(repr=False)
+
+
+def apply_reports(bind, reports: list[_PendingReport]) -> list[bool]:
+    """Write a batch in one transaction; returns whether each report matched a participant."""
+    # The last report per participant wins, as it would with sequential commits.
+    latest = {(r.match_id, r.bot_id): r for r in reports}
+    with Session(bind=bind) as db:
+        if _supports_update_from(bind):
+            updated = set(map(tuple, db.connection().execute(_update_from_values(list(latest.values())))))
+        else:
+            rows = (
+                db.query(MatchParticipantDB.match_id, MatchParticipantDB.bot_id)
+                .filter(
+                    MatchParticipantDB.match_id.in_({key[0] for key in latest}),
+                    MatchParticipantDB.bot_id.in_({key[1] for key in latest}),
+                )
+                .all()
+            )
+            updated = {tuple(row) for row in rows} & latest.keys()
+            if updated:
+                db.connection().execute(_UPDATE_PARTICIPANT, [
+                    {
+                        "p_match_id": r.match_id,
+                        "p_bot_id": r.bot_id,
+                        "p_kills": r.kills,
+                        "p_deaths": r.deaths,
+                        "p_score": r.kills - r.deaths,
+                    }
+                    for key, r in latest.items() if key in updated
+                ])
+        db.commit()
+    return [(r.match_id, r.bot_id) in updated for r in reports]
+
+
+class MatchReportBatcher:
+    """Single consumer task that drains reports in windows of REPORT_BATCH_WINDOW."""
+
+    def __init__(self, window: float = REPORT_BATCH_WINDOW, max_batch: int = REPORT_BATCH_MAX):
+        self.window = window
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue[_PendingReport] | None = None
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _ensure_worker(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._task is None or self._task.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run())
+
+    async def submit(self, db: Session, match_id: int, bot_id: int, kills: int, deaths: int) -> bool:
+        """Queue a report and wait until its batch commits. False if no such participant."""
+        self._ensure_worker()
+        report = _PendingReport(
+            bind=db.get_bind(),
+            match_id=match_id,
+            bot_id=bot_id,
+            kills=kills,
+            deaths=deaths,
+            future=self._loop.create_future(),
+        )
+        self._queue.put_nowait(report)
+        return await report.future
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _collect(self) -> list[_PendingReport]:
+        batch = [await self._queue.get()]
+        deadline = self._loop.time() + self.window
+        while len(batch) < self.max_batch:
+            remaining = deadline - self._loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            # Requests served by different engines (e.g. test overrides) never share a transaction.
+            by_bind: dict[object, list[_PendingReport]] = defaultdict(list)
+            for report in batch:
+                by_bind[report.bind].append(report)
+            for bind, reports in by_bind.items():
+                try:
+                    found = await asyncio.to_thread(apply_reports, bind, reports)
+                except Exception as exc:
+                    logger.exception("Failed to write %d match reports", len(reports))
+                    for report in reports:
+                        if not report.future.done():
+                            report.future.set_exception(exc)
+                    continue
+                for report, ok in zip(reports, found):
+                    if not report.future.done():
+                        report.future.set_result(ok)
@@ -2,7 +2,8 @@ from datetime import datetime, timedelta
 from urllib.parse import urlencode
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from sqlalchemy.orm import Session
+from fastapi.responses import Response
+from sqlalchemy.orm import Session, raiseload
 
 from agent_auth import get_agent_registration_by_key, mark_agent_registration_used
 from api_keys import generate_api_key, hash_api_key
@@ -14,6 +15,7 @@ from models import (
     AgentRegistrationResponse,
     BotDB,
     UserDB,
+    dump_agent_registration_list,
 )
 
 router = APIRouter(tags=["agents"])
@@ -94,11 +96,20 @@ def list_agent_registrations(
     db: Session = Depends(get_db),
 ):
     _get_owned_bot(db, user.id, bot_id)
-    query = db.query(AgentRegistrationDB).filter(AgentRegistrationDB.bot_id == bot_id)
+    query = (
+        db.query(AgentRegistrationDB)
+        .options(raiseload("*"))
+        .filter(AgentRegistrationDB.bot_id == bot_id)
+    )
     if not include_revoked:
         query = query.filter(AgentRegistrationDB.status == "active")
     registrations = query.order_by(AgentRegistrationDB.created_at.desc()).all()
-    return [_registration_response(registration) for registration in registrations]
+    return Response(
+        content=dump_agent_registration_list(
+            [_registration_response(registration) for registration in registrations]
+        ),
+        media_type="application/json",
+    )
 
 
 @router.delete("/api/agent-registrations/{registration_id}")
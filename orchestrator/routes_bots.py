@@ -3,10 +3,13 @@ import re
 
 from fastapi import APIRouter, Body, Depends, HTTPException
 from pydantic import BaseModel
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from auth import get_db, get_current_user_or_apikey
 from models import BotDB, BotRegister, BotResponse, BotUpdate, UserDB
+from schemas_fast import json_response
+import leaderboard_cache
 
 router = APIRouter(tags=["bots"])
 
@@ -246,17 +249,9 @@ def register_bot(
     db.add(bot)
     db.commit()
     db.refresh(bot)
+    leaderboard_cache.invalidate()
 
-    return BotResponse(
-        id=bot.id,
-        name=bot.name,
-        strategy=bot.strategy,
-        elo=bot.elo,
-        wins=bot.wins,
-        losses=bot.losses,
-        kills=bot.kills,
-        deaths=bot.deaths,
-    )
+    return BotResponse.from_orm_row(bot, strategy=bot.strategy or "default")
 
 
 @router.get("/api/bots", response_model=list[BotResponse])
@@ -264,25 +259,16 @@ def list_bots(
     user: UserDB = Depends(get_current_user_or_apikey),
     db: Session = Depends(get_db),
 ):
-    bots = (
-        db.query(BotDB)
-        .filter(BotDB.owner_id == user.id)
-        .order_by(BotDB.created_at.desc())
-        .all()
-    )
-    return [
-        BotResponse(
-            id=bot.id,
-            name=bot.name,
-            strategy=bot.strategy or "default",
-            elo=bot.elo,
-            wins=bot.wins,
-            losses=bot.losses,
-            kills=bot.kills,
-            deaths=bot.deaths,
+    rows = db.execute(
+        select(
+            BotDB.id, BotDB.name,
+            func.coalesce(BotDB.strategy, "default").label("strategy"),
+            BotDB.elo, BotDB.wins, BotDB.losses, BotDB.kills, BotDB.deaths,
         )
-        for bot in bots
-    ]
+        .where(BotDB.owner_id == user.id)
+        .order_by(BotDB.created_at.desc())
+    ).all()
+    return json_response([row._asdict() for row in rows])
 
 
 @router.get("/api/bots/{bot_id}", response_model=BotResponse)
@@ -297,16 +283,7 @@ def bot_details(
     if bot.owner_id != user.id:
         raise HTTPException(status_code=403, detail="Forbidden")
 
-    return BotResponse(
-        id=bot.id,
-        name=bot.name,
-        strategy=bot.strategy or "default",
-        elo=bot.elo,
-        wins=bot.wins,
-        losses=bot.losses,
-        kills=bot.kills,
-        deaths=bot.deaths,
-    )
+    return BotResponse.from_orm_row(bot, strategy=bot.strategy or "default")
 
 
 @router.patch("/api/bots/{bot_id}", response_model=BotResponse)
@@ -335,13 +312,4 @@ def update_bot(
     db.commit()
     db.refresh(bot)
 
-    return BotResponse(
-        id=bot.id,
-        name=bot.name,
-        strategy=bot.strategy or "default",
-        elo=bot.elo,
-        wins=bot.wins,
-        losses=bot.losses,
-        kills=bot.kills,
-        deaths=bot.deaths,
-    )
+    return BotResponse.from_orm_row(bot, strategy=bot.strategy or "default")
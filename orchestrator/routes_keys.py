@@ -1,11 +1,12 @@
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi.responses import Response
+from sqlalchemy.orm import Session, raiseload
 
-from api_keys import generate_api_key, hash_api_key
+from api_keys import generate_api_key, hash_api_key, invalidate_api_key
 from auth import get_current_user, get_db
-from models import ApiKeyCreate, ApiKeyCreated, ApiKeyDB, ApiKeyResponse, UserDB
+from models import ApiKeyCreate, ApiKeyCreated, ApiKeyDB, ApiKeyResponse, UserDB, dump_api_key_list
 
 router = APIRouter(tags=["keys"])
 
@@ -49,22 +50,18 @@ def list_api_keys(
 ):
     keys = (
         db.query(ApiKeyDB)
+        .options(raiseload("*"))
         .filter(ApiKeyDB.user_id == user.id, ApiKeyDB.is_active == 1)
         .order_by(ApiKeyDB.created_at.desc())
         .all()
     )
-    return [
-        ApiKeyResponse(
-            id=key.id,
-            name=key.name,
-            key_prefix=key.key_prefix,
-            created_at=key.created_at,
-            last_used=key.last_used,
-            is_active=bool(key.is_active),
-            expires_at=getattr(key, "expires_at", None),
-        )
-        for key in keys
-    ]
+    return Response(
+        content=dump_api_key_list([
+            ApiKeyResponse.from_orm_row(key, is_active=bool(key.is_active))
+            for key in keys
+        ]),
+        media_type="application/json",
+    )
 
 
 @router.delete("/api/keys/{key_id}")
@@ -84,6 +81,7 @@ def delete_api_key(
     key.is_active = 0
     key.last_used = datetime.utcnow()
     db.commit()
+    invalidate_api_key(key.key_hash)
     return {"deleted": True}
 
 
@@ -147,6 +145,7 @@ def rotate_api_key(
     db.add(new_key)
     db.commit()
     db.refresh(new_key)
+    invalidate_api_key(old_key.key_hash)
 
     return ApiKeyCreated(
         id=new_key.id,
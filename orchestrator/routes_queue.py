@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 
 from auth import get_current_user_or_apikey, get_db
 from models import BotDB, QueueEntryDB, QueueJoin, QueueStatus, UserDB
@@ -44,6 +44,7 @@ def join_queue(
 
     waiting_entries = (
         db.query(QueueEntryDB)
+        .options(raiseload("*"))
         .filter(QueueEntryDB.status == "waiting")
         .order_by(QueueEntryDB.queued_at.asc())
         .all()
@@ -0,0 +1,35 @@
+"""
+Direct JSON encoding for read-heavy endpoints.
+
+The Pydantic response models in models.py stay the documented schema
+(routes keep ``response_model=`` for OpenAPI), but hot GET handlers select
+exactly those columns and encode the rows themselves. Returning a Response
+skips FastAPI's per-row model validation and jsonable_encoder walk.
+"""
+
+import json
+from datetime import datetime
+
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def _json_default(obj):
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def dumps(data) -> bytes:
+    """Compact JSON bytes. Non-str dict keys (e.g. bot ids) become strings, as with json."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+
+def json_response(data) -> Response:
+    return Response(content=dumps(data), media_type="application/json")
@@ -0,0 +1,239 @@
+"""
+Live bot state and queued agent actions behind one interface.
+
+MemoryStateStore keeps everything in-process, so it only works with a
+single orchestrator worker. Set REDIS_URL to share state and actions
+across workers/containers via RedisStateStore (needs the optional
+``redis`` package; ``orjson`` is used for serialization when present).
+"""
+
+import asyncio
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+logger = logging.getLogger("clawquake.state_store")
+
+STATE_TTL = int(os.environ.get("STATE_TTL", "10"))  # seconds a Redis state snapshot lives
+KEY_PREFIX = "clawquake:bot"
+
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class StateStore(ABC):
+    """Latest state snapshot and pending action queue per bot."""
+
+    @abstractmethod
+    async def get_state(self, bot_id: int) -> Optional[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    async def get_states(self, bot_ids: Iterable[int]) -> Dict[int, Optional[Dict[str, Any]]]:
+        ...
+
+    @abstractmethod
+    async def all_states(self) -> Dict[int, Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    async def set_state(self, bot_id: int, state: Dict[str, Any]):
+        ...
+
+    @abstractmethod
+    async def push_action(self, bot_id: int, action: Dict[str, Any]) -> bool:
+        """Queue an action. Returns False if the bot's queue is full."""
+
+    @abstractmethod
+    async def queue_length(self, bot_id: int) -> int:
+        ...
+
+    @abstractmethod
+    async def drain_actions(self, bot_id: int) -> List[Dict[str, Any]]:
+        """Return and clear every action currently queued for a bot."""
+
+    @abstractmethod
+    async def wait_actions(self, bot_id: int, timeout: float) -> List[Dict[str, Any]]:
+        """Like drain_actions, but wait up to timeout for the first action."""
+
+
+class MemoryStateStore(StateStore):
+    """
+    In-process store backed by plain dicts.
+
+    Queues are asyncio.Queue objects, so they must only be touched from
+    the event loop.
+    """
+
+    def __init__(
+        self,
+        states: Dict[int, Dict[str, Any]],
+        queues: Dict[int, asyncio.Queue],
+        max_queue_size: int,
+    ):
+        self.states = states
+        self.queues = queues
+        self.max_queue_size = max_queue_size
+
+    def _queue(self, bot_id: int) -> asyncio.Queue:
+        queue = self.queues.get(bot_id)
+        if queue is None:
+            queue = self.queues[bot_id] = asyncio.Queue(maxsize=self.max_queue_size)
+        return queue
+
+    async def get_state(self, bot_id):
+        return self.states.get(bot_id)
+
+    async def get_states(self, bot_ids):
+        return {bot_id: self.states.get(bot_id) for bot_id in bot_ids}
+
+    async def all_states(self):
+        return dict(self.states)
+
+    async def set_state(self, bot_id, state):
+        self.states[bot_id] = state
+
+    async def push_action(self, bot_id, action):
+        try:
+            self._queue(bot_id).put_nowait(action)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def queue_length(self, bot_id):
+        queue = self.queues.get(bot_id)
+        return queue.qsize() if queue is not None else 0
+
+    async def drain_actions(self, bot_id):
+        queue = self.queues.get(bot_id)
+        actions = []
+        while queue is not None and not queue.empty():
+            actions.append(queue.get_nowait())
+        return actions
+
+    async def wait_actions(self, bot_id, timeout):
+        queue = self._queue(bot_id)
+        if queue.empty() and timeout > 0:
+            try:
+                first = await asyncio.wait_for(queue.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return []
+            return [first] + await self.drain_actions(bot_id)
+        return await self.drain_actions(bot_id)
+
+
+class RedisStateStore(StateStore):
+    """
+    Redis-backed store shared by every orchestrator worker.
+
+    State lives at ``clawquake:bot:{id}:state`` with a STATE_TTL expiry so
+    snapshots from dead runners disappear; actions are a list at
+    ``clawquake:bot:{id}:actions`` (bounded RPUSH in via a Lua script,
+    LRANGE+DEL out in one MULTI).
+    """
+
+    # KEYS[1] = actions list; ARGV = encoded action, max_queue_size.
+    # Length check and push are one atomic step, so concurrent producers
+    # cannot overfill the queue. Returns the new length, or 0 if full.
+    _PUSH_SCRIPT = """
+if redis.call('LLEN', KEYS[1]) >= tonumber(ARGV[2]) then
+    return 0
+end
+return redis.call('RPUSH', KEYS[1], ARGV[1])
+"""
+
+    def __init__(self, url: str, max_queue_size: int):
+        import redis.asyncio as redis
+
+        self.redis = redis.from_url(url)
+        self.max_queue_size = max_queue_size
+        self._push_script = self.redis.register_script(self._PUSH_SCRIPT)
+
+    @staticmethod
+    def _state_key(bot_id: int) -> str:
+        return f"{KEY_PREFIX}:{bot_id}:state"
+
+    @staticmethod
+    def _actions_key(bot_id: int) -> str:
+        return f"{KEY_PREFIX}:{bot_id}:actions"
+
+    async def get_state(self, bot_id):
+        raw = await self.redis.get(self._state_key(bot_id))
+        return _loads(raw) if raw else None
+
+    async def get_states(self, bot_ids):
+        bot_ids = list(bot_ids)
+        if not bot_ids:
+            return {}
+        raws = await self.redis.mget([self._state_key(b) for b in bot_ids])
+        return {b: (_loads(raw) if raw else None) for b, raw in zip(bot_ids, raws)}
+
+    async def all_states(self):
+        keys = [key async for key in self.redis.scan_iter(match=f"{KEY_PREFIX}:*:state")]
+        if not keys:
+            return {}
+        states = {}
+        for key, raw in zip(keys, await self.redis.mget(keys)):
+            if raw:
+                key = key.decode() if isinstance(key, bytes) else key
+                states[int(key.split(":")[2])] = _loads(raw)
+        return states
+
+    async def set_state(self, bot_id, state):
+        await self.redis.set(self._state_key(bot_id), _dumps(state), ex=STATE_TTL)
+
+    async def push_action(self, bot_id, action):
+        length = await self._push_script(
+            keys=[self._actions_key(bot_id)],
+            args=[_dumps(action), self.max_queue_size],
+        )
+        return length > 0
+
+    async def queue_length(self, bot_id):
+        return await self.redis.llen(self._actions_key(bot_id))
+
+    async def drain_actions(self, bot_id):
+        key = self._actions_key(bot_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            raws, _ = await pipe.lrange(key, 0, -1).delete(key).execute()
+        return [_loads(raw) for raw in raws]
+
+    async def wait_actions(self, bot_id, timeout):
+        # BLPOP treats 0 as "block forever", so a zero timeout is a plain drain.
+        if timeout <= 0:
+            return await self.drain_actions(bot_id)
+        popped = await self.redis.blpop([self._actions_key(bot_id)], timeout=timeout)
+        if not popped:
+            return []
+        return [_loads(popped[1])] + await self.drain_actions(bot_id)
+
+
+def create_state_store(
+    states: Dict[int, Dict[str, Any]],
+    queues: Dict[int, asyncio.Queue],
+    max_queue_size: int,
+) -> StateStore:
+    """Pick the Redis store when REDIS_URL is set, otherwise the in-memory one."""
+    url = os.environ.get("REDIS_URL")
+    if url:
+        try:
+            return RedisStateStore(url, max_queue_size)
+        except ImportError:
+            logger.warning("REDIS_URL is set but the redis package is missing; using in-memory state")
+    return MemoryStateStore(states, queues, max_queue_size)
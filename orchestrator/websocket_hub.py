@@ -4,18 +4,50 @@ WebSocket hub for broadcasting live orchestrator events.
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from asyncio import Lock
 from datetime import datetime, timezone
 from typing import Any
 
 from fastapi import WebSocket
 
+from schemas_fast import dumps
+
+logger = logging.getLogger("clawquake.websocket_hub")
+
+# Each client gets its own bounded outbox drained by a writer task, so a
+# slow reader only ever delays itself. When the outbox is full the oldest
+# frame is dropped: live clients care about the latest state, not history.
+CLIENT_QUEUE_SIZE = 32
+
+
+def _encode(message: dict) -> str:
+    return dumps(message).decode("utf-8")
+
+
+class _Client:
+    __slots__ = ("websocket", "queue", "task")
+
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self.task: asyncio.Task | None = None
+
+    def offer(self, payload: str):
+        """Queue a frame, evicting the oldest one if the client is behind."""
+        try:
+            self.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            self.queue.get_nowait()
+            self.queue.put_nowait(payload)
+
 
 class WebSocketHub:
     """Tracks active clients and broadcasts JSON events."""
 
     def __init__(self):
-        self._connections: set[WebSocket] = set()
+        self._connections: dict[WebSocket, _Client] = {}
         self._lock = Lock()
 
     @property
@@ -24,12 +56,26 @@ class WebSocketHub:
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
+        client = _Client(websocket)
+        client.task = asyncio.create_task(self._writer(client))
         async with self._lock:
-            self._connections.add(websocket)
+            self._connections[websocket] = client
 
     async def disconnect(self, websocket: WebSocket):
         async with self._lock:
-            self._connections.discard(websocket)
+            client = self._connections.pop(websocket, None)
+        if client is not None and client.task is not None and client.task is not asyncio.current_task():
+            client.task.cancel()
+
+    async def _writer(self, client: _Client):
+        while True:
+            payload = await client.queue.get()
+            try:
+                await client.websocket.send_text(payload)
+            except Exception as exc:
+                logger.debug("Dropping websocket client after send failure: %s", exc)
+                await self.disconnect(client.websocket)
+                return
 
     async def broadcast(self, event_type: str, data: Any):
         message = {
@@ -38,16 +84,10 @@ class WebSocketHub:
             "ts": datetime.now(timezone.utc).isoformat(),
         }
         async with self._lock:
-            targets = list(self._connections)
-
-        stale: list[WebSocket] = []
-        for ws in targets:
-            try:
-                await ws.send_json(message)
-            except Exception:
-                stale.append(ws)
-
-        if stale:
-            async with self._lock:
-                for ws in stale:
-                    self._connections.discard(ws)
+            targets = list(self._connections.values())
+        if not targets:
+            return
+        # Serialize once; every client gets the same text frame.
+        payload = _encode(message)
+        for client in targets:
+            client.offer(payload)
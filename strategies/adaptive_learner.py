@@ -30,7 +30,7 @@ from bot.defs import weapon_t
 
 # Try importing DB models; fallback if not available (e.g. running standalone)
 try:
-    from orchestrator.models import SessionLocal, OpponentProfileDB
+    from orchestrator.models import SessionLocal, OpponentProfileDB, WeaponStatDB
     DB_AVAILABLE = True
 except ImportError:
     DB_AVAILABLE = False
@@ -151,10 +151,17 @@ class AdaptiveLearner:
                     # Ideally we load existing stats, add current session, then save.
                     # Here we just save current session stats as the profile.
                     
-                    opp.weapon_counts = json.dumps(stats['weapon_usage'])
                     opp.engagement_range_avg = stats['avg_distance']
-                    opp.games_analyzed += 1
+                    opp.games_analyzed = (opp.games_analyzed or 0) + 1
                     opp.last_updated = datetime.utcnow()
+                    session.flush()  # assigns opp.id for a new profile
+
+                    # One weapon_stats row per weapon, replaced wholesale
+                    session.query(WeaponStatDB).filter_by(opponent_id=opp.id).delete()
+                    session.bulk_insert_mappings(WeaponStatDB, [
+                        {'opponent_id': opp.id, 'weapon': int(weapon), 'count': count}
+                        for weapon, count in stats['weapon_usage'].items()
+                    ])
                     session.commit()
             except Exception as e:
                 logger.error(f"DB Save Error: {e}")
@@ -172,9 +179,14 @@ class AdaptiveLearner:
             with self._db_session() as session:
                 opp = session.query(OpponentProfileDB).filter_by(opponent_name=name).first()
                 if opp:
+                    weapon_usage = dict(
+                        session.query(WeaponStatDB.weapon, WeaponStatDB.count)
+                        .filter_by(opponent_id=opp.id)
+                        .all()
+                    )
                     self.profiles[name] = {
                         'stats': {
-                            'weapon_usage': json.loads(opp.weapon_counts or "{}"),
+                            'weapon_usage': weapon_usage,
                             'avg_distance': opp.engagement_range_avg
                         }
                     }
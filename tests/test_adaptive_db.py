@@ -9,7 +9,7 @@ from datetime import datetime
 # We need to test the logic WITHOUT import errors
 # Since we might not have 'orchestrator' available in running context if ran standalone?
 # But we are in correct CWD.
-from strategies.adaptive_learner import AdaptiveLearner, OpponentProfileDB
+from strategies.adaptive_learner import AdaptiveLearner, OpponentProfileDB, WeaponStatDB
 
 class TestAdaptiveDB(unittest.TestCase):
     
@@ -26,7 +26,8 @@ class TestAdaptiveDB(unittest.TestCase):
         
         # Setup existing profile query
         opp_mock = MagicMock()
-        opp_mock.weapon_counts = "{}"
+        opp_mock.id = 3
+        opp_mock.games_analyzed = 0
         session.query().filter_by().first.return_value = opp_mock
         
         self.learner.current_opponent = "BotX"
@@ -42,8 +43,11 @@ class TestAdaptiveDB(unittest.TestCase):
         # Check commit
         session.commit.assert_called()
         # Check update
-        self.assertIn('7": 10', opp_mock.weapon_counts)
+        session.bulk_insert_mappings.assert_called_once_with(
+            WeaponStatDB, [{'opponent_id': 3, 'weapon': 7, 'count': 10}]
+        )
         self.assertEqual(opp_mock.engagement_range_avg, 500)
+        self.assertEqual(opp_mock.games_analyzed, 1)
         
     @patch('strategies.adaptive_learner.SessionLocal')
     @patch('strategies.adaptive_learner.DB_AVAILABLE', True)
@@ -52,16 +56,46 @@ class TestAdaptiveDB(unittest.TestCase):
         mock_session_cls.return_value = session
         
         opp_mock = MagicMock()
-        opp_mock.weapon_counts = '{"7": 5}'
         opp_mock.engagement_range_avg = 300
         session.query().filter_by().first.return_value = opp_mock
+        session.query().filter_by().all.return_value = [(7, 5)]
         
         self.learner._load_from_db("BotY")
         
         self.assertIn("BotY", self.learner.profiles)
         stats = self.learner.profiles["BotY"]["stats"]
-        self.assertEqual(stats["weapon_usage"]["7"], 5)
+        self.assertEqual(stats["weapon_usage"][7], 5)
         self.assertEqual(stats["avg_distance"], 300)
 
+    def test_legacy_weapon_counts_migrate_to_weapon_stats(self):
+        from sqlalchemy import create_engine, text
+        import orchestrator.models as models
+
+        engine = create_engine("sqlite://")
+        WeaponStatDB.__table__.create(bind=engine)
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE opponent_profiles (id INTEGER PRIMARY KEY, "
+                "opponent_name VARCHAR, weapon_counts VARCHAR)"
+            ))
+            conn.execute(text(
+                "INSERT INTO opponent_profiles VALUES "
+                "(1, 'BotA', '{\"7\": 4, \"3\": 2}'), (2, 'BotB', '{}'), (3, 'BotC', 'not json')"
+            ))
+
+        with patch.object(models, "engine", engine):
+            models._migrate_weapon_counts()
+            models._migrate_weapon_counts()  # second startup is a no-op
+
+        with engine.connect() as conn:
+            rows = conn.execute(text(
+                "SELECT opponent_id, weapon, count FROM weapon_stats ORDER BY weapon"
+            )).fetchall()
+            blob = conn.execute(text(
+                "SELECT weapon_counts FROM opponent_profiles WHERE id = 1"
+            )).scalar()
+        self.assertEqual([tuple(r) for r in rows], [(1, 3, 2), (1, 7, 4)])
+        self.assertEqual(blob, "{}")
+
 if __name__ == '__main__':
     unittest.main()
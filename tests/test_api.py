@@ -132,6 +132,45 @@ def test_auth_with_api_key(client: TestClient):
     assert res.json()[0]["name"] == "FayeBot"
 
 
+def test_api_key_auth_never_runs_bcrypt(client: TestClient, monkeypatch):
+    import auth
+
+    token = register_user(client, "gail", "gail@example.com")["access_token"]
+    key = create_key(client, token, "agent")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("bcrypt ran on the per-request auth path")
+
+    monkeypatch.setattr(auth.pwd_context, "verify", fail)
+    monkeypatch.setattr(auth.pwd_context, "hash", fail)
+    assert client.get("/api/bots", headers={"X-API-Key": key["key"]}).status_code == 200
+    assert client.get("/api/bots", headers=bearer(token)).status_code == 200
+
+
+def test_jwt_rejects_expired_and_tampered_tokens(client: TestClient):
+    from datetime import timedelta
+    from auth import create_access_token
+
+    token = register_user(client, "hana", "hana@example.com")["access_token"]
+    assert client.get("/api/bots", headers=bearer(token)).status_code == 200
+    # Second call is served from the verified-token cache
+    assert client.get("/api/bots", headers=bearer(token)).status_code == 200
+
+    tampered = token[:-2] + ("AA" if token[-2:] != "AA" else "BB")
+    assert client.get("/api/bots", headers=bearer(tampered)).status_code == 401
+
+    expired = create_access_token({"sub": "hana"}, expires_delta=timedelta(seconds=-1))
+    assert client.get("/api/bots", headers=bearer(expired)).status_code == 401
+
+
+def test_read_only_lists_accept_token_without_user_lookup(client: TestClient):
+    token = register_user(client, "iris", "iris@example.com")["access_token"]
+    assert client.get("/api/leaderboard", headers=bearer(token)).status_code == 200
+    assert client.get("/api/matches", headers=bearer(token)).status_code == 200
+    assert client.get("/api/leaderboard", headers=bearer("not-a-jwt")).status_code == 401
+    assert client.get("/api/matches").status_code in (401, 403)
+
+
 def test_register_bot(client: TestClient):
     token = register_user(client, "gina", "gina@example.com")["access_token"]
     res = client.post("/api/bots", json={"name": "GinaBot", "strategy": "codex"}, headers=bearer(token))
@@ -294,6 +333,81 @@ def test_connect_agent_link(client: TestClient):
     assert "agent_key=" in data["stream_url"]
 
 
+def test_observe_and_act_batch(client: TestClient):
+    from ai_agent_interface import ACTION_QUEUES, LATEST_STATES
+
+    token = register_user(client, "vera", "vera@example.com")["access_token"]
+    bot_a = create_bot(client, token, "VeraA")
+    bot_b = create_bot(client, token, "VeraB")
+    key = create_key(client, token)["key"]
+    LATEST_STATES[bot_a["id"]] = {"health": 75}
+    try:
+        res = client.post(
+            "/api/agent/observe_batch",
+            json={"bot_ids": [bot_a["id"], bot_b["id"]]},
+            headers={"X-API-Key": key},
+        )
+        assert res.status_code == 200
+        bots = res.json()["bots"]
+        assert bots[str(bot_a["id"])]["health"] == 75
+        assert bots[str(bot_b["id"])]["status"] == "waiting_for_connection"
+
+        res = client.post(
+            "/api/agent/act_batch",
+            json={"actions": [
+                {"bot_id": bot_a["id"], "action": "jump"},
+                {"bot_id": bot_b["id"], "action": "attack", "params": {"duration": 0.5}},
+            ]},
+            headers=bearer(token),
+        )
+        assert res.status_code == 200
+        assert res.json() == {"ok": True, "queued": 2, "rejected": []}
+        assert ACTION_QUEUES[bot_b["id"]].get_nowait()["params"] == {"duration": 0.5}
+    finally:
+        LATEST_STATES.clear()
+        ACTION_QUEUES.clear()
+
+
+def test_batch_rejects_unowned_bot(client: TestClient):
+    token = register_user(client, "walt", "walt@example.com")["access_token"]
+    other = register_user(client, "xena", "xena@example.com")["access_token"]
+    mine = create_bot(client, token, "WaltBot")
+    theirs = create_bot(client, other, "XenaBot")
+
+    res = client.post(
+        "/api/agent/observe_batch",
+        json={"bot_ids": [mine["id"], theirs["id"]]},
+        headers=bearer(token),
+    )
+    assert res.status_code == 403
+
+    res = client.post(
+        "/api/agent/act_batch",
+        json={"actions": [{"bot_id": 9999, "action": "jump"}]},
+        headers=bearer(token),
+    )
+    assert res.status_code == 404
+
+
+def test_single_and_batch_access_agree_for_api_keys(client: TestClient):
+    token = register_user(client, "yuri", "yuri@example.com")["access_token"]
+    other = register_user(client, "zara", "zara@example.com")["access_token"]
+    key = create_key(client, token)["key"]
+    theirs = create_bot(client, other, "ZaraBot")
+
+    single = client.get("/api/agent/observe", params={"bot_id": theirs["id"]}, headers={"X-API-Key": key})
+    batch = client.post(
+        "/api/agent/observe_batch", json={"bot_ids": [theirs["id"]]}, headers={"X-API-Key": key},
+    )
+    assert single.status_code == batch.status_code == 403
+
+    single = client.get("/api/agent/observe", params={"bot_id": theirs["id"]}, headers={"X-API-Key": "cq_bogus"})
+    batch = client.post(
+        "/api/agent/observe_batch", json={"bot_ids": [theirs["id"]]}, headers={"X-API-Key": "cq_bogus"},
+    )
+    assert single.status_code == batch.status_code == 401
+
+
 def test_tournament_creator_can_start(client: TestClient):
     creator = register_user(client, "vera", "vera@example.com")["access_token"]
     other = register_user(client, "walt", "walt@example.com")["access_token"]
@@ -325,6 +439,15 @@ def test_tournament_creator_can_start(client: TestClient):
     assert res.status_code == 200
     assert res.json()["started"] is True
 
+    detail = client.get(f"/api/tournaments/{tid}")
+    assert detail.status_code == 200
+    body = detail.json()
+    assert body["info"]["creator_name"] == "vera"
+    assert body["info"]["participant_count"] == 2
+    assert {p["owner"] for p in body["participants"]} == {"vera", "walt"}
+    first_round = body["bracket"]["1"]
+    assert {first_round[0]["p1_name"], first_round[0]["p2_name"]} == {"VeraBot", "WaltBot"}
+
 
 def test_non_owner_cannot_start_tournament(client: TestClient):
     creator = register_user(client, "xena", "xena@example.com")["access_token"]
@@ -384,3 +507,66 @@ def test_cannot_join_tournament_after_start(client: TestClient):
         headers=bearer(other),
     )
     assert res.status_code == 400
+
+
+def test_list_tournaments_participant_counts(client: TestClient):
+    token = register_user(client, "cleo", "cleo@example.com")["access_token"]
+    bots = [create_bot(client, token, f"CleoBot{i}") for i in range(3)]
+
+    full = client.post(
+        "/api/tournaments", json={"name": "Full Cup", "format": "single_elim"}, headers=bearer(token),
+    ).json()["id"]
+    empty = client.post(
+        "/api/tournaments", json={"name": "Empty Cup", "format": "single_elim"}, headers=bearer(token),
+    ).json()["id"]
+    for bot in bots:
+        client.post(f"/api/tournaments/{full}/join", json={"bot_id": bot["id"]}, headers=bearer(token))
+
+    res = client.get("/api/tournaments")
+    assert res.status_code == 200
+    by_id = {t["id"]: t for t in res.json()}
+    assert by_id[full]["participant_count"] == 3
+    assert by_id[empty]["participant_count"] == 0
+    assert by_id[full]["creator_name"] == "cleo"
+
+
+def test_single_orchestrator_app_module():
+    """Exactly one module defines the FastAPI app (no stale main.py copies)."""
+    from pathlib import Path
+
+    orchestrator_dir = Path(__file__).resolve().parent.parent / "orchestrator"
+    defining = [
+        path.name for path in orchestrator_dir.glob("*.py")
+        if "app = FastAPI(" in path.read_text(encoding="utf-8")
+    ]
+    assert defining == ["main.py"]
+
+
+def test_fast_dumps_stringifies_int_keys():
+    """Payloads keyed by bot id encode like stdlib json instead of raising."""
+    import json
+    from schemas_fast import dumps
+
+    assert json.loads(dumps({"bots": {10: {"finished": False}}})) == {"bots": {"10": {"finished": False}}}
+
+
+def test_match_detail_never_lazy_loads_participants():
+    """The detail endpoint loads its match with raiseload("*")."""
+    from sqlalchemy import event
+    from sqlalchemy.exc import InvalidRequestError
+    import main
+    from models import MatchDB
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add(MatchDB(id=1, map_name="q3dm17"))
+    db.commit()
+    db.expunge_all()
+
+    loaded = []  # strong refs: the identity map would let the match be collected
+    event.listen(db, "loaded_as_persistent", lambda _session, obj: loaded.append(obj))
+    main.get_match_detail(1, db=db)
+    with pytest.raises(InvalidRequestError):
+        _ = loaded[0].participants
+    db.close()
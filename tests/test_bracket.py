@@ -46,13 +46,15 @@ class TestTournamentBracket(unittest.TestCase):
         ]
         self.db.query().filter_by().all.return_value = p_list
         
-        # Mock BotDB lookups for ELO
-        def query_side_effect(model):
+        # Mock the single (id, elo) lookup used for seeding
+        elos = [(10, 1200.0), (11, 1500.0), (12, 1000.0), (13, 1300.0)]
+
+        def query_side_effect(*entities):
+            model = entities[0]
             m = MagicMock()
-            if model == BotDB:
-                # Returns a mock query object, which needs filter_by().first()
+            if model is BotDB.id:
                 q = MagicMock()
-                q.filter_by.return_value.first.return_value = BotDB(elo=1500)
+                q.filter.return_value.all.return_value = elos
                 return q
             elif model == TournamentParticipantDB:
                 q = MagicMock()
@@ -74,16 +76,17 @@ class TestTournamentBracket(unittest.TestCase):
         self.assertEqual(t_mock.status, "active")
         self.assertEqual(t_mock.current_round, 1)
         
-        # Should create 2 matches for Round 1 (4 players -> 2 matches)
-        # 4 add calls: (p1, p2, p3, p4 seeding updates? No, seeds updated on objects)
-        # Matches added
-        # We expect add() calls for Matches.
-        # Actually seeding modifies objects attached to session, doesn't call add().
-        # So we look for TournamentMatchDB adds.
-        
+        # Seeds follow ELO, highest first
+        self.assertEqual([p.seed for p in p_list], [3, 1, 4, 2])
+
+        # Should create 2 matches for Round 1 (4 players -> 2 matches),
+        # added in one add_all() call. Seeding modifies objects attached to
+        # the session and doesn't call add().
         match_adds = [
-            c[0][0] for c in self.db.add.call_args_list 
-            if isinstance(c[0][0], TournamentMatchDB)
+            obj
+            for c in self.db.add_all.call_args_list
+            for obj in c[0][0]
+            if isinstance(obj, TournamentMatchDB)
         ]
         self.assertEqual(len(match_adds), 2)
         
@@ -10,8 +10,10 @@ Covers the full user journey:
 import os
 import sys
 import time
+from unittest.mock import MagicMock, patch
 
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -176,6 +178,14 @@ class TestFullUserJourney:
             "username": "bob2", "email": "bob@test.com", "password": "test",
         })
         assert res.status_code == 400
+        assert res.json()["detail"] == "Email already registered"
+
+        # Username clash wins when both collide with different users
+        _register(c, "carol", "carol@test.com")
+        res = c.post("/api/auth/register", json={
+            "username": "carol", "email": "bob@test.com", "password": "test",
+        })
+        assert res.json()["detail"] == "Username already taken"
 
     def test_bad_login(self, e2e_env):
         c = e2e_env["client"]
@@ -505,6 +515,41 @@ class TestMatchmakingE2E:
         assert lb[1]["name"] == "Challenger"
         assert lb[0]["elo"] > lb[1]["elo"]
 
+    def test_leaderboard_keyset_pagination(self, e2e_env):
+        """after_id continues the leaderboard after the given bot."""
+        c = e2e_env["client"]
+        t1 = _register(c, "page_a", "pa@test.com")
+        ids = [_create_bot(c, t1, f"Pager{i}")["id"] for i in range(3)]
+
+        full = c.get("/api/leaderboard", headers=_auth(t1)).json()
+        assert [b["id"] for b in full] == sorted(ids)
+
+        res = c.get(f"/api/leaderboard?after_id={full[0]['id']}", headers=_auth(t1))
+        assert res.status_code == 200
+        assert [b["id"] for b in res.json()] == [b["id"] for b in full[1:]]
+
+        res = c.get("/api/leaderboard?after_id=999999", headers=_auth(t1))
+        assert res.status_code == 400
+
+    def test_leaderboard_cached_until_bot_registered(self, e2e_env):
+        """The top page is served from cache until something changes standings."""
+        c = e2e_env["client"]
+        t1 = _register(c, "cache_a", "ca@test.com")
+        _create_bot(c, t1, "Cached1")
+        assert [b["name"] for b in c.get("/api/leaderboard", headers=_auth(t1)).json()] == ["Cached1"]
+
+        # Out-of-band write: not visible while the cached page is fresh
+        db = e2e_env["session_factory"]()
+        db.add(BotDB(name="Sneaky", owner_id=1, elo=2000.0))
+        db.commit()
+        db.close()
+        assert [b["name"] for b in c.get("/api/leaderboard", headers=_auth(t1)).json()] == ["Cached1"]
+
+        # Registering through the API invalidates it
+        _create_bot(c, t1, "Cached2")
+        names = [b["name"] for b in c.get("/api/leaderboard", headers=_auth(t1)).json()]
+        assert names == ["Sneaky", "Cached1", "Cached2"]
+
     def test_match_detail_endpoint(self, e2e_env):
         """GET /api/matches/{id} returns participant details."""
         c = e2e_env["client"]
@@ -540,6 +585,69 @@ class TestMatchmakingE2E:
         assert p1["elo_change"] > 0  # Winner gained ELO
         assert p2["elo_change"] < 0  # Loser lost ELO
 
+    def test_match_detail_query_count_is_constant(self, e2e_env):
+        """Participant bot names come from one JOIN, not one query per bot."""
+        from sqlalchemy import event
+
+        c = e2e_env["client"]
+        db = e2e_env["session_factory"]()
+        try:
+            bots = [BotDB(name=f"JoinBot{i}", owner_id=1) for i in range(6)]
+            match = MatchDB(map_name="q3dm1")
+            db.add_all(bots + [match])
+            db.flush()
+            db.add_all([
+                MatchParticipantDB(match_id=match.id, bot_id=b.id, elo_before=1000.0, elo_after=1000.0 + i * 1.005)
+                for i, b in enumerate(bots)
+            ])
+            db.commit()
+            match_id = match.id
+        finally:
+            db.close()
+
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        event.listen(e2e_env["engine"], "before_cursor_execute", count)
+        try:
+            res = c.get(f"/api/matches/{match_id}")
+        finally:
+            event.remove(e2e_env["engine"], "before_cursor_execute", count)
+
+        assert res.status_code == 200
+        participants = {p["bot_name"]: p for p in res.json()["participants"]}
+        assert set(participants) == {f"JoinBot{i}" for i in range(6)}
+        assert participants["JoinBot0"]["elo_change"] == 0.0
+        assert participants["JoinBot2"]["elo_change"] == pytest.approx(2.01)
+        assert len(statements) == 2
+
+    def test_match_list_etag_not_modified(self, e2e_env):
+        c = e2e_env["client"]
+        t1 = _register(c, "etag_a", "ea@test.com")
+        db = e2e_env["session_factory"]()
+        db.add(MatchDB(map_name="q3dm1"))
+        db.commit()
+        db.close()
+
+        first = c.get("/api/matches", headers=_auth(t1))
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+
+        again = c.get("/api/matches", headers={**_auth(t1), "If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
+
+        db = e2e_env["session_factory"]()
+        db.add(MatchDB(map_name="q3dm6"))
+        db.commit()
+        db.close()
+        changed = c.get("/api/matches", headers={**_auth(t1), "If-None-Match": etag})
+        assert changed.status_code == 200
+        assert len(changed.json()) == 2
+
     def test_match_history_endpoint(self, e2e_env):
         """GET /api/matches returns recent matches."""
         c = e2e_env["client"]
@@ -717,6 +825,103 @@ class TestHealthAndStatus:
         assert c.get("/api/bots").status_code == 401
         assert c.get("/api/keys").status_code == 401
 
+    def test_status_payload_is_cached(self, e2e_env):
+        import main
+
+        calls = []
+
+        def fake_status():
+            calls.append(1)
+            return {"online": False, "message": "Game server offline"}
+
+        cache = main._PayloadCache(fake_status, ttl=60)
+        with patch.object(main, "status_cache", cache):
+            c = e2e_env["client"]
+            for _ in range(3):
+                assert c.get("/api/status").json()["online"] is False
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_status_reads_share_one_probe(self):
+        import asyncio
+        import main
+
+        calls = []
+
+        async def slow_status():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"online": False, "message": "Game server offline"}
+
+        cache = main._PayloadCache(slow_status, ttl=60)
+        results = await asyncio.gather(*(cache.get() for _ in range(20)))
+        assert all(r["online"] is False for r in results)
+        assert len(calls) == 1
+
+    def test_admin_active_matches_with_running_bots(self, e2e_env):
+        """Bot-id keyed statuses survive the pre-encoded queue payload."""
+        import main
+        from process_manager import BotProcess, BotProcessManager, MatchProcessGroup
+
+        c = e2e_env["client"]
+        token = _register(c, "root", "root@example.com")
+        db = e2e_env["session_factory"]()
+        db.query(UserDB).filter(UserDB.username == "root").update({"is_admin": True})
+        db.commit()
+        db.close()
+
+        pm = BotProcessManager(agent_runner_path="/fake/runner.py")
+        process = MagicMock()
+        process.poll.return_value = None
+        pm._matches[1] = MatchProcessGroup(
+            match_id=1,
+            bot_processes={10: BotProcess(match_id=1, bot_id=10, bot_name="Bot", process=process)},
+        )
+        with patch.object(main, "process_manager", pm), \
+                patch.object(main, "SessionLocal", e2e_env["session_factory"]), \
+                patch.object(main, "queue_cache", main._PayloadCache(main._queue_payload, ttl=60)):
+            res = c.get("/api/admin/matches/active", headers={"Authorization": f"Bearer {token}"})
+        assert res.status_code == 200
+        assert res.json()["matches"][0]["bots"]["10"]["finished"] is False
+
+    def test_admin_match_start_rejects_rcon_injection(self, e2e_env):
+        import main
+
+        c = e2e_env["client"]
+        token = _register(c, "ops", "ops@example.com")
+        db = e2e_env["session_factory"]()
+        db.query(UserDB).filter(UserDB.username == "ops").update({"is_admin": True})
+        db.commit()
+        db.close()
+
+        headers = {"Authorization": f"Bearer {token}"}
+        with patch.object(main, "send_rcon_many") as send:
+            res = c.post("/api/admin/match/start", params={"bots": "Sarge,Doom; quit"}, headers=headers)
+            assert res.status_code == 400
+            res = c.post("/api/admin/match/start", params={"map_name": 'q3dm17"'}, headers=headers)
+            assert res.status_code == 400
+            send.assert_not_called()
+
+            res = c.post("/api/admin/match/start", params={"bots": "Sarge, Doom"}, headers=headers)
+            assert res.status_code == 200
+            send.assert_called_once_with(["map q3dm17", "addbot Sarge 3", "addbot Doom 3"])
+
+    def test_replay_download_stays_inside_replay_dir(self, e2e_env, tmp_path):
+        import main
+
+        replays = tmp_path / "replays"
+        replays.mkdir()
+        (replays / "match_1.json").write_text("{}")
+        (tmp_path / "secret.json").write_text("{}")
+
+        c = e2e_env["client"]
+        with patch.object(main, "REPLAY_DIR", str(replays)):
+            assert c.get("/api/replays/match_1.json").status_code == 200
+            assert c.get("/api/replays/missing.json").status_code == 404
+            with pytest.raises(HTTPException) as exc:
+                main.get_replay("../secret.json")
+            assert exc.value.status_code == 400
+
     def test_nonexistent_match_404(self, e2e_env):
         c = e2e_env["client"]
         res = c.get("/api/matches/99999")
@@ -11,6 +11,8 @@ import asyncio
 import time
 from unittest.mock import MagicMock, patch, AsyncMock
 
+import pytest
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "orchestrator"))
 sys.path.insert(0, os.path.dirname(__file__))
 
@@ -256,6 +258,72 @@ class TestBotProcessManager:
 
         assert pm.active_match_count() == 1  # only match 1 is running
 
+    @patch("process_manager.subprocess.Popen")
+    def test_finished_match_is_not_polled_again(self, mock_popen):
+        """Exited processes are reaped once; later checks use the latched flag."""
+        mock_proc = MagicMock()
+        mock_proc.poll.return_value = 0
+        mock_popen.return_value = mock_proc
+
+        pm = BotProcessManager(agent_runner_path="/fake/runner.py")
+        pm.launch_bot(1, 10, "Bot1", "s.py", "ws://x", 60)
+        pm.launch_bot(1, 20, "Bot2", "s.py", "ws://x", 60)
+
+        assert pm.check_match(1)["all_finished"]
+        assert mock_proc.poll.call_count == 2
+        assert pm.active_match_count() == 0
+        assert pm.active_matches()[0]["all_finished"]
+        assert mock_proc.poll.call_count == 2
+
+    @patch("process_manager.subprocess.Popen")
+    def test_exited_bots_leave_the_poll_worklist(self, mock_popen):
+        """Once a bot is reaped, later polls only touch the bots still running."""
+        done, running = MagicMock(), MagicMock()
+        done.poll.return_value = 0
+        running.poll.return_value = None
+        mock_popen.side_effect = [done, running]
+
+        pm = BotProcessManager(agent_runner_path="/fake/runner.py")
+        pm.launch_bot(1, 10, "Bot1", "s.py", "ws://x", 60)
+        pm.launch_bot(1, 20, "Bot2", "s.py", "ws://x", 60)
+
+        assert not pm.check_match(1)["all_finished"]
+        assert not pm.check_match(1)["all_finished"]
+        assert done.poll.call_count == 1
+        assert running.poll.call_count == 2
+        assert [b.bot_id for b in pm._matches[1].running] == [20]
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="needs pidfd_open")
+    async def test_wait_for_match_wakes_on_exit(self, tmp_path):
+        """A real child exiting wakes wait_for_match long before poll_interval."""
+        runner = tmp_path / "runner.py"
+        runner.write_text("import time; time.sleep(0.2)\n")
+        pm = BotProcessManager(agent_runner_path=str(runner))
+        bot_proc = pm.launch_bot(1, 10, "Bot", "strategy.py", "ws://localhost:27960", duration=60)
+
+        start = time.monotonic()
+        status = await pm.wait_for_match(1, poll_interval=30)
+        assert status["all_finished"]
+        assert status["bots"][10]["return_code"] == 0
+        assert time.monotonic() - start < 5
+        assert bot_proc.pidfd is None  # closed once the exit was reaped
+
+    @pytest.mark.asyncio
+    async def test_bot_output_goes_to_log_dir(self, tmp_path, monkeypatch):
+        import process_manager
+
+        runner = tmp_path / "runner.py"
+        runner.write_text("import sys; print('hello'); print('oops', file=sys.stderr)\n")
+        monkeypatch.setattr(process_manager, "BOT_LOG_DIR", str(tmp_path / "logs"))
+        pm = BotProcessManager(agent_runner_path=str(runner))
+        pm.launch_bot(3, 7, "Bot", "strategy.py", "ws://localhost:27960", duration=60)
+
+        status = await pm.wait_for_match(3, poll_interval=0.05)
+        assert status["all_finished"]
+        log = (tmp_path / "logs" / "bot_3_7.log").read_text()
+        assert "hello" in log and "oops" in log
+
 
 # ── Full Match Lifecycle Integration Tests ───────────────────────
 
@@ -4,6 +4,7 @@ Tests for API key rotation and expiry.
 
 import os
 import sys
+import time
 from datetime import datetime, timedelta
 
 import pytest
@@ -15,6 +16,7 @@ from sqlalchemy.pool import StaticPool
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "orchestrator"))
 os.environ.setdefault("JWT_SECRET", "test-secret-key-for-testing-only")
 
+from api_keys import invalidate_api_key
 from auth import get_db as auth_get_db
 from main import app
 from main import get_db as main_get_db
@@ -133,6 +135,8 @@ class TestKeyExpiry:
             key_record = db.query(ApiKeyDB).filter(ApiKeyDB.id == key_data["id"]).first()
             key_record.expires_at = datetime.utcnow() - timedelta(hours=1)
             db.commit()
+            # Out-of-band DB edits are only seen once the auth cache entry lapses
+            invalidate_api_key(key_record.key_hash)
         finally:
             db.close()
 
@@ -190,6 +194,21 @@ class TestKeyRotation:
         res = c.get("/api/bots", headers={"X-API-Key": new_key["key"]})
         assert res.status_code == 200
 
+    def test_revoked_key_rejected_immediately(self, env):
+        """Revoking through the API bypasses the auth cache TTL."""
+        c = env["client"]
+        token = _register(c, "rotate_user9")
+
+        key = c.post("/api/keys", json={"name": "cached"}, headers=_auth(token)).json()
+        c.post("/api/bots", json={"name": "CachedBot"}, headers=_auth(token))
+
+        # Warm the cache
+        assert c.get("/api/bots", headers={"X-API-Key": key["key"]}).status_code == 200
+
+        c.delete(f"/api/keys/{key['id']}", headers=_auth(token))
+        res = c.get("/api/bots", headers={"X-API-Key": key["key"]})
+        assert res.status_code == 401
+
     def test_rotate_preserves_name(self, env):
         c = env["client"]
         token = _register(c, "rotate_user2")
@@ -269,3 +288,29 @@ class TestKeyRotation:
         res = c.post(f"/api/keys/{key['id']}/rotate", headers=_auth(token))
         assert res.status_code == 400
         assert "expired" in res.json()["detail"].lower()
+
+
+# ── last_used Flush Tests ─────────────────────────────────────
+
+class TestLastUsedFlush:
+
+    def test_last_use_is_persisted_without_later_traffic(self, env):
+        import api_keys
+
+        c = env["client"]
+        db_factory = env["session_factory"]
+        token = _register(c, "last_used_user1")
+        key = c.post("/api/keys", json={"name": "quiet-key"}, headers=_auth(token)).json()
+
+        db = db_factory()
+        try:
+            api_keys._last_flush = time.monotonic()  # interval not yet elapsed
+            api_keys.record_api_key_use(db, key["id"])
+            assert db.get(ApiKeyDB, key["id"]).last_used is None
+
+            api_keys.flush_api_key_last_used(db)
+            db.expire_all()
+            assert db.get(ApiKeyDB, key["id"]).last_used is not None
+            assert key["id"] not in api_keys._pending_last_used
+        finally:
+            db.close()
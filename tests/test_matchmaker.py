@@ -70,6 +70,21 @@ class TestEloCalculator:
         assert p1["elo_change"] > 0
         assert p3["elo_change"] < 0
 
+    def test_elo_ffa_zero_sum_with_draws(self):
+        """FFA changes sum to zero and tied players with equal ELO move together."""
+        participants = [
+            {"bot_id": 1, "elo": 1100.0, "score": 2},
+            {"bot_id": 2, "elo": 1000.0, "score": 4},
+            {"bot_id": 3, "elo": 1000.0, "score": 4},
+            {"bot_id": 4, "elo": 900.0, "score": 0},
+        ]
+        results = EloCalculator.calculate_ffa(participants)
+
+        by_id = {r["bot_id"]: r for r in results}
+        assert by_id[2]["elo_change"] == by_id[3]["elo_change"] > 0
+        assert by_id[1]["elo_change"] < 0
+        assert abs(sum(r["elo_change"] for r in results)) < 0.02
+
     def test_elo_ffa_single_player(self):
         """Single player FFA: no ELO change."""
         participants = [{"bot_id": 1, "elo": 1000.0, "score": 5}]
@@ -77,6 +92,23 @@ class TestEloCalculator:
         assert results[0]["elo_change"] == 0.0
 
 
+# ── Strategy Path Tests ─────────────────────────────────────────
+
+def test_global_strategy_path_stats_once(monkeypatch):
+    """Repeated lookups of a global strategy hit the filesystem once."""
+    import matchmaker
+
+    calls = []
+    monkeypatch.setattr(matchmaker.os.path, "exists", lambda p: calls.append(p) or True)
+    matchmaker._global_strategy_path.cache_clear()
+    try:
+        for _ in range(3):
+            assert matchmaker._global_strategy_path("aggressive") == "strategies/aggressive.py"
+    finally:
+        matchmaker._global_strategy_path.cache_clear()
+    assert calls == ["strategies/aggressive.py"]
+
+
 # ── MatchMaker Queue Tests ──────────────────────────────────────
 
 class TestMatchMakerQueue:
@@ -127,6 +159,23 @@ class TestMatchMakerQueue:
         entries = db.query(QueueEntryDB).all()
         assert all(e.status == "matched" for e in entries)
 
+    def test_queue_poll_never_claims_entries_for_deleted_bots(self, db, db_factory):
+        """An entry whose bot row is gone stays out of the claim."""
+        user = create_test_user(db)
+        bot1 = create_test_bot(db, "Bot1", user.id)
+        bot2 = create_test_bot(db, "Bot2", user.id)
+        orphan = queue_bot(db, 9999, user.id)
+        queue_bot(db, bot1.id, user.id)
+        queue_bot(db, bot2.id, user.id)
+
+        mm = MatchMaker(db_session_factory=db_factory)
+        match_id = mm.poll_queue()
+
+        assert match_id is not None
+        assert mm._active_matches[match_id]["bot_ids"] == [bot1.id, bot2.id]
+        db.expire_all()
+        assert db.get(QueueEntryDB, orphan.id).status == "waiting"
+
 
 # ── MatchMaker Match Lifecycle Tests ─────────────────────────────
 
@@ -252,3 +301,86 @@ class TestMatchMakerLifecycle:
         match = db.query(MatchDB).filter(MatchDB.id == match_id).first()
         assert match.ended_at is not None
         assert match.winner == "Alpha"
+
+    def test_finalize_match_loads_bots_once(self, db, db_engine, db_factory):
+        """finalize_match loads match + participants in one query and all bots in another."""
+        from sqlalchemy import event
+
+        user = create_test_user(db)
+        entries = []
+        for i in range(4):
+            bot = create_test_bot(db, f"Bot{i}", user.id)
+            entries.append(queue_bot(db, bot.id, user.id))
+
+        mm = MatchMaker(db_session_factory=db_factory)
+        match_id = mm.create_match(db, entries)
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db_engine, "before_cursor_execute", record)
+        try:
+            result = mm.finalize_match(match_id)
+        finally:
+            event.remove(db_engine, "before_cursor_execute", record)
+
+        assert result["participant_count"] == 4
+        selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        assert len([s for s in selects if "FROM bots" in s]) == 1
+        assert len([s for s in selects if "match_participants" in s]) == 1
+        assert not [s for s in selects if "FROM queue" in s]
+        assert db.query(QueueEntryDB).filter(QueueEntryDB.status == "done").count() == 4
+
+    def test_poll_queue_backs_off_when_entries_were_claimed(self, db, db_factory, monkeypatch):
+        """A poll whose entries are claimed concurrently creates no match."""
+        user = create_test_user(db)
+        bot1 = create_test_bot(db, "Racer1", user.id)
+        bot2 = create_test_bot(db, "Racer2", user.id)
+        queue_bot(db, bot1.id, user.id)
+        entry2 = queue_bot(db, bot2.id, user.id)
+
+        mm = MatchMaker(db_session_factory=db_factory)
+        real_create = mm.create_match
+        created = []
+        monkeypatch.setattr(mm, "create_match", lambda *a, **kw: created.append(1) or real_create(*a, **kw))
+
+        # Another poller claims one entry between our SELECT and UPDATE.
+        from sqlalchemy import event
+
+        stolen = []
+
+        def claim_first(conn, cursor, statement, *args):
+            if not stolen and statement.lstrip().upper().startswith("UPDATE QUEUE"):
+                stolen.append(entry2.id)
+                cursor.execute("UPDATE queue SET status = 'matched' WHERE id = ?", (entry2.id,))
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", claim_first)
+        try:
+            assert mm.poll_queue() is None
+        finally:
+            event.remove(engine, "before_cursor_execute", claim_first)
+
+        assert created == []
+        assert db.query(MatchDB).count() == 0
+
+    def test_lifecycle_reuses_callers_session(self, db):
+        """Passing a session means the matchmaker never opens its own."""
+        user = create_test_user(db)
+        bot1 = create_test_bot(db, "Shared1", user.id)
+        bot2 = create_test_bot(db, "Shared2", user.id)
+        queue_bot(db, bot1.id, user.id)
+        queue_bot(db, bot2.id, user.id)
+
+        def no_new_sessions():
+            raise AssertionError("matchmaker opened its own session")
+
+        mm = MatchMaker(db_session_factory=no_new_sessions)
+        match_id = mm.poll_queue(db)
+        mm.collect_result(match_id, bot1.id, kills=4, deaths=1, db=db)
+        mm.collect_result(match_id, bot2.id, kills=1, deaths=4, db=db)
+        result = mm.finalize_match(match_id, db=db)
+
+        assert result["winner_name"] == "Shared1"
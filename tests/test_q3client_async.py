@@ -0,0 +1,99 @@
+"""
+Tests for the single-socket async Q3 status client.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "bots", "python"))
+
+from q3client import OOB_HEADER, Q3AsyncClient, parse_status_response
+
+
+class _FakeServer(asyncio.DatagramProtocol):
+    """Answers getstatus with its own hostname, echoing the challenge."""
+
+    def __init__(self, name, delay=0.0):
+        self.name = name
+        self.delay = delay
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        command, _, challenge = data[4:].decode().partition(" ")
+        reply = (
+            f"statusResponse\n\\sv_hostname\\{self.name}\\challenge\\{challenge}\n"
+            f'5 20 "Player{self.name}"\n'
+        )
+        loop = asyncio.get_running_loop()
+        loop.call_later(self.delay, self.transport.sendto, OOB_HEADER + reply.encode(), addr)
+
+
+async def _start_servers(count, delay):
+    loop = asyncio.get_running_loop()
+    servers = []
+    for i in range(count):
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda i=i: _FakeServer(f"srv{i}", delay), local_addr=("127.0.0.1", 0),
+        )
+        servers.append(transport)
+    return servers
+
+
+def test_parse_status_response():
+    result = parse_status_response('statusResponse\n\\mapname\\q3dm17\\g_gametype\\0\n3 45 "Bob"\n')
+    assert result["info"]["mapname"] == "q3dm17"
+    assert result["players"] == [{"score": 3, "ping": 45, "name": "Bob"}]
+
+
+@pytest.mark.asyncio
+async def test_survey_runs_queries_concurrently():
+    servers = await _start_servers(10, delay=0.2)
+    addrs = [("127.0.0.1", t.get_extra_info("sockname")[1]) for t in servers]
+    try:
+        async with Q3AsyncClient(timeout=2.0) as client:
+            start = asyncio.get_running_loop().time()
+            results = await client.survey(addrs)
+            elapsed = asyncio.get_running_loop().time() - start
+    finally:
+        for t in servers:
+            t.close()
+
+    assert [r["info"]["sv_hostname"] for r in results] == [f"srv{i}" for i in range(10)]
+    assert results[3]["players"][0]["name"] == "Playersrv3"
+    assert elapsed < 1.0  # serial queries would take 2s
+
+
+@pytest.mark.asyncio
+async def test_unanswered_query_times_out_offline():
+    loop = asyncio.get_running_loop()
+    silent, _ = await loop.create_datagram_endpoint(
+        asyncio.DatagramProtocol, local_addr=("127.0.0.1", 0),
+    )
+    port = silent.get_extra_info("sockname")[1]
+    try:
+        async with Q3AsyncClient(timeout=0.05) as client:
+            assert await client.get_status("127.0.0.1", port) == {"online": False}
+    finally:
+        silent.close()
+
+
+def test_sync_status_reuses_parse_for_identical_reply():
+    from unittest.mock import patch
+    from q3client import Q3Client, UNCHANGED
+
+    client = Q3Client("127.0.0.1", 1)
+    reply = 'statusResponse\n\\sv_hostname\\box\n1 10 "A"\n'
+    try:
+        with patch.object(client, "_send_oob", return_value=reply):
+            first = client.get_status()
+            assert client.get_status() is first
+            assert client.get_status(if_changed=True) is UNCHANGED
+        with patch.object(client, "_send_oob", return_value=reply.replace("box", "cube")):
+            assert client.get_status(if_changed=True)["info"]["sv_hostname"] == "cube"
+    finally:
+        client.sock.close()
@@ -7,7 +7,7 @@ import sys
 import time
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from fastapi import FastAPI, Depends, Request
 from fastapi.testclient import TestClient
 
@@ -20,6 +20,7 @@ from rate_limiter import (
     RateLimit,
     GlobalRateLimit,
     EXEMPT_PATHS,
+    create_store,
     get_store,
 )
 
@@ -104,6 +105,27 @@ class TestSlidingWindowStore:
         assert allowed is True
         assert info["remaining"] == 2
 
+    def test_idle_keys_are_evicted(self):
+        store = SlidingWindowStore()
+        for i in range(50):
+            store.check(f"ip:{i}", max_calls=3, window=0.05)
+        assert len(store) == 50
+
+        time.sleep(0.1)
+        store.check("ip:new", max_calls=3, window=0.05)
+        assert len(store) == 1
+
+    def test_tracked_keys_are_capped(self):
+        store = SlidingWindowStore(max_keys=3)
+        for key in ("a", "b", "c"):
+            store.check(key, max_calls=1, window=60)
+        store.check("a", max_calls=1, window=60)  # "b" is now least recent
+        store.check("d", max_calls=1, window=60)
+
+        assert len(store) == 3
+        assert store.check("a", max_calls=1, window=60)[0] is False
+        assert store.check("b", max_calls=1, window=60)[0] is True
+
 
 # ── RateLimit Dependency Tests ────────────────────────────────
 
@@ -248,3 +270,10 @@ class TestGlobalRateLimit:
             for _ in range(5):
                 res = client.get("/api/health")
                 assert res.status_code == 200
+
+
+def test_defaults_to_memory_store():
+    with patch.dict(os.environ, {}, clear=False):
+        os.environ.pop("REDIS_URL", None)
+        store = create_store()
+    assert isinstance(store, SlidingWindowStore)
@@ -2,9 +2,13 @@
 Regression tests for legacy single-server RCON helpers.
 """
 
+import asyncio
 import os
 import socket
 import sys
+import threading
+
+import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "orchestrator"))
 
@@ -39,3 +43,112 @@ def test_get_server_status_handles_socket_errors(monkeypatch):
 def test_send_rcon_handles_socket_errors(monkeypatch):
     monkeypatch.setattr(rcon.socket, "socket", lambda *args, **kwargs: RaisingSocket(OSError("no route")))
     assert rcon.send_rcon("status") == ""
+
+
+@pytest.mark.asyncio
+async def test_get_server_status_async_round_trip(monkeypatch):
+    loop = asyncio.get_running_loop()
+
+    class FakeServer(asyncio.DatagramProtocol):
+        def connection_made(self, transport):
+            self.transport = transport
+
+        def datagram_received(self, data, addr):
+            assert data == b"\xff\xff\xff\xffgetstatus"
+            self.transport.sendto(
+                b"\xff\xff\xff\xffstatusResponse\n\\mapname\\q3dm17\\sv_hostname\\Arena\n5 40 \"Alpha\"\n",
+                addr,
+            )
+
+    transport, _ = await loop.create_datagram_endpoint(FakeServer, local_addr=("127.0.0.1", 0))
+    try:
+        host, port = transport.get_extra_info("sockname")[:2]
+        monkeypatch.setattr(rcon, "GAME_SERVER_HOST", host)
+        monkeypatch.setattr(rcon, "GAME_SERVER_PORT", port)
+        status = await rcon.get_server_status_async(timeout=1.0)
+    finally:
+        transport.close()
+
+    assert status["online"] is True
+    assert status["info"]["mapname"] == "q3dm17"
+    assert status["players"] == [{"score": 5, "ping": 40, "name": "Alpha"}]
+
+
+@pytest.mark.asyncio
+async def test_get_server_status_async_times_out(monkeypatch):
+    loop = asyncio.get_running_loop()
+    silent, _ = await loop.create_datagram_endpoint(asyncio.DatagramProtocol, local_addr=("127.0.0.1", 0))
+    try:
+        host, port = silent.get_extra_info("sockname")[:2]
+        monkeypatch.setattr(rcon, "GAME_SERVER_HOST", host)
+        monkeypatch.setattr(rcon, "GAME_SERVER_PORT", port)
+        status = await rcon.get_server_status_async(timeout=0.05)
+    finally:
+        silent.close()
+    assert status == {"online": False, "players": [], "info": {}}
+
+
+def test_send_rcon_reuses_socket_and_drops_late_replies(monkeypatch):
+    server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    server.bind(("127.0.0.1", 0))
+    host, port = server.getsockname()
+    monkeypatch.setattr(rcon, "GAME_SERVER_HOST", host)
+    monkeypatch.setattr(rcon, "GAME_SERVER_PORT", port)
+    try:
+        # No reply in time: the call times out and the reply arrives late.
+        assert rcon.send_rcon("status", timeout=0.05) == ""
+        packet, client = server.recvfrom(4096)
+        assert packet.endswith(b"status")
+        server.sendto(b"\xff\xff\xff\xffprint\nlate status", client)
+
+        sock = rcon._rcon_sock
+
+        def reply():
+            _, addr = server.recvfrom(4096)
+            server.sendto(b"\xff\xff\xff\xffprint\nmap changed", addr)
+
+        responder = threading.Thread(target=reply)
+        responder.start()
+        assert rcon.send_rcon("map q3dm17", timeout=1.0) == "map changed"
+        responder.join()
+        assert rcon._rcon_sock is sock
+    finally:
+        rcon._drop_rcon_socket()
+        server.close()
+
+
+def test_send_rcon_many_sends_one_packet(monkeypatch):
+    server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    server.bind(("127.0.0.1", 0))
+    host, port = server.getsockname()
+    monkeypatch.setattr(rcon, "GAME_SERVER_HOST", host)
+    monkeypatch.setattr(rcon, "GAME_SERVER_PORT", port)
+    packets = []
+
+    def reply(*responses):
+        packet, addr = server.recvfrom(4096)
+        packets.append(packet)
+        for text in responses:
+            server.sendto(b"\xff\xff\xff\xffprint\n" + text, addr)
+
+    try:
+        # Two commands, two output datagrams: one packet out, first reply returned.
+        responder = threading.Thread(target=reply, args=(b"map loaded", b"Sarge entered"))
+        responder.start()
+        assert rcon.send_rcon_many(["map q3dm17", "addbot Sarge 3"], timeout=1.0) == "map loaded"
+        responder.join()
+        assert packets == [b"\xff\xff\xff\xffrcon " + rcon.RCON_PASSWORD.encode() + b" map q3dm17; addbot Sarge 3"]
+
+        # The trailing "Sarge entered" output is not mistaken for the next reply.
+        responder = threading.Thread(target=reply, args=(b"ok",))
+        responder.start()
+        assert rcon.send_rcon("status", timeout=1.0) == "ok"
+        responder.join()
+    finally:
+        rcon._drop_rcon_socket()
+        server.close()
+
+
+def test_send_rcon_many_rejects_command_separators():
+    with pytest.raises(ValueError):
+        rcon.send_rcon_many(["map q3dm17", "addbot Sarge; quit 3"])
@@ -0,0 +1,67 @@
+"""
+Tests for coalescing match result reports into batched writes.
+"""
+
+import asyncio
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "orchestrator"))
+
+from models import Base, MatchParticipantDB
+import report_batcher
+from report_batcher import MatchReportBatcher
+
+
+@pytest.fixture
+def session_factory():
+    # StaticPool: the batcher writes from a worker thread, so every
+    # connection must see the same in-memory database.
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("update_from", [True, False], ids=["update_from", "executemany"])
+async def test_concurrent_reports_share_one_transaction(session_factory, monkeypatch, update_from):
+    monkeypatch.setattr(report_batcher, "_supports_update_from", lambda bind: update_from)
+    db = session_factory()
+    db.add_all([MatchParticipantDB(match_id=1, bot_id=b) for b in (10, 11, 12)])
+    db.commit()
+
+    batcher = MatchReportBatcher(window=0.05)
+    calls = []
+    real_apply = report_batcher.apply_reports
+
+    def counting_apply(bind, reports):
+        calls.append(len(reports))
+        return real_apply(bind, reports)
+
+    with patch.object(report_batcher, "apply_reports", counting_apply):
+        results = await asyncio.gather(
+            batcher.submit(db, 1, 10, kills=5, deaths=1),
+            batcher.submit(db, 1, 11, kills=2, deaths=3),
+            batcher.submit(db, 1, 12, kills=0, deaths=0),
+            batcher.submit(db, 1, 99, kills=1, deaths=1),
+        )
+    await batcher.stop()
+
+    assert results == [True, True, True, False]
+    assert calls == [4]
+
+    db.expire_all()
+    rows = {p.bot_id: p for p in db.query(MatchParticipantDB).all()}
+    assert (rows[10].kills, rows[10].deaths, rows[10].score) == (5, 1, 4)
+    assert rows[11].score == -1
+    db.close()
@@ -0,0 +1,64 @@
+"""
+Tests for the in-memory StateStore backend and backend selection.
+"""
+
+import asyncio
+import os
+import sys
+import pytest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "orchestrator"))
+
+from state_store import MemoryStateStore, create_state_store
+
+
+@pytest.fixture
+def store():
+    return MemoryStateStore({}, {}, max_queue_size=2)
+
+
+class TestMemoryStateStore:
+
+    @pytest.mark.asyncio
+    async def test_state_round_trip(self, store):
+        await store.set_state(1, {"health": 50})
+        assert await store.get_state(1) == {"health": 50}
+        assert await store.get_state(2) is None
+        assert await store.get_states([1, 2]) == {1: {"health": 50}, 2: None}
+        assert await store.all_states() == {1: {"health": 50}}
+
+    @pytest.mark.asyncio
+    async def test_push_respects_queue_limit(self, store):
+        assert await store.push_action(1, {"action": "jump"})
+        assert await store.push_action(1, {"action": "attack"})
+        assert not await store.push_action(1, {"action": "crouch"})
+        assert await store.queue_length(1) == 2
+
+    @pytest.mark.asyncio
+    async def test_drain_preserves_order_and_clears(self, store):
+        await store.push_action(1, {"action": "jump"})
+        await store.push_action(1, {"action": "attack"})
+        actions = await store.drain_actions(1)
+        assert [a["action"] for a in actions] == ["jump", "attack"]
+        assert await store.drain_actions(1) == []
+
+    @pytest.mark.asyncio
+    async def test_wait_wakes_on_push(self, store):
+        waiter = asyncio.create_task(store.wait_actions(1, timeout=5))
+        await asyncio.sleep(0)
+        await store.push_action(1, {"action": "jump"})
+        actions = await asyncio.wait_for(waiter, timeout=1)
+        assert [a["action"] for a in actions] == ["jump"]
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out_empty(self, store):
+        assert await store.wait_actions(1, timeout=0.01) == []
+        assert await store.wait_actions(1, timeout=0) == []
+
+
+def test_defaults_to_memory_store():
+    with patch.dict(os.environ, {}, clear=False):
+        os.environ.pop("REDIS_URL", None)
+        store = create_state_store({}, {}, max_queue_size=8)
+    assert isinstance(store, MemoryStateStore)
@@ -120,5 +120,144 @@ class TestStrategy(unittest.TestCase):
         asyncio.run(self.loader.tick(self.bot, self.game))
         self.assertFalse(self.ctx.retreating)
 
+
+class _StrategyFileCase(unittest.TestCase):
+    """Writes a throwaway strategy file per test."""
+
+    def setUp(self):
+        import tempfile
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "reload_strategy.py")
+
+    def _write(self, source):
+        with open(self.path, "w") as f:
+            f.write(source)
+
+
+class TestStrategyReload(_StrategyFileCase):
+
+    def test_body_edit_keeps_imported_modules(self):
+        self._write("import json\nVALUE = 1\ndef helper():\n    return 'old'\n")
+        loader = StrategyLoader(self.path)
+        json_module = loader._namespace["json"]
+
+        self._write("import json\nVALUE = 2\n")
+        loader._load()
+
+        self.assertIs(loader._namespace["json"], json_module)
+        self.assertEqual(loader._namespace["VALUE"], 2)
+        self.assertNotIn("helper", loader._namespace)
+
+    def test_import_edit_triggers_full_reload(self):
+        self._write("import json\nVALUE = 1\n")
+        loader = StrategyLoader(self.path)
+        old_module = loader._module
+
+        self._write("import json\nimport math\nVALUE = math.floor(2.5)\n")
+        loader._load()
+
+        self.assertIsNot(loader._module, old_module)
+        self.assertEqual(loader._namespace["VALUE"], 2)
+
+    def test_failed_body_reload_keeps_running_strategy(self):
+        self._write("import json\ndef tick(bot, game, ctx):\n    return ['attack']\n")
+        loader = StrategyLoader(self.path)
+
+        self._write("import json\nundefined_name\ndef tick(bot, game, ctx):\n    return []\n")
+        with self.assertRaises(NameError):
+            loader._load()
+
+        self.assertEqual(asyncio.run(loader.tick(None, None)), ['attack'])
+
+
+class TestTickDeadline(_StrategyFileCase):
+
+    def test_slow_async_tick_hits_deadline(self):
+        self._write(
+            "import asyncio\n"
+            "async def tick(bot, game, ctx):\n"
+            "    await asyncio.sleep(1)\n"
+            "    return ['attack']\n"
+        )
+        loader = StrategyLoader(self.path, tick_deadline=0.01)
+        self.assertEqual(asyncio.run(loader.tick(None, None)), [])
+        self.assertEqual(loader.context.tick_timeouts, 1)
+
+    def test_slow_sync_tick_skips_until_finished(self):
+        self._write(
+            "import time\n"
+            "def tick(bot, game, ctx):\n"
+            "    time.sleep(0.1)\n"
+            "    return ['attack']\n"
+        )
+        loader = StrategyLoader(self.path, tick_deadline=0.01)
+
+        async def run():
+            first = await loader.tick(None, None)
+            second = await loader.tick(None, None)  # previous thread still busy
+            await asyncio.sleep(0.15)
+            return first, second, loader.context.tick_count
+
+        first, second, ticks = asyncio.run(run())
+        self.assertEqual(first, [])
+        self.assertEqual(second, [])
+        self.assertEqual(ticks, 1)
+        self.assertGreater(loader.context.tick_p99_ms, 0)
+
+
+class TestTickScheduling(_StrategyFileCase):
+
+    def test_sleep_ticks_skips_frames(self):
+        self._write(
+            "def tick(bot, game, ctx):\n"
+            "    ctx.sleep_ticks(3)\n"
+            "    return ['attack']\n"
+        )
+        loader = StrategyLoader(self.path)
+
+        async def run():
+            return [await loader.tick(None, None) for _ in range(8)]
+
+        results = asyncio.run(run())
+        self.assertEqual([bool(r) for r in results],
+                         [True, False, False, False, True, False, False, False])
+        self.assertEqual(loader.context.tick_count, 2)
+
+    def test_scheduler_only_ticks_due_strategies(self):
+        from bot.strategy import DEAD_TICK_INTERVAL, StrategyScheduler
+        self._write("async def tick(bot, game, ctx):\n    return ['attack']\n")
+        alive = StrategyLoader(self.path)
+        dead = StrategyLoader(self.path)
+        dead_game = Mock(my_health=0)
+
+        scheduler = StrategyScheduler()
+        scheduler.add(alive, None, Mock(my_health=100))
+        scheduler.add(dead, None, dead_game)
+
+        async def run():
+            return [await scheduler.step() for _ in range(10)]
+
+        frames = asyncio.run(run())
+        self.assertEqual(sum(alive in f for f in frames), 10)
+        self.assertEqual(sum(dead in f for f in frames), 10 // DEAD_TICK_INTERVAL)
+        self.assertEqual(len(scheduler), 2)
+
+
+class TestTickErrorLogging(_StrategyFileCase):
+
+    def test_repeated_tick_errors_are_rate_limited(self):
+        self._write("def tick(bot, game, ctx):\n    raise ValueError('boom')\n")
+        loader = StrategyLoader(self.path)
+
+        async def run():
+            for _ in range(20):
+                await loader.tick(None, None)
+
+        with self.assertLogs('clawquake.strategy', level='ERROR') as logs:
+            asyncio.run(run())
+        self.assertEqual(len(logs.records), 1)
+        self.assertIsNotNone(logs.records[0].exc_info)
+
+
 if __name__ == '__main__':
     unittest.main()
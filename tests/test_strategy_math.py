@@ -0,0 +1,38 @@
+import math
+import unittest
+
+from bot.strategy_math import aim_angles, distance, nearest_index, origin_columns
+
+
+class TestStrategyMath(unittest.TestCase):
+
+    def test_nearest_index_picks_closest(self):
+        origins = [(100, 0, 0), (10, 10, 0), (-50, -50, 5)]
+        self.assertEqual(nearest_index(origin_columns(origins), (0, 0, 0)), 1)
+
+    def test_nearest_index_first_is_closest(self):
+        origins = [(1, 1, 1), (10, 10, 0), (-50, -50, 5)]
+        self.assertEqual(nearest_index(origin_columns(origins), (0, 0, 0)), 0)
+
+    def test_nearest_index_empty(self):
+        self.assertEqual(nearest_index(origin_columns([]), (0, 0, 0)), -1)
+
+    def test_distance(self):
+        self.assertAlmostEqual(distance((0, 0, 0), (3, 4, 12)), 13.0)
+
+    def test_aim_angles(self):
+        pitch, yaw = aim_angles((0, 0, 0), (0, 100, 0))
+        self.assertAlmostEqual(yaw, 90.0)
+        self.assertAlmostEqual(pitch, 0.0)
+
+        pitch, yaw = aim_angles((0, 0, 0), (100, 0, 100))
+        self.assertAlmostEqual(yaw, 0.0)
+        self.assertAlmostEqual(pitch, -45.0)
+
+    def test_aim_angles_straight_up(self):
+        pitch, _ = aim_angles((0, 0, 0), (0, 0, 10))
+        self.assertTrue(math.isclose(pitch, -90.0, abs_tol=1e-3))
+
+
+if __name__ == '__main__':
+    unittest.main()
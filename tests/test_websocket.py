@@ -2,6 +2,8 @@
 Tests for websocket event hub.
 """
 
+import asyncio
+import json
 import os
 import sys
 
@@ -12,6 +14,12 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "orchestrator")
 from websocket_hub import WebSocketHub
 
 
+async def _flush():
+    """Let the per-client writer tasks drain their outboxes."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
 class DummyWebSocket:
     def __init__(self):
         self.accepted = False
@@ -23,6 +31,9 @@ class DummyWebSocket:
     async def send_json(self, payload):
         self.messages.append(payload)
 
+    async def send_text(self, payload):
+        self.messages.append(json.loads(payload))
+
 
 @pytest.mark.asyncio
 async def test_connect():
@@ -42,6 +53,7 @@ async def test_broadcast():
     await hub.connect(ws2)
 
     await hub.broadcast("queue_update", {"waiting_entries": 2})
+    await _flush()
 
     assert len(ws1.messages) == 1
     assert len(ws2.messages) == 1
@@ -49,6 +61,26 @@ async def test_broadcast():
     assert ws1.messages[0]["data"]["waiting_entries"] == 2
 
 
+@pytest.mark.asyncio
+async def test_broadcast_serializes_once(monkeypatch):
+    import websocket_hub as hub_module
+
+    calls = []
+    real_encode = hub_module._encode
+    monkeypatch.setattr(hub_module, "_encode", lambda m: calls.append(m) or real_encode(m))
+
+    hub = WebSocketHub()
+    clients = [DummyWebSocket() for _ in range(5)]
+    for ws in clients:
+        await hub.connect(ws)
+
+    await hub.broadcast("tick", {"events": [{"event_type": "status_update"}]})
+    await _flush()
+
+    assert len(calls) == 1
+    assert all(ws.messages[0]["data"]["events"][0]["event_type"] == "status_update" for ws in clients)
+
+
 @pytest.mark.asyncio
 async def test_disconnect():
     hub = WebSocketHub()
@@ -57,3 +89,108 @@ async def test_disconnect():
     assert hub.connection_count == 1
     await hub.disconnect(ws)
     assert hub.connection_count == 0
+
+
+@pytest.mark.asyncio
+async def test_broadcast_drops_failed_connections():
+    class FailingWebSocket(DummyWebSocket):
+        async def send_text(self, data):
+            raise RuntimeError("closed")
+
+    hub = WebSocketHub()
+    good = [DummyWebSocket() for _ in range(5)]
+    bad = FailingWebSocket()
+    for ws in good + [bad]:
+        await hub.connect(ws)
+
+    await hub.broadcast("tick", {"events": []})
+    await _flush()
+
+    assert all(len(ws.messages) == 1 for ws in good)
+    assert hub.connection_count == len(good)
+
+
+@pytest.mark.asyncio
+async def test_slow_client_does_not_block_broadcast():
+    import websocket_hub as hub_module
+
+    class StuckWebSocket(DummyWebSocket):
+        async def send_text(self, data):
+            await asyncio.Event().wait()
+
+    hub = WebSocketHub()
+    fast = DummyWebSocket()
+    stuck = StuckWebSocket()
+    await hub.connect(fast)
+    await hub.connect(stuck)
+
+    total = hub_module.CLIENT_QUEUE_SIZE + 10
+    for i in range(total):
+        await asyncio.wait_for(hub.broadcast("tick", {"n": i}), timeout=1)
+        await _flush()
+
+    assert [m["data"]["n"] for m in fast.messages] == list(range(total))
+    # The stuck client's outbox keeps only the newest frames.
+    stuck_client = hub._connections[stuck]
+    assert stuck_client.queue.qsize() == hub_module.CLIENT_QUEUE_SIZE
+    await hub.disconnect(stuck)
+
+
+@pytest.mark.asyncio
+async def test_publish_event_from_worker_thread(monkeypatch):
+    import asyncio
+    import main
+
+    queue = asyncio.Queue()
+    monkeypatch.setattr(main, "event_queue", queue)
+    monkeypatch.setattr(main, "_event_loop", asyncio.get_running_loop())
+
+    await asyncio.to_thread(main._publish_event, "kill_event", {"bot_id": 1})
+
+    event = await asyncio.wait_for(queue.get(), timeout=1)
+    assert event == ("kill_event", {"bot_id": 1})
+
+
+def _manager_with_active_match():
+    from unittest.mock import MagicMock
+    from process_manager import BotProcess, BotProcessManager, MatchProcessGroup
+
+    pm = BotProcessManager(agent_runner_path="/fake/runner.py")
+    process = MagicMock()
+    process.poll.return_value = None
+    pm._matches[1] = MatchProcessGroup(
+        match_id=1,
+        bot_processes={10: BotProcess(match_id=1, bot_id=10, bot_name="Bot", process=process)},
+    )
+    return pm
+
+
+@pytest.mark.asyncio
+async def test_publish_loop_ticks_with_active_match(monkeypatch):
+    """Bot-id keyed match statuses must not kill the publisher task."""
+    import main
+
+    pm = _manager_with_active_match()
+    hub = WebSocketHub()
+    ws = DummyWebSocket()
+    await hub.connect(ws)
+    monkeypatch.setattr(main, "websocket_hub", hub)
+    monkeypatch.setattr(main, "event_queue", asyncio.Queue())
+    monkeypatch.setattr(main, "status_cache", main._PayloadCache(lambda: {"online": False}, ttl=60))
+    monkeypatch.setattr(main, "queue_cache", main._PayloadCache(
+        lambda: {"active_matches": pm.active_matches()}, ttl=60,
+    ))
+
+    task = asyncio.create_task(main._websocket_publish_loop())
+    try:
+        for _ in range(100):
+            if ws.messages:
+                break
+            await asyncio.sleep(0.01)
+        assert not task.done()
+    finally:
+        task.cancel()
+
+    events = {e["event_type"]: e["data"] for e in ws.messages[0]["data"]["events"]}
+    assert events["queue_update"]["active_matches"][0]["bots"]["10"]["finished"] is False
+    assert events["match_delta"]["started"] == [1]
@@ -62,7 +62,7 @@ class TestFallbackHTTP:
         bot = create_test_bot(db, owner_id=user.id)
 
         # No state yet
-        result = ai_agent_interface._observe_for_bot(bot.id)
+        result = ai_agent_interface._observe_for_bot(bot.id, LATEST_STATES.get(bot.id))
         assert result["status"] == "waiting_for_connection"
 
     def test_observe_returns_latest_state(self, db):
@@ -72,7 +72,7 @@ class TestFallbackHTTP:
         bot = create_test_bot(db, owner_id=user.id)
         LATEST_STATES[bot.id] = {"health": 100, "position": [1, 2, 3]}
 
-        result = ai_agent_interface._observe_for_bot(bot.id)
+        result = ai_agent_interface._observe_for_bot(bot.id, LATEST_STATES.get(bot.id))
         assert result["health"] == 100
 
     def test_act_queues_action(self, db):
@@ -105,6 +105,76 @@ class TestFallbackHTTP:
         assert LATEST_STATES[bot.id]["health"] == 85
 
 
+# ── Internal state push / action long-poll tests ─────────────────
+
+def _internal_client():
+    from fastapi import FastAPI
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+class TestInternalLongPoll:
+    HEADERS = {"X-Internal-Secret": "test-internal-secret"}
+
+    def test_state_push_stores_state(self):
+        with patch.dict(os.environ, {"INTERNAL_SECRET": "test-internal-secret"}):
+            client = _internal_client()
+            resp = client.post(
+                "/api/agent/internal/state",
+                json={"bot_id": 7, "state": {"health": 90}},
+                headers=self.HEADERS,
+            )
+        assert resp.status_code == 200
+        assert LATEST_STATES[7]["health"] == 90
+
+    def test_long_poll_returns_queued_actions(self):
+        with patch.dict(os.environ, {"INTERNAL_SECRET": "test-internal-secret"}):
+            client = _internal_client()
+            assert asyncio.run(ai_agent_interface._enqueue_action(7, "jump"))
+            assert asyncio.run(ai_agent_interface._enqueue_action(7, "attack"))
+            resp = client.get("/api/agent/internal/actions/7?timeout=1", headers=self.HEADERS)
+        assert resp.status_code == 200
+        assert [a["action"] for a in resp.json()["actions"]] == ["jump", "attack"]
+
+    def test_long_poll_empty_on_timeout(self):
+        with patch.dict(os.environ, {"INTERNAL_SECRET": "test-internal-secret"}):
+            client = _internal_client()
+            resp = client.get("/api/agent/internal/actions/7?timeout=0", headers=self.HEADERS)
+        assert resp.status_code == 200
+        assert resp.json()["actions"] == []
+
+    def test_long_poll_rejects_bad_secret(self):
+        with patch.dict(os.environ, {"INTERNAL_SECRET": "test-internal-secret"}):
+            client = _internal_client()
+            resp = client.get("/api/agent/internal/actions/7?timeout=0",
+                              headers={"X-Internal-Secret": "wrong"})
+        assert resp.status_code == 403
+
+    def test_state_push_stores_raw_dict(self):
+        client = _internal_client()
+        state = {"health": 90, "custom_field": [1, 2], "weapon": None}
+        resp = client.post("/api/agent/internal/state",
+                           json={"bot_id": 8, "state": state}, headers=self.HEADERS)
+        assert resp.status_code == 200
+        assert LATEST_STATES[8] == state
+
+    def test_state_push_rejects_malformed_update(self):
+        client = _internal_client()
+        resp = client.post("/api/agent/internal/state",
+                           json={"bot_id": "8", "state": {}}, headers=self.HEADERS)
+        assert resp.status_code == 422
+        resp = client.post("/api/agent/internal/state", content=b"{not json",
+                           headers=self.HEADERS)
+        assert resp.status_code == 400
+
+    def test_bad_secret_rejected_before_body_validation(self):
+        client = _internal_client()
+        resp = client.post("/api/agent/internal/sync", json={"not": "a runner update"},
+                           headers={"X-Internal-Secret": "wrong"})
+        assert resp.status_code == 403
+
+
 # ── Action validation tests ──────────────────────────────────────
 
 class TestActionValidation:
@@ -71,11 +71,13 @@ class TournamentBracket:
             
         # 1. Seeding
         if seed_by_elo:
-            # Fetch bot ELOs
-            bots = []
-            for p in participants:
-                bot = self.db.query(BotDB).filter_by(id=p.bot_id).first()
-                bots.append((p, bot.elo if bot else 1000.0))
+            # Fetch bot ELOs in one query
+            elos = dict(
+                self.db.query(BotDB.id, BotDB.elo)
+                .filter(BotDB.id.in_([p.bot_id for p in participants]))
+                .all()
+            )
+            bots = [(p, elos.get(p.bot_id, 1000.0)) for p in participants]
             
             # Sort high ELO first (seed 1)
             bots.sort(key=lambda x: x[1], reverse=True)
@@ -101,7 +103,8 @@ class TournamentBracket:
         # Standard seed pairing: 1 vs N, 2 vs N-1, etc.
         pairings = self._generate_pairings(ordered_participants, bracket_size)
         
-        # Create Round 1 matches
+        # Create Round 1 matches (inserted together on commit)
+        round_one = []
         bye_advancements = []
         for i, (p1, p2) in enumerate(pairings):
             match = TournamentMatchDB(
@@ -119,9 +122,9 @@ class TournamentBracket:
             elif not p1 and p2: # Should not happen with standard seeding
                 match.winner_bot_id = p2.bot_id
                 bye_advancements.append((match, p2.bot_id))
-                
-            self.db.add(match)
-            
+            round_one.append(match)
+
+        self.db.add_all(round_one)
         t.status = "active"
         t.started_at = datetime.utcnow()
         t.current_round = 1
@@ -180,19 +183,20 @@ class TournamentBracket:
         
         while current_matches > 1:
             current_matches //= 2
-            new_matches = []
-            for i in range(current_matches):
-                m = TournamentMatchDB(
+            new_matches = [
+                TournamentMatchDB(
                     tournament_id=tournament_id,
                     round_num=round_num,
                     match_num=i + 1,
                     player1_bot_id=None,
                     player2_bot_id=None
                 )
-                self.db.add(m)
-                self.db.flush() # Need ID
-                new_matches.append(m)
-                
+                for i in range(current_matches)
+            ]
+            self.db.add_all(new_matches)
+            self.db.flush()  # One INSERT batch per round; assigns the IDs linked below
+
+            for i, m in enumerate(new_matches):
                 # Link previous matches to this one
                 # Previous match 2*i and 2*i+1 feed into this match
                 if len(prev_matches) > 2*i: